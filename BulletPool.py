@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Bullet Pool for ChromeBlaze
+固定容量の弾丸プール（配列ベース）
+"""
+
+import pyxel
+import numpy as np
+from SpriteManager import sprite_manager, animation_clock
+
+
+class BulletPool:
+    """
+    弾丸を事前確保した配列で管理する固定容量プール
+
+    生存中の弾丸は常に先頭の [0, count) スロットに詰めて配置する。
+    発射は末尾の空きスロットを確保し、消滅したスロットは最後尾の弾丸と入れ替えて解放する
+    （swap-remove）。定常状態の発射・更新・描画ではオブジェクトを生成しない。
+    """
+
+    # 弾丸の共通設定
+    WIDTH = 8
+    HEIGHT = 8
+    DEFAULT_SPEED = 3
+    OFFSCREEN_Y = -8  # これより上に出たら消滅
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.count = 0  # 生存中の弾丸数
+
+        # 弾丸データ（struct-of-arrays）
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+
+        # 消滅判定用の作業バッファ
+        self._expired = np.zeros(capacity, dtype=bool)
+
+        # 事前コンパイル済みアニメーションクリップ
+        self.clip = sprite_manager.get_animation_clip("PBULLET")
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, speed=DEFAULT_SPEED):
+        """
+        空きスロットを確保して弾丸を1発追加する
+
+        Returns:
+            int: 確保したスロット番号（満杯の場合はNone）
+        """
+        slot = self.count
+        if slot >= self.capacity:
+            return None
+        self.x[slot] = x
+        self.y[slot] = y
+        self.speed[slot] = speed
+        self.count = slot + 1
+        return slot
+
+    def release(self, slot):
+        """スロットを解放（最後尾の弾丸を移動して詰める）"""
+        last = self.count - 1
+        if slot < 0 or slot > last:
+            return
+        if slot != last:
+            self.x[slot] = self.x[last]
+            self.y[slot] = self.y[last]
+            self.speed[slot] = self.speed[last]
+        self.count = last
+
+    def release_many(self, slots):
+        """複数スロットを解放（番号の大きい順に処理して入れ替えの影響を避ける）"""
+        for slot in sorted(slots, reverse=True):
+            self.release(slot)
+
+    def clear(self):
+        """全弾丸を消去"""
+        self.count = 0
+
+    def update(self):
+        """全弾丸を移動し、画面上部を超えた弾丸を解放する"""
+        count = self.count
+        if count == 0:
+            return
+
+        y = self.y[:count]
+        y -= self.speed[:count]
+
+        # 画面上部を超えたら削除
+        expired = self._expired[:count]
+        np.less(y, self.OFFSCREEN_Y, out=expired)
+        if expired.any():
+            for slot in range(count - 1, -1, -1):
+                if expired[slot]:
+                    self.release(slot)
+
+    def draw(self, canvas=pyxel):
+        """生存中の弾丸を描画（共有クロックのコマを使用、canvasはpyxelまたはRenderQueueのレイヤー）"""
+        count = self.count
+        if count == 0:
+            return
+        sprite = self.clip.frame_at(animation_clock.frame)
+        x = self.x
+        y = self.y
+        for slot in range(count):
+            canvas.blt(x[slot], y[slot], 0, sprite.x, sprite.y,
+                      self.WIDTH, self.HEIGHT, pyxel.COLOR_BLACK)
@@ -5,6 +5,7 @@ LaserConfig - Laser System Configuration for ChromeBlaze
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass
 class LaserConfig:
@@ -34,6 +35,12 @@ class LaserConfig:
     no_progress_threshold: float = -0.5    # 進歩なし判定閾値（ピクセル）
     circling_threshold: float = -0.1       # 周回判定閾値（平均距離変化）
     
+    # === テレメトリー設定 ===
+    telemetry_enabled: Optional[bool] = None  # Noneの場合はDEBUGフラグに従う
+    telemetry_sample_every: int = 1           # Nフレームに1回だけ記録
+    telemetry_keep_first: int = 0             # 先頭Kフレームのみ保持（0で制限なし）
+    telemetry_keep_last: int = 0              # 末尾Kフレームのみ保持（0で制限なし）
+    
     def get_physics_config(self) -> dict:
         """物理演算関連の設定を辞書で返す"""
         return {
@@ -71,6 +78,15 @@ class LaserConfig:
             'no_progress_threshold': self.no_progress_threshold,
             'circling_threshold': self.circling_threshold
         }
+    
+    def get_telemetry_config(self) -> dict:
+        """テレメトリー関連の設定を辞書で返す"""
+        return {
+            'telemetry_enabled': self.telemetry_enabled,
+            'telemetry_sample_every': self.telemetry_sample_every,
+            'telemetry_keep_first': self.telemetry_keep_first,
+            'telemetry_keep_last': self.telemetry_keep_last
+        }
 
 # === 設定プロファイル ===
 class LaserProfiles:
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+LaserSwarm - Batched Homing Laser Engine for ChromeBlaze
+ホーミングレーザー一括処理エンジン (struct-of-arrays + NumPy版)
+"""
+
+import pyxel
+import math
+import heapq
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from Common import SCREEN_WIDTH, SCREEN_HEIGHT
+from .LaserConfig import LaserConfig, default_laser_config
+from .LaserTelemetry import NULL_TELEMETRY, create_laser_telemetry
+
+# ターゲットIDなしを示す値
+NO_TARGET = -1
+
+TWO_PI = 2.0 * math.pi
+
+
+class LaserSwarm:
+    """
+    全レーザーを配列で保持し、1回のNumPy演算でまとめて更新するエンジン
+
+    LaserType01と同じ誘導アルゴリズム（距離依存の旋回速度・角度制限・段階的減速）を
+    レーザー1本ずつではなく全スロットに対して一括で適用する。
+    テレメトリーはスロットごとに持ち（LaserConfigのtelemetry_*設定に従う）、
+    ヒット・画面外・コリジョン命中でスロットが終わった時点で分析結果を出力する。
+    """
+
+    # クラス定数（LaserType01と同じ値）
+    OUT_OF_BOUNDS_THRESHOLD = 30  # 画面外判定の閾値
+    MIN_TRAIL_LENGTH = 2          # 軌跡描画の最小長さ
+
+    def __init__(self, capacity: int = 256, config: LaserConfig = None):
+        """
+        レーザースウォームの初期化
+
+        Args:
+            capacity: 同時に存在できるレーザーの最大数
+            config: レーザー設定（Noneの場合はデフォルト設定）
+        """
+        if config is None:
+            config = default_laser_config
+        self.config = config
+        self.capacity = capacity
+
+        # 位置・方向・速度
+        self.pos_x = np.zeros(capacity, dtype=np.float64)
+        self.pos_y = np.zeros(capacity, dtype=np.float64)
+        self.dir_x = np.zeros(capacity, dtype=np.float64)
+        self.dir_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+
+        # ターゲット情報（target_alive=Falseのスロットは最後の目標地点へ直進）
+        self.target_id = np.full(capacity, NO_TARGET, dtype=np.int64)
+        self.target_x = np.zeros(capacity, dtype=np.float64)
+        self.target_y = np.zeros(capacity, dtype=np.float64)
+        self.target_alive = np.zeros(capacity, dtype=bool)
+
+        # 直前の更新で計算したターゲットまでの距離
+        self.distance = np.zeros(capacity, dtype=np.float64)
+
+        # アクティブ状態
+        self.active = np.zeros(capacity, dtype=bool)
+        # 空きスロット（最小ヒープ、常に番号の若いスロットから使う）
+        self._free_slots = list(range(capacity))
+
+        # 軌跡（スロットごとのリングバッファ）
+        self.trail_capacity = config.max_trail_length
+        self.trail = np.zeros((capacity, self.trail_capacity, 2), dtype=np.float64)
+        self.trail_head = np.zeros(capacity, dtype=np.int64)   # 次に書き込む位置
+        self.trail_count = np.zeros(capacity, dtype=np.int64)  # 有効な点の数
+
+        # テレメトリー（スロットごと、無効時は共有ヌルオブジェクト）
+        self.telemetry = [NULL_TELEMETRY] * capacity
+        self.frame_count = np.zeros(capacity, dtype=np.int64)  # 発射からの更新回数
+        self._telemetry_slots = set()  # テレメトリーが有効なスロット
+
+    # === 発射・状態取得 ===
+
+    def spawn(self, start_x, start_y, target_x, target_y, target_enemy_id=None):
+        """
+        空きスロットにレーザーを1本発射する
+
+        Returns:
+            int: 使用したスロット番号（空きがない場合はNone）
+        """
+        if not self._free_slots:
+            return None
+        slot = heapq.heappop(self._free_slots)
+
+        self.pos_x[slot] = start_x
+        self.pos_y[slot] = start_y
+        self.dir_x[slot], self.dir_y[slot] = self._initial_direction(start_x)
+        self.speed[slot] = self.config.initial_speed
+
+        self.target_id[slot] = NO_TARGET if target_enemy_id is None else target_enemy_id
+        self.target_x[slot] = target_x
+        self.target_y[slot] = target_y
+        self.target_alive[slot] = target_enemy_id is not None
+        self.distance[slot] = 0.0
+
+        self.trail[slot, 0, 0] = start_x
+        self.trail[slot, 0, 1] = start_y
+        self.trail_head[slot] = 1 % self.trail_capacity
+        self.trail_count[slot] = 1
+
+        self.frame_count[slot] = 0
+        telemetry = create_laser_telemetry(
+            self.config.telemetry_enabled,
+            self.config.telemetry_sample_every,
+            self.config.telemetry_keep_first,
+            self.config.telemetry_keep_last)
+        self.telemetry[slot] = telemetry
+        if telemetry.enabled:
+            self._telemetry_slots.add(slot)
+
+        self.active[slot] = True
+        return slot
+
+    def _initial_direction(self, start_x):
+        """初期方向をプレイヤー位置に基づいて設定（LaserType01と同じ規則）"""
+        screen_center_x = SCREEN_WIDTH // 2
+        if start_x > screen_center_x:
+            return 1.0, 0.0
+        elif start_x < screen_center_x:
+            return -1.0, 0.0
+        return 0.0, -1.0
+
+    def active_slots(self):
+        """アクティブなスロット番号の配列を取得"""
+        return np.flatnonzero(self.active)
+
+    def active_count(self) -> int:
+        """アクティブなレーザー数を取得"""
+        return self.capacity - len(self._free_slots)
+
+    def set_target(self, slot, target_x, target_y):
+        """追尾中のターゲット位置を更新"""
+        self.target_x[slot] = target_x
+        self.target_y[slot] = target_y
+        self.target_alive[slot] = True
+
+    def lose_target(self, slot):
+        """ターゲットを見失ったスロットを直進モードにする（最後の目標地点へ飛ぶ）"""
+        self.target_alive[slot] = False
+
+    def clear(self):
+        """全レーザーを消去"""
+        self.active[:] = False
+        self._free_slots = list(range(self.capacity))
+        self.target_alive[:] = False
+        self.trail_count[:] = 0
+        for slot in self._telemetry_slots:
+            self.telemetry[slot] = NULL_TELEMETRY
+        self._telemetry_slots.clear()
+
+    # === 一括更新 ===
+
+    def update(self, delta_time):
+        """
+        全アクティブレーザーを1ステップ進める
+
+        LaserType01.update と同じ順序で処理する:
+        ホーミング方向計算 → 減速 → 位置更新 → 軌跡更新 → ヒット/画面外判定
+
+        Returns:
+            np.ndarray: 距離判定でヒットしたスロット番号の配列
+        """
+        idx = np.flatnonzero(self.active)
+        if len(idx) == 0:
+            return idx
+
+        config = self.config
+        px = self.pos_x[idx]
+        py = self.pos_y[idx]
+        dx = self.dir_x[idx]
+        dy = self.dir_y[idx]
+
+        # ターゲットへのベクトルと距離を計算
+        to_x = self.target_x[idx] - px
+        to_y = self.target_y[idx] - py
+        distance = np.hypot(to_x, to_y)
+
+        # 距離に基づいて旋回速度を調整（近づくほど急旋回）
+        ratio = np.clip(1.0 - distance / config.transition_distance, 0.0, None)
+        turn_speed = np.where(
+            distance < config.transition_distance,
+            config.turn_speed_slow + (config.turn_speed_fast - config.turn_speed_slow) * ratio,
+            config.turn_speed_slow)
+
+        # 現在の方向とターゲット方向の角度差を-π～πで計算し、角度制限を適用
+        current_angle = np.arctan2(dy, dx)
+        angle_diff = np.arctan2(to_y, to_x) - current_angle
+        angle_diff = (angle_diff + math.pi) % TWO_PI - math.pi
+        max_turn = turn_speed * delta_time
+        angle_diff = np.clip(angle_diff, -max_turn, max_turn)
+
+        # 距離0のレーザーは方向を変えない
+        steering = distance > 0
+        new_angle = current_angle + angle_diff
+        dx = np.where(steering, np.cos(new_angle), dx)
+        dy = np.where(steering, np.sin(new_angle), dy)
+
+        # 速度減速処理
+        speed = self.speed[idx]
+        speed = np.where(speed > config.min_speed,
+                         np.maximum(speed - config.speed_decay, config.min_speed),
+                         speed)
+
+        # 位置更新
+        px = px + dx * speed * delta_time
+        py = py + dy * speed * delta_time
+
+        self.pos_x[idx] = px
+        self.pos_y[idx] = py
+        self.dir_x[idx] = dx
+        self.dir_y[idx] = dy
+        self.speed[idx] = speed
+        self.distance[idx] = distance
+
+        # 軌跡の更新（リングバッファに書き込み）
+        head = self.trail_head[idx]
+        self.trail[idx, head, 0] = px
+        self.trail[idx, head, 1] = py
+        self.trail_head[idx] = (head + 1) % self.trail_capacity
+        self.trail_count[idx] = np.minimum(self.trail_count[idx] + 1, self.trail_capacity)
+
+        # ターゲットに近づいたらヒット（100%命中保証）
+        hit = distance < config.hit_threshold
+
+        # 画面外チェック
+        margin = self.OUT_OF_BOUNDS_THRESHOLD
+        out_of_bounds = ((px < -margin) | (px > SCREEN_WIDTH + margin) |
+                         (py < -margin) | (py > SCREEN_HEIGHT + margin))
+
+        # テレメトリー（有効なスロットがある場合のみ）
+        if self._telemetry_slots:
+            self._record_telemetry(idx, distance, hit, out_of_bounds)
+        self.frame_count[idx] += 1
+
+        self._release(idx[hit | out_of_bounds])
+        return idx[hit]
+
+    def _record_telemetry(self, idx, distance, hit, out_of_bounds):
+        """テレメトリーが有効なスロットのフレームを記録し、終了したスロットの分析結果を出力"""
+        hit_threshold = self.config.hit_threshold
+        for i, slot in enumerate(idx.tolist()):
+            if slot not in self._telemetry_slots:
+                continue
+            telemetry = self.telemetry[slot]
+            frame_count = int(self.frame_count[slot])
+            if telemetry.wants_frame(frame_count):
+                telemetry.record_frame(frame_count, {
+                    'laser_pos': (round(float(self.pos_x[slot]), 1), round(float(self.pos_y[slot]), 1)),
+                    'distance': round(float(distance[i]), 1),
+                    'current_speed': float(self.speed[slot]),
+                })
+            if hit[i]:
+                details = f"Update distance hit - Distance: {distance[i]:.2f} < threshold: {hit_threshold}"
+                self._finish_telemetry(slot, "DISTANCE_HIT", details, "HIT")
+            elif out_of_bounds[i]:
+                details = f"Final pos: ({self.pos_x[slot]:.2f}, {self.pos_y[slot]:.2f})"
+                self._finish_telemetry(slot, "OUT_OF_BOUNDS", details, "OUT_OF_BOUNDS")
+
+    def _finish_telemetry(self, slot, end_reason, details, summary_reason=None):
+        """スロットのテレメトリーを出力して外す（LaserType01と同じ終了理由）"""
+        if slot not in self._telemetry_slots:
+            return
+        telemetry = self.telemetry[slot]
+        target_id = int(self.target_id[slot])
+        telemetry.export_homing_analysis(None if target_id == NO_TARGET else target_id, end_reason, details)
+        if summary_reason is not None:
+            telemetry.export_debug_summary(summary_reason)
+        self.telemetry[slot] = NULL_TELEMETRY
+        self._telemetry_slots.discard(slot)
+
+    def collide(self):
+        """
+        生存ターゲットとの距離判定（100%命中保証）
+
+        同じターゲットを狙う複数レーザーが同一フレームで命中した場合は、
+        スロット番号の若い1本だけを命中扱いにする（LaserType01の逐次処理と同じ結果）。
+
+        Returns:
+            np.ndarray: 命中したスロット番号の配列（非アクティブ化済み）
+        """
+        idx = np.flatnonzero(self.active & self.target_alive)
+        if len(idx) == 0:
+            return idx
+
+        to_x = self.target_x[idx] - self.pos_x[idx]
+        to_y = self.target_y[idx] - self.pos_y[idx]
+        threshold = self.config.collision_threshold
+        hit_idx = idx[to_x * to_x + to_y * to_y <= threshold * threshold]
+        if len(hit_idx) == 0:
+            return hit_idx
+
+        # ターゲットごとに最初の1本だけ採用
+        _, first = np.unique(self.target_id[hit_idx], return_index=True)
+        hit_idx = hit_idx[np.sort(first)]
+
+        self._release(hit_idx)
+        if self._telemetry_slots:
+            for slot in hit_idx.tolist():
+                distance = math.hypot(self.target_x[slot] - self.pos_x[slot],
+                                      self.target_y[slot] - self.pos_y[slot])
+                details = f"Distance hit - Distance: {distance:.2f}, Threshold: {threshold:.2f}"
+                self._finish_telemetry(slot, "COLLISION_HIT", details)
+        return hit_idx
+
+    def _release(self, slots):
+        """スロットを非アクティブ化して空きスロットに戻す"""
+        self.active[slots] = False
+        free_slots = self._free_slots
+        for slot in slots.tolist():
+            heapq.heappush(free_slots, slot)
+
+    # === 描画 ===
+
+    def draw(self, canvas=pyxel):
+        """全アクティブレーザーの軌跡を描画（canvasはpyxelまたはRenderQueueのレイヤー）"""
+        capacity = self.trail_capacity
+        for slot in np.flatnonzero(self.active):
+            count = int(self.trail_count[slot])
+            if count < self.MIN_TRAIL_LENGTH:
+                continue
+
+            # リングバッファを古い順に辿って線を描画（コピーなし）
+            trail = self.trail[slot]
+            index = (int(self.trail_head[slot]) - count) % capacity
+            prev_x = trail[index, 0]
+            prev_y = trail[index, 1]
+            for _ in range(count - 1):
+                index += 1
+                if index == capacity:
+                    index = 0
+                x = trail[index, 0]
+                y = trail[index, 1]
+                canvas.line(int(prev_x), int(prev_y), int(x), int(y), pyxel.COLOR_CYAN)
+                prev_x, prev_y = x, y
@@ -5,25 +5,38 @@ LaserTelemetry - Debug and Telemetry System for ChromeBlaze
 """
 
 import datetime
+from collections import deque
 from typing import Dict, List, Any, Optional
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from Common import DEBUG
+from EventLog import event_log
 
 
 class LaserTelemetry:
     """レーザーのデバッグ・テレメトリー管理クラス"""
     
-    def __init__(self, enabled: bool = None):
+    def __init__(self, enabled: bool = None, sample_every: int = 1,
+                 keep_first: int = 0, keep_last: int = 0):
         """
         テレメトリーシステムの初期化
         
         Args:
             enabled: テレメトリーの有効/無効（Noneの場合はDEBUGフラグを使用）
+            sample_every: Nフレームに1回だけ記録する（1で毎フレーム）
+            keep_first: 先頭Kフレームのみ保持（0で制限なし）
+            keep_last: 末尾Kフレームのみ保持（0で制限なし）
         """
         self.enabled = enabled if enabled is not None else DEBUG
+        self.sample_every = max(1, sample_every)
+        self.keep_first = keep_first
+        self.keep_last = keep_last
+        
+        # keep_first/keep_last指定時は frame_data に先頭K件、tail_frames に末尾K件を保持
         self.frame_data: List[Dict[str, Any]] = []
+        self.tail_frames = deque(maxlen=keep_last) if keep_last > 0 else None
+        self.recorded_frame_count = 0  # 記録したフレームの総数（破棄分を含む）
         self.debug_log: List[Dict[str, Any]] = [] if self.enabled else None
         
         # 分析用データ
@@ -37,9 +50,13 @@ class LaserTelemetry:
         self.no_progress_threshold = -0.5
         self.circling_threshold = -0.1
     
+    def wants_frame(self, frame_count: int) -> bool:
+        """このフレームを記録対象とするか（サンプリング判定）"""
+        return self.enabled and frame_count % self.sample_every == 0
+    
     def record_frame(self, frame_count: int, laser_data: Dict[str, Any]):
         """フレームデータを記録"""
-        if not self.enabled:
+        if not self.wants_frame(frame_count):
             return
         
         distance = laser_data.get('distance', 0)
@@ -66,9 +83,25 @@ class LaserTelemetry:
             'no_progress_count': self.distance_not_decreasing_count
         }
         
-        self.frame_data.append(frame_data)
+        self._store_frame(frame_data)
         self.last_distance = distance
     
+    def _store_frame(self, frame_data: Dict[str, Any]):
+        """保持ポリシー（先頭K件/末尾K件）に従ってフレームデータを保存"""
+        self.recorded_frame_count += 1
+        if self.keep_first <= 0 and self.tail_frames is None:
+            self.frame_data.append(frame_data)
+        elif len(self.frame_data) < self.keep_first:
+            self.frame_data.append(frame_data)
+        elif self.tail_frames is not None:
+            self.tail_frames.append(frame_data)
+    
+    def get_frames(self) -> List[Dict[str, Any]]:
+        """保持しているフレームデータを時系列順で取得"""
+        if self.tail_frames is None:
+            return self.frame_data
+        return self.frame_data + list(self.tail_frames)
+    
     def record_debug_event(self, frame_count: int, event_type: str, data: Dict[str, Any]):
         """デバッグイベントを記録"""
         if not self.enabled or self.debug_log is None:
@@ -107,122 +140,80 @@ class LaserTelemetry:
         avg_distance_change = sum(self.circling_detection[-5:]) / 5
         return avg_distance_change > self.circling_threshold
     
-    def export_homing_analysis(self, filename: str, laser_id: Optional[str], end_reason: str, details: str = ""):
-        """ホーミング分析レポートをエクスポート"""
-        if not self.enabled or not self.frame_data:
+    def export_homing_analysis(self, laser_id: Optional[str], end_reason: str, details: str = ""):
+        """ホーミング分析結果を構造化イベント（LASER / homing_analysis）として出力"""
+        frames = self.get_frames()
+        if not self.enabled or not frames:
             return
         
-        # debug_log/ディレクトリ配下に出力するパスを構築
-        import os
-        debug_dir = "debug_log"
-        os.makedirs(debug_dir, exist_ok=True)
-        filepath = os.path.join(debug_dir, filename)
+        analysis = {
+            'target_enemy_id': laser_id,
+            'end_reason': end_reason,
+            'details': details,
+            'total_frames': self.recorded_frame_count,
+            'min_distance': round(self.min_distance_achieved, 2),
+            'no_progress_frames': self.distance_not_decreasing_count,
+        }
+        
+        # 周回検出分析
+        if len(self.circling_detection) >= 5:
+            analysis['avg_distance_change'] = round(sum(self.circling_detection[-5:]) / 5, 3)
+            analysis['circling'] = self.is_circling()
+        
+        # 開始・終了位置
+        start_data = frames[0]
+        end_data = frames[-1]
+        analysis['start_position'] = start_data['laser_pos']
+        analysis['end_position'] = end_data['laser_pos']
+        analysis['start_target'] = start_data['target_pos']
+        analysis['end_target'] = end_data['target_pos']
+        analysis['start_distance'] = start_data['distance']
+        analysis['end_distance'] = end_data['distance']
         
-        try:
-            with open(filepath, "a", encoding="utf-8") as f:
-                timestamp = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]
-                
-                f.write(f"\n=== LASER ANALYSIS [{timestamp}] ===\n")
-                f.write(f"Target Enemy ID: {laser_id}\n")
-                f.write(f"End Reason: {end_reason}\n")
-                f.write(f"Details: {details}\n")
-                f.write(f"Total Frames: {len(self.frame_data)}\n")
-                f.write(f"Minimum Distance Achieved: {self.min_distance_achieved:.2f}px\n")
-                
-                # 周回検出分析
-                if len(self.circling_detection) >= 5:
-                    avg_distance_change = sum(self.circling_detection[-5:]) / 5
-                    f.write(f"Average Distance Change (last 5 frames): {avg_distance_change:.3f}px\n")
-                    
-                    if self.is_circling():
-                        f.write("*** POTENTIAL CIRCLING DETECTED ***\n")
-                
-                f.write(f"Frames with No Progress: {self.distance_not_decreasing_count}\n")
-                
-                # 開始・終了位置
-                if len(self.frame_data) > 0:
-                    start_data = self.frame_data[0]
-                    end_data = self.frame_data[-1]
-                    
-                    f.write(f"Start Position: {start_data['laser_pos']}\n")
-                    f.write(f"End Position: {end_data['laser_pos']}\n")
-                    f.write(f"Start Target: {start_data['target_pos']}\n")
-                    f.write(f"End Target: {end_data['target_pos']}\n")
-                    f.write(f"Start Distance: {start_data['distance']:.2f}px\n")
-                    f.write(f"End Distance: {end_data['distance']:.2f}px\n")
-                
-                # 問題判定
-                self._write_analysis_summary(f, end_reason)
-                
-                # 詳細なフレームデータ
-                self._write_detailed_frame_data(f)
-                
-                f.write("\n")
-                
-        except Exception as e:
-            print(f"Homing log write error: {e}")
+        # 問題判定と保持している全フレームデータ
+        analysis['issues'] = self._analysis_issues(end_reason)
+        analysis['frames'] = list(frames)  # 書き込みスレッドへ渡すため、記録中のリストとは切り離す
+        
+        event_log.emit("LASER", "homing_analysis", **analysis)
     
-    def _write_analysis_summary(self, file, end_reason: str):
-        """分析サマリーを書き出し"""
+    def _analysis_issues(self, end_reason: str) -> List[str]:
+        """命中しなかったレーザーの問題点を列挙"""
         if end_reason in ["HIT", "COLLISION_HIT"]:
-            return
+            return []
         
-        file.write("\n*** ANALYSIS ***\n")
+        issues = []
         
         # 設定値は外部から注入される想定
         hit_threshold = 10.0  # デフォルト値
         
         if self.min_distance_achieved < hit_threshold * 1.5:
-            file.write(f"- Got close ({self.min_distance_achieved:.2f}px) but failed to hit\n")
-            file.write(f"- Possible threshold issue or collision detection problem\n")
+            issues.append(f"Got close ({self.min_distance_achieved:.2f}px) but failed to hit - "
+                          "possible threshold issue or collision detection problem")
         
         if self.distance_not_decreasing_count > 30:
-            file.write(f"- Spent {self.distance_not_decreasing_count} frames not getting closer\n")
-            file.write(f"- Likely circling or overshooting target\n")
+            issues.append(f"Spent {self.distance_not_decreasing_count} frames not getting closer - "
+                          "likely circling or overshooting target")
         
         if end_reason == "OUT_OF_BOUNDS":
-            file.write(f"- Laser went out of bounds - possible overshoot or lost target\n")
-    
-    def _write_detailed_frame_data(self, file):
-        """詳細なフレームデータを書き出し"""
-        file.write(f"\n--- DETAILED FRAME DATA ---\n")
-        file.write(f"Frame | Laser Pos      | Target Pos     | Dist  | Dir Change | Progress\n")
-        file.write(f"------|----------------|----------------|-------|------------|----------\n")
-        
-        # 最初の5フレーム
-        for data in self.frame_data[:5]:
-            file.write(f"{data['frame']:5d} | {str(data['laser_pos']):14s} | {str(data['target_pos']):14s} | {data['distance']:5.1f} | {data['turn_speed']:6.3f} | {data['distance_change']:+7.2f}\n")
-        
-        if len(self.frame_data) > 10:
-            file.write("  ... (middle frames omitted) ...\n")
+            issues.append("Laser went out of bounds - possible overshoot or lost target")
         
-        # 最後の5フレーム
-        for data in self.frame_data[-5:]:
-            file.write(f"{data['frame']:5d} | {str(data['laser_pos']):14s} | {str(data['target_pos']):14s} | {data['distance']:5.1f} | {data['turn_speed']:6.3f} | {data['distance_change']:+7.2f}\n")
+        return issues
     
-    def export_debug_summary(self, filename: str, end_reason: str):
-        """デバッグサマリーをエクスポート"""
+    def export_debug_summary(self, end_reason: str):
+        """デバッグサマリーを構造化イベント（LASER / laser_summary）として出力"""
         if not self.enabled or self.debug_log is None:
             return
         
-        # debug_log/ディレクトリ配下に出力するパスを構築
-        import os
-        debug_dir = "debug_log"
-        os.makedirs(debug_dir, exist_ok=True)
-        filepath = os.path.join(debug_dir, filename)
-        
-        try:
-            with open(filepath, "a", encoding="utf-8") as f:
-                f.write(f"\n## Laser Hit Event - {datetime.datetime.now().strftime('%H:%M:%S')}\n")
-                f.write(f"- End Reason: {end_reason}\n")
-                f.write(f"- Total Frames: {len(self.debug_log)}\n")
-                
-        except Exception as e:
-            print(f"Debug log write error: {e}")
+        event_log.emit("LASER", "laser_summary",
+                       end_reason=end_reason,
+                       total_frames=len(self.debug_log))
     
     def clear(self):
         """データをクリア"""
         self.frame_data.clear()
+        if self.tail_frames is not None:
+            self.tail_frames.clear()
+        self.recorded_frame_count = 0
         if self.debug_log is not None:
             self.debug_log.clear()
         self.min_distance_achieved = float('inf')
@@ -231,6 +222,63 @@ class LaserTelemetry:
         self.distance_not_decreasing_count = 0
 
 
+class NullLaserTelemetry:
+    """
+    テレメトリー無効時に使うヌルオブジェクト
+    
+    全メソッドが何もしない。共有インスタンス NULL_TELEMETRY を使い回すため、
+    レーザーごとのオブジェクト生成も発生しない。
+    """
+    
+    enabled = False
+    
+    def wants_frame(self, frame_count: int) -> bool:
+        return False
+    
+    def record_frame(self, frame_count: int, laser_data: Dict[str, Any]):
+        pass
+    
+    def record_debug_event(self, frame_count: int, event_type: str, data: Dict[str, Any]):
+        pass
+    
+    def is_circling(self) -> bool:
+        return False
+    
+    def get_frames(self) -> List[Dict[str, Any]]:
+        return []
+    
+    def export_homing_analysis(self, laser_id: Optional[str], end_reason: str, details: str = ""):
+        pass
+    
+    def export_debug_summary(self, end_reason: str):
+        pass
+    
+    def clear(self):
+        pass
+
+
+# 共有ヌルテレメトリー
+NULL_TELEMETRY = NullLaserTelemetry()
+
+
+def create_laser_telemetry(enabled: bool = None, sample_every: int = 1,
+                           keep_first: int = 0, keep_last: int = 0):
+    """
+    テレメトリーを生成（無効時は共有ヌルオブジェクトを返す）
+    
+    Args:
+        enabled: テレメトリーの有効/無効（Noneの場合はDEBUGフラグを使用）
+        sample_every: Nフレームに1回だけ記録する
+        keep_first: 先頭Kフレームのみ保持（0で制限なし）
+        keep_last: 末尾Kフレームのみ保持（0で制限なし）
+    """
+    if enabled is None:
+        enabled = DEBUG
+    if not enabled:
+        return NULL_TELEMETRY
+    return LaserTelemetry(True, sample_every, keep_first, keep_last)
+
+
 class LaserTelemetryManager:
     """複数のレーザーテレメトリーを管理するクラス"""
     
@@ -239,8 +287,8 @@ class LaserTelemetryManager:
         self.telemetries: Dict[str, LaserTelemetry] = {}
     
     def create_telemetry(self, laser_id: str) -> LaserTelemetry:
-        """新しいテレメトリーインスタンスを作成"""
-        telemetry = LaserTelemetry(self.enabled)
+        """新しいテレメトリーインスタンスを作成（無効時はヌルオブジェクト）"""
+        telemetry = create_laser_telemetry(self.enabled)
         self.telemetries[laser_id] = telemetry
         return telemetry
     
@@ -253,8 +301,7 @@ class LaserTelemetryManager:
         if laser_id in self.telemetries:
             del self.telemetries[laser_id]
     
-    def export_all_reports(self, base_filename: str):
-        """全てのテレメトリーレポートをエクスポート"""
+    def export_all_reports(self):
+        """全てのテレメトリーレポートをイベントログに出力"""
         for laser_id, telemetry in self.telemetries.items():
-            filename = f"{base_filename}_{laser_id}.log"
-            telemetry.export_homing_analysis(filename, laser_id, "BATCH_EXPORT")
+            telemetry.export_homing_analysis(laser_id, "BATCH_EXPORT")
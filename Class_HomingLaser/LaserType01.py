@@ -7,12 +7,13 @@ LaserType01 - Homing Laser System for ChromeBlaze
 import pyxel
 import math
 import sys
+from array import array
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from Common import SCREEN_WIDTH
 from .LaserConfig import LaserConfig, default_laser_config
-from .LaserTelemetry import LaserTelemetry
-from .Vector2D import Vector2D, angle_difference
+from .LaserTelemetry import create_laser_telemetry
+from .Vector2D import Vector2D
 
 class LaserType01:
     """方法1: 線形補間 + 角度制限（最軽量）"""
@@ -35,6 +36,7 @@ class LaserType01:
         # 位置と方向（Vector2D使用）
         self.position = Vector2D(start_x, start_y)
         self.target_position = Vector2D(target_x, target_y)
+        self._to_target = Vector2D()  # 毎フレーム再利用する作業用ベクトル
         
         # ターゲット情報
         self.target_enemy_id = target_enemy_id
@@ -43,14 +45,22 @@ class LaserType01:
         # 初期方向設定
         self.direction = self._initialize_direction(start_x)
         
-        # 軌跡
-        self.trail = [self.position.to_tuple()]
+        # 軌跡（事前確保したfloatリングバッファ: [x0, y0, x1, y1, ...]）
+        self.trail_capacity = max(1, config.max_trail_length)
+        self.trail = array('d', [0.0]) * (self.trail_capacity * 2)
+        self.trail_head = 0   # 次に書き込む点の位置
+        self.trail_count = 0  # 有効な点の数
+        self._push_trail_point(self.position.x, self.position.y)
         
         # アクティブ状態
         self.active = True
         
-        # テレメトリーシステム
-        self.telemetry = LaserTelemetry()
+        # テレメトリーシステム（無効時は共有ヌルオブジェクト）
+        self.telemetry = create_laser_telemetry(
+            config.telemetry_enabled,
+            config.telemetry_sample_every,
+            config.telemetry_keep_first,
+            config.telemetry_keep_last)
         self.frame_count = 0
     
     def _initialize_direction(self, start_x):
@@ -89,24 +99,16 @@ class LaserType01:
     
     def _update_target_position(self, target_x, target_y):
         """ターゲット位置の更新"""
-        self.target_position = Vector2D(target_x, target_y)
+        self.target_position.set(target_x, target_y)
     
     def _calculate_homing_direction(self, delta_time):
-        """ホーミング方向計算（Vector2D使用）"""
+        """ホーミング方向計算（Vector2Dのインプレース演算で確保なし）"""
         # ターゲットへのベクトルと距離を計算
-        to_target = self.target_position - self.position
+        to_target = self._to_target.sub_into(self.target_position, self.position)
         distance = to_target.magnitude()
         current_turn_speed = 0.0
         
         if distance > 0:
-            # ターゲット方向の正規化ベクトル
-            target_direction = to_target.normalize()
-            
-            # 現在の方向とターゲット方向の角度差を計算
-            current_angle = self.direction.angle()
-            target_angle = target_direction.angle()
-            angle_diff = angle_difference(current_angle, target_angle)
-            
             # 距離に基づいて旋回速度を調整
             current_turn_speed = self.config.turn_speed_slow
             if distance < self.config.transition_distance:
@@ -114,14 +116,9 @@ class LaserType01:
                 ratio = 1.0 - (distance / self.config.transition_distance)
                 current_turn_speed = self.config.turn_speed_slow + (self.config.turn_speed_fast - self.config.turn_speed_slow) * ratio
             
-            # 角度制限を適用
+            # 角度制限を適用してターゲット方向へ回転
             max_turn = current_turn_speed * delta_time
-            if abs(angle_diff) > max_turn:
-                angle_diff = math.copysign(max_turn, angle_diff)
-            
-            # 新しい方向を設定
-            new_angle = current_angle + angle_diff
-            self.direction = Vector2D.from_angle(new_angle)
+            self.direction.rotate_toward(to_target, max_turn)
         
         return distance, current_turn_speed
     
@@ -134,25 +131,34 @@ class LaserType01:
     
     def _update_position(self, delta_time):
         """位置更新"""
-        velocity = self.direction * self.speed * delta_time
-        self.position += velocity
+        self.position.iadd_scaled(self.direction, self.speed * delta_time)
     
     def _update_debug_and_trail(self, distance, current_turn_speed):
         """デバッグ情報と軌跡の更新"""
         # 簡略化されたテレメトリーデータ（位置・距離・状態のみ）
-        simple_data = {
-            'laser_pos': (round(self.position.x, 1), round(self.position.y, 1)),
-            'distance': round(distance, 1),
-            'current_speed': self.speed
-        }
-        self.telemetry.record_frame(self.frame_count, simple_data)
+        # 無効時・サンプリング対象外のフレームではデータを組み立てない
+        if self.telemetry.enabled and self.telemetry.wants_frame(self.frame_count):
+            simple_data = {
+                'laser_pos': (round(self.position.x, 1), round(self.position.y, 1)),
+                'distance': round(distance, 1),
+                'current_speed': self.speed
+            }
+            self.telemetry.record_frame(self.frame_count, simple_data)
         
         self.frame_count += 1
         
-        # 軌跡の更新
-        self.trail.append(self.position.to_tuple())
-        if len(self.trail) > self.config.max_trail_length:
-            self.trail.pop(0)
+        # 軌跡の更新（最も古い点を上書き）
+        self._push_trail_point(self.position.x, self.position.y)
+    
+    def _push_trail_point(self, x, y):
+        """軌跡リングバッファに1点追加"""
+        head = self.trail_head
+        self.trail[head * 2] = x
+        self.trail[head * 2 + 1] = y
+        head += 1
+        self.trail_head = 0 if head == self.trail_capacity else head
+        if self.trail_count < self.trail_capacity:
+            self.trail_count += 1
     
     def _check_hit_and_boundaries(self, distance):
         """ヒット判定と境界チェック"""
@@ -160,8 +166,8 @@ class LaserType01:
         if distance < self.config.hit_threshold:
             self.active = False
             details = f"Update distance hit - Distance: {distance:.2f} < threshold: {self.config.hit_threshold}"
-            self.telemetry.export_homing_analysis("Homing.log", self.target_enemy_id, "DISTANCE_HIT", details)
-            self.telemetry.export_debug_summary("debug.log", "HIT")
+            self.telemetry.export_homing_analysis(self.target_enemy_id, "DISTANCE_HIT", details)
+            self.telemetry.export_debug_summary("HIT")
             return True  # ヒットを示すフラグ
         
         # 画面外チェック
@@ -170,39 +176,52 @@ class LaserType01:
             if self.active:  # まだアクティブな場合のみログ出力
                 self.active = False
                 details = f"Final pos: {self.position}"
-                self.telemetry.export_homing_analysis("Homing.log", self.target_enemy_id, "OUT_OF_BOUNDS", details)
-                self.telemetry.export_debug_summary("debug.log", "OUT_OF_BOUNDS")
+                self.telemetry.export_homing_analysis(self.target_enemy_id, "OUT_OF_BOUNDS", details)
+                self.telemetry.export_debug_summary("OUT_OF_BOUNDS")
         
         return False
     
     def draw(self):
         """レーザーの描画"""
-        if not self.active or len(self.trail) < self.MIN_TRAIL_LENGTH:
+        if not self.active or self.trail_count < self.MIN_TRAIL_LENGTH:
             return
         
-        # 軌跡を線で描画
-        for i in range(len(self.trail) - 1):
-            start_x, start_y = self.trail[i]
-            end_x, end_y = self.trail[i + 1]
+        # 軌跡を古い順に辿って線で描画（コピーなし）
+        trail = self.trail
+        capacity = self.trail_capacity
+        index = (self.trail_head - self.trail_count) % capacity
+        start_x = trail[index * 2]
+        start_y = trail[index * 2 + 1]
+        for _ in range(self.trail_count - 1):
+            index += 1
+            if index == capacity:
+                index = 0
+            end_x = trail[index * 2]
+            end_y = trail[index * 2 + 1]
             pyxel.line(int(start_x), int(start_y), int(end_x), int(end_y), pyxel.COLOR_CYAN)
+            start_x, start_y = end_x, end_y
     
     def check_collision(self, enemy):
         """エネミーとの距離判定（100%命中保証）"""
         if not self.active or not enemy.active:
             return False
         
-        # エネミー中心位置をVector2Dで計算
-        enemy_center = Vector2D(enemy.x + enemy.sprite_size / 2, enemy.y + enemy.sprite_size / 2)
-        center_distance = self.position.distance_to(enemy_center)
+        # エネミー中心位置までの距離を計算（判定のためにVector2Dは生成しない）
+        center_x = enemy.x + enemy.sprite_size / 2
+        center_y = enemy.y + enemy.sprite_size / 2
+        dx = center_x - self.position.x
+        dy = center_y - self.position.y
+        center_distance = math.sqrt(dx * dx + dy * dy)
         
         # 距離判定のみ（ホーミングレーザーは100%命中システム）
         hit_distance_threshold = self.config.collision_threshold
         
         if center_distance <= hit_distance_threshold:
             self.active = False
+            enemy_center = Vector2D(center_x, center_y)
             details = (f"Distance hit - Distance: {center_distance:.2f}, Threshold: {hit_distance_threshold:.2f}, " +
                       f"Laser: {self.position}, Enemy: {enemy_center}")
-            self.telemetry.export_homing_analysis("Homing.log", self.target_enemy_id, "COLLISION_HIT", details)
+            self.telemetry.export_homing_analysis(self.target_enemy_id, "COLLISION_HIT", details)
             return True
         
         return False
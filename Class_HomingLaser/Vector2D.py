@@ -7,9 +7,13 @@ Vector2D - 2D Vector Utility Class for ChromeBlaze
 import math
 from typing import Tuple, Union
 
+TWO_PI = 2.0 * math.pi
+
 class Vector2D:
     """2Dベクトルクラス - 角度計算・正規化・回転を統一管理"""
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0):
         """
         2Dベクトルの初期化
@@ -126,6 +130,53 @@ class Vector2D:
         """コピーを作成"""
         return Vector2D(self.x, self.y)
     
+    # インプレース演算（新しいVector2Dを生成しない）
+    def set(self, x: float, y: float) -> 'Vector2D':
+        """成分を直接設定"""
+        self.x = x
+        self.y = y
+        return self
+    
+    def iadd_scaled(self, other: 'Vector2D', scale: float) -> 'Vector2D':
+        """自身に other * scale を加算"""
+        self.x += other.x * scale
+        self.y += other.y * scale
+        return self
+    
+    def sub_into(self, a: 'Vector2D', b: 'Vector2D') -> 'Vector2D':
+        """自身に a - b を書き込む"""
+        self.x = a.x - b.x
+        self.y = a.y - b.y
+        return self
+    
+    def normalize_into(self, out: 'Vector2D') -> 'Vector2D':
+        """正規化した結果を out に書き込む（自身は変更しない）"""
+        mag = math.sqrt(self.x * self.x + self.y * self.y)
+        if mag > 0:
+            out.x = self.x / mag
+            out.y = self.y / mag
+        else:
+            out.x = out.y = 0.0
+        return out
+    
+    def rotate_toward(self, target: 'Vector2D', max_angle: float) -> 'Vector2D':
+        """
+        自身の向きを target の向きへ最大 max_angle ラジアンだけ回転（長さは維持）
+        
+        Args:
+            target: 目標方向のベクトル（長さは問わない）
+            max_angle: 1回で回転できる最大角度（ラジアン）
+        """
+        current_angle = math.atan2(self.y, self.x)
+        angle_diff = angle_difference(current_angle, math.atan2(target.y, target.x))
+        if abs(angle_diff) > max_angle:
+            angle_diff = math.copysign(max_angle, angle_diff)
+        new_angle = current_angle + angle_diff
+        mag = math.sqrt(self.x * self.x + self.y * self.y)
+        self.x = math.cos(new_angle) * mag
+        self.y = math.sin(new_angle) * mag
+        return self
+    
     # 演算子オーバーロード
     def __add__(self, other: 'Vector2D') -> 'Vector2D':
         """ベクトル加算"""
@@ -165,21 +216,12 @@ class Vector2D:
 
 # ユーティリティ関数
 def angle_difference(angle1: float, angle2: float) -> float:
-    """2つの角度の差を-π～πの範囲で計算"""
-    diff = angle2 - angle1
-    while diff > math.pi:
-        diff -= 2 * math.pi
-    while diff < -math.pi:
-        diff += 2 * math.pi
-    return diff
+    """2つの角度の差を-π～πの範囲で計算（定数時間）"""
+    return math.remainder(angle2 - angle1, TWO_PI)
 
 def clamp_angle(angle: float) -> float:
-    """角度を-π～πの範囲にクランプ"""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    """角度を-π～πの範囲にクランプ（定数時間）"""
+    return math.remainder(angle, TWO_PI)
 
 # 定数
 ZERO = Vector2D(0, 0)
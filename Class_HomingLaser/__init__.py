@@ -5,14 +5,18 @@ Class_HomingLaser Package - Homing Laser System Components
 """
 
 from .LaserType01 import LaserType01
+from .LaserSwarm import LaserSwarm, NO_TARGET
 from .LaserConfig import LaserConfig, LaserProfiles, default_laser_config
-from .LaserTelemetry import LaserTelemetry, LaserTelemetryManager
+from .LaserTelemetry import (LaserTelemetry, LaserTelemetryManager, NullLaserTelemetry,
+                             NULL_TELEMETRY, create_laser_telemetry)
 from .Vector2D import Vector2D, angle_difference, clamp_angle, ZERO, ONE, UP, DOWN, LEFT, RIGHT
 
 __all__ = [
     'LaserType01',
+    'LaserSwarm', 'NO_TARGET',
     'LaserConfig', 'LaserProfiles', 'default_laser_config',
-    'LaserTelemetry', 'LaserTelemetryManager', 
+    'LaserTelemetry', 'LaserTelemetryManager', 'NullLaserTelemetry',
+    'NULL_TELEMETRY', 'create_laser_telemetry',
     'Vector2D', 'angle_difference', 'clamp_angle',
     'ZERO', 'ONE', 'UP', 'DOWN', 'LEFT', 'RIGHT'
 ]
\ No newline at end of file
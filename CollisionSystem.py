@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Collision System for ChromeBlaze
+弾丸とエネミーの一括当たり判定システム
+"""
+
+import numpy as np
+from Common import SPRITE_SIZE
+from GameLogger import logger
+from EventLog import event_log
+
+
+class CollisionSystem:
+    """
+    ショット vs エネミーの当たり判定を配列でまとめて処理するクラス
+
+    弾丸全体の外接矩形で空間ハッシュを検索して候補エネミーを絞り込み、
+    全弾丸×候補エネミーのAABB判定を1回のNumPy演算で行い、ヒットした組み合わせだけをPython側で解決する。
+    眠っている（ASLEEP）エネミーは空間ハッシュに登録されないため判定しない。
+    判定規則は Common.check_collision と同じ（辺が接しているだけでは当たらない）。
+    """
+
+    def __init__(self, enemy_size=SPRITE_SIZE):
+        self.enemy_size = enemy_size
+        self.hit_count = 0  # 累計ヒット数
+
+    def resolve_bullets(self, player, enemy_manager):
+        """
+        プレイヤーの弾丸とアクティブなエネミーの当たり判定を行う
+
+        ヒットした弾丸はプールに返却され、エネミーは remove_enemy で削除され、
+        ヒット位置にエフェクトが追加される。1発の弾丸が倒せるエネミーは1体まで。
+
+        Returns:
+            int: このフレームでヒットした数
+        """
+        bullets = player.bullets
+        bullet_count = bullets.count
+        if bullet_count == 0 or enemy_manager.get_active_count() == 0:
+            return 0
+
+        # 弾丸の位置配列（プールの配列をそのまま参照）
+        bx = bullets.x[:bullet_count]
+        by = bullets.y[:bullet_count]
+        bw = bullets.WIDTH
+        bh = bullets.HEIGHT
+
+        # 弾丸の外接矩形と重なるエネミーだけを候補にする（空間ハッシュの登録順）
+        min_x = float(bx.min())
+        min_y = float(by.min())
+        enemies = enemy_manager.query_rect(min_x, min_y, float(bx.max()) + bw - min_x, float(by.max()) + bh - min_y)
+        enemy_count = len(enemies)
+        if enemy_count == 0:
+            return 0
+
+        # 候補エネミーの位置配列
+        ex = np.fromiter((enemy.x for enemy in enemies), dtype=np.float64, count=enemy_count)
+        ey = np.fromiter((enemy.y for enemy in enemies), dtype=np.float64, count=enemy_count)
+        size = self.enemy_size
+
+        # 全組み合わせのAABB判定（弾丸×候補エネミー）
+        overlap = ((bx[:, None] < ex[None, :] + size) &
+                   (bx[:, None] + bw > ex[None, :]) &
+                   (by[:, None] < ey[None, :] + size) &
+                   (by[:, None] + bh > ey[None, :]))
+
+        hit_rows = np.flatnonzero(overlap.any(axis=1))
+        if len(hit_rows) == 0:
+            return 0
+
+        # ヒットした弾丸だけ逐次解決（先に当たった弾丸がエネミーを倒す）
+        hits = 0
+        consumed_slots = []
+        killed = np.zeros(enemy_count, dtype=bool)
+        for row in hit_rows:
+            candidates = np.flatnonzero(overlap[row] & ~killed)
+            if len(candidates) == 0:
+                continue
+            column = int(candidates[0])
+            killed[column] = True
+
+            enemy = enemies[column]
+            consumed_slots.append(int(row))
+
+            # ヒットエフェクトを追加
+            effect_x = enemy.x + size // 2
+            effect_y = enemy.y + size // 2
+            player.hit_effect_manager.add_effect(effect_x, effect_y)
+
+            enemy_manager.remove_enemy(enemy.enemy_id)
+            logger.player_action("Enemy %s hit by bullet!", enemy.enemy_id)
+            event_log.emit("PLAYER", "bullet_hit", enemy_id=enemy.enemy_id, x=effect_x, y=effect_y)
+            hits += 1
+
+        # ヒットした弾丸をプールに返却
+        bullets.release_many(consumed_slots)
+
+        self.hit_count += hits
+        return hits
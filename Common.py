@@ -1,6 +1,8 @@
 from enum import Enum
 
 DEBUG = False
+PROFILE = False  # サブシステム別フレームプロファイラー（F3でオーバーレイ表示）
+EVENT_LOG = DEBUG  # 構造化イベントログ（debug_log/events/ へのJSON Lines出力）
 
 #Pyxel Color Pallet
 #   0: pyxel.COLOR_BLACK     # 黒
@@ -34,6 +36,10 @@ FPS = 60
 SPRITE_SIZE = 8
 DISPLAY_SCALE = 5
 
+# Simulation Timestep
+FIXED_DT = 1.0 / FPS         # シミュレーション1ステップの長さ（秒）
+MAX_CATCH_UP_STEPS = 5       # 描画1回あたりに実行する最大ステップ数（処理落ち時の追いつき上限）
+
 
 def check_collision(x1, y1, w1, h1, x2, y2, w2, h2):
     """AABB collision detection"""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Effect Atlas for ChromeBlaze
+エフェクトの全コマを起動時にイメージバンクへ描き込むアトラス
+
+円・リングなど複数のプリミティブで構成されるエフェクトを、起動時（pyxel.init / pyxel.load の後）に
+1回だけ予約領域へ描画し、SpriteManagerにアニメーションクリップとして登録する。
+描画時はエフェクト1個につき現在のコマを pyxel.blt 1回で転送するだけになるため、
+見た目の複雑さに関係なく描画コストが一定になる。
+
+ヘッドレス実行など build() を呼んでいない場合、HitEffectManager はプリミティブ描画にフォールバックする。
+"""
+
+import pyxel
+from SpriteManager import sprite_manager, SpIdx
+
+
+# === エフェクトのコマ描画関数 ===
+# render(image, cx, cy, index, count): セル中心 (cx, cy) に count コマ中 index コマ目を描く
+# 透過色は黒（COLOR_BLACK）なので、黒は使わない
+
+def render_hit(image, cx, cy, index, count):
+    """通常ヒット: 赤い丸（半径6）の中心がオレンジ→赤へ冷えていく"""
+    image.circ(cx, cy, 6, pyxel.COLOR_RED)
+    core = 4 - index * 5 // count
+    if core > 0:
+        image.circ(cx, cy, core, pyxel.COLOR_ORANGE)
+    if index < 2:
+        image.circ(cx, cy, 2, pyxel.COLOR_YELLOW)
+
+
+def render_explosion(image, cx, cy, index, count):
+    """レーザー撃破: 白→黄→橙→赤と色が変わりながら広がるリングと、縮んでいく火球"""
+    radius = 2 + 5 * index // (count - 1)
+    colors = (pyxel.COLOR_WHITE, pyxel.COLOR_YELLOW, pyxel.COLOR_ORANGE, pyxel.COLOR_RED)
+    image.circb(cx, cy, radius, colors[index * len(colors) // count])
+    core = 3 - index * 4 // count
+    if core > 0:
+        image.circ(cx, cy, core, pyxel.COLOR_YELLOW)
+        image.pset(cx, cy, pyxel.COLOR_WHITE)
+
+
+# 名前 -> (コマ数, 描画関数)
+EFFECT_DEFINITIONS = {
+    "FX_HIT": (10, render_hit),
+    "FX_EXPLOSION": (12, render_explosion),
+}
+
+
+class EffectAtlas:
+    """
+    エフェクトのコマをイメージバンクの予約領域に並べたアトラス
+
+    予約領域: イメージバンク BANK の (ORIGIN_X, ORIGIN_Y) から幅 REGION_WIDTH × 高さ REGION_HEIGHT。
+    各コマは CELL_SIZE 四方のセルで、左上から行優先で詰めて配置する。
+    """
+
+    BANK = 2
+    ORIGIN_X = 0
+    ORIGIN_Y = 0
+    REGION_WIDTH = 256
+    REGION_HEIGHT = 64
+    CELL_SIZE = 16
+
+    def __init__(self, definitions=None):
+        self.definitions = definitions or EFFECT_DEFINITIONS
+        self.clips = {}  # 名前 -> AnimationClip（build後のみ）
+        self.built = False
+        self.generation = 0  # build() のたびに増える（クリップをキャッシュする側の更新判定用）
+
+    def build(self, image=None):
+        """
+        全エフェクトのコマを予約領域に描画してSpriteManagerに登録する（pyxel.init / load の後に呼ぶ）
+
+        Args:
+            image: 描き込み先のpyxel.Image（Noneの場合は pyxel.images[BANK]）
+        """
+        if image is None:
+            image = pyxel.images[self.BANK]
+        cell = self.CELL_SIZE
+        half = cell // 2
+        columns = self.REGION_WIDTH // cell
+        capacity = columns * (self.REGION_HEIGHT // cell)
+
+        total = sum(count for count, _ in self.definitions.values())
+        if total > capacity:
+            raise ValueError(f"Effect atlas needs {total} cells but the reserved region has {capacity}")
+
+        image.rect(self.ORIGIN_X, self.ORIGIN_Y, self.REGION_WIDTH, self.REGION_HEIGHT, pyxel.COLOR_BLACK)
+        cell_index = 0
+        for name, (count, render) in self.definitions.items():
+            frames = []
+            for index in range(count):
+                u = self.ORIGIN_X + (cell_index % columns) * cell
+                v = self.ORIGIN_Y + (cell_index // columns) * cell
+                render(image, u + half, v + half, index, count)
+                frames.append(SpIdx(u, v))
+                cell_index += 1
+            self.clips[name] = sprite_manager.register_clip(
+                name, frames, anim_speed=1, BANK=self.BANK, W=cell, H=cell)
+        self.built = True
+        self.generation += 1
+
+    def clip(self, name):
+        """登録済みのクリップを取得（build前はNone）"""
+        return self.clips.get(name)
+
+
+# グローバルインスタンス
+effect_atlas = EffectAtlas()
@@ -6,11 +6,33 @@ Enemy Management System for ChromeBlaze
 
 import pyxel
 import math
-import random
+from enum import Enum
+from SpriteManager import sprite_manager, animation_clock
+from SpatialHash import SpatialHash
+from RandomService import rng_service
+
+
+class Visibility(Enum):
+    """
+    ビューポートに対するエネミーの位置の分類
+
+    VISIBLE: ビューポート内 - 毎フレーム更新・描画
+    NEAR: ビューポート外だがマージン内 - 毎フレーム更新、描画なし
+    ASLEEP: マージンより外 - 間引き更新（経過時間をまとめて適用）、描画なし
+    """
+    VISIBLE = "visible"
+    NEAR = "near"
+    ASLEEP = "asleep"
+
 
 class Enemy:
     """エネミー管理クラス"""
-    def __init__(self, enemy_id, x, y, sprite_size, screen_width, screen_height):
+    def __init__(self, enemy_id, x, y, sprite_size, screen_width, screen_height, bounds=None):
+        """
+        Args:
+            bounds: 移動範囲 (min_x, min_y, max_x, max_y)（左上座標・ワールド座標）。
+                    Noneの場合は画面上半分
+        """
         self.enemy_id = enemy_id
         self.x = float(x)
         self.y = float(y)
@@ -18,6 +40,12 @@ class Enemy:
         self.sprite_size = sprite_size
         self.screen_width = screen_width
         self.screen_height = screen_height
+        if bounds is None:
+            bounds = (0, 0, screen_width - sprite_size, screen_height // 2)
+        self.min_x, self.min_y, self.max_x, self.max_y = bounds
+        
+        # アニメーションクリップ（共有クロックで再生）
+        self.clip = sprite_manager.get_animation_clip("ENEMY01")
         
         # 移動設定
         self.speed = 25  # ピクセル/秒
@@ -28,111 +56,281 @@ class Enemy:
         self.move_timer = 0.0
         self.direction_duration = 3.0  # 3秒間同じ方向
         
+        # ビューポート外での間引き更新（EnemyManagerが管理）
+        self.visibility = Visibility.VISIBLE
+        self.sleep_time = 0.0  # 眠っている間にたまった未適用の経過時間（秒）
+        
         # 初期方向設定
         self._generate_random_direction()
     
     def _generate_random_direction(self):
         """3秒間持続するランダムな移動方向を生成"""
-        # ランダムな角度（0-360度）
-        angle = random.uniform(0, 2 * math.pi)
+        # ランダムな角度（0-360度、エネミーAI用ストリームから取得）
+        angle = rng_service.enemy_ai.angle()
         
         # 速度ベクトルを計算
         self.velocity_x = math.cos(angle) * self.speed
         self.velocity_y = math.sin(angle) * self.speed
     
     def update(self, delta_time):
-        """エネミーの更新"""
+        """
+        エネミーの更新
+        
+        眠っていたエネミーは数フレーム分の経過時間をまとめて渡されるため、
+        方向転換の時刻で区切って移動し、余った時間は次の方向のタイマーに持ち越す
+        （毎フレーム更新した場合と同じ間隔で方向転換する）。
+        """
         if not self.active:
             return
         
-        # ランダム移動タイマー更新
-        self.move_timer += delta_time
-        
-        # 3秒ごとに新しいランダム方向を生成
-        if self.move_timer >= self.direction_duration:
-            self.move_timer = 0.0
-            self._generate_random_direction()
-        
+        remaining = delta_time
+        while remaining > 0.0:
+            # 次の方向転換までの時間だけ進める
+            step = min(remaining, self.direction_duration - self.move_timer)
+            self._move(step)
+            self.move_timer += step
+            remaining -= step
+            
+            # 3秒ごとに新しいランダム方向を生成（超過分は持ち越す）
+            if self.move_timer >= self.direction_duration:
+                self.move_timer -= self.direction_duration
+                self._generate_random_direction()
+    
+    def _move(self, delta_time):
+        """現在の速度で移動し、移動範囲の端で反射"""
         # 位置更新
         self.x += self.velocity_x * delta_time
         self.y += self.velocity_y * delta_time
         
-        # 画面端での境界チェック（反射）
-        if self.x <= 0:
-            self.x = 0
+        # 移動範囲の端での境界チェック（反射）
+        if self.x <= self.min_x:
+            self.x = self.min_x
             self.velocity_x = abs(self.velocity_x)  # 右向きに反転
-        elif self.x >= self.screen_width - self.sprite_size:
-            self.x = self.screen_width - self.sprite_size
+        elif self.x >= self.max_x:
+            self.x = self.max_x
             self.velocity_x = -abs(self.velocity_x)  # 左向きに反転
             
-        if self.y <= 0:
-            self.y = 0
+        if self.y <= self.min_y:
+            self.y = self.min_y
             self.velocity_y = abs(self.velocity_y)  # 下向きに反転
-        elif self.y >= self.screen_height // 2:  # 画面上半分に制限
-            self.y = self.screen_height // 2
+        elif self.y >= self.max_y:  # 既定では画面上半分に制限
+            self.y = self.max_y
             self.velocity_y = -abs(self.velocity_y)  # 上向きに反転
     
-    def draw(self, sprite_manager, sprite_size):
-        """エネミーの描画"""
+    def draw(self, sprite_manager, sprite_size, canvas=pyxel):
+        """エネミーの描画（canvasはpyxelまたはRenderQueueのレイヤー）"""
         if not self.active:
             return
         
-        # ENEMY01スプライト（フレーム0）を表示
-        enemy_sprite = sprite_manager.get_sprite_by_name_and_field("ENEMY01", "FRAME_NUM", "0")
+        # ENEMY01クリップの現在のコマを表示
+        enemy_sprite = self.clip.frame_at(animation_clock.frame)
         if enemy_sprite:
-            pyxel.blt(int(self.x), int(self.y), 0, enemy_sprite.x, enemy_sprite.y, 
+            canvas.blt(int(self.x), int(self.y), 0, enemy_sprite.x, enemy_sprite.y, 
                      sprite_size, sprite_size, pyxel.COLOR_BLACK)
 
 class EnemyManager:
     """エネミー群管理クラス"""
-    def __init__(self, sprite_size, screen_width, screen_height):
-        self.enemies = []
+    
+    # 既定の初期配置（画面上半分の内側）
+    DEFAULT_POSITIONS = [
+        (16, 12),   # 左上
+        (96, 16),   # 右上
+        (56, 28),   # 中央上
+        (28, 44),   # 左中
+        (88, 48)    # 右中
+    ]
+    
+    # ビューポート外の判定設定
+    DEFAULT_WAKE_MARGIN = 32    # ビューポートからこの距離（ピクセル）以内ならNEAR（毎フレーム更新）
+    DEFAULT_SLEEP_INTERVAL = 8  # ASLEEPのエネミーを更新する間隔（フレーム）
+    
+    def __init__(self, sprite_size, screen_width, screen_height, spawn_defaults=True,
+                 wake_margin=DEFAULT_WAKE_MARGIN, sleep_interval=DEFAULT_SLEEP_INTERVAL,
+                 world_bounds=None):
+        """
+        ビューポートとエネミーの移動範囲（world_bounds）は独立している。既定の移動範囲は
+        画面上半分で既定のビューポート（画面全体）に収まるため、全エネミーが常にVISIBLEになる。
+        NEAR / ASLEEP が発生するのは、移動範囲をビューポートより広く取るか set_viewport で
+        ビューポートを動かした場合（HeadlessRunner --check-enemy-sleep で確認できる）。
+        
+        Args:
+            world_bounds: エネミーの移動範囲 (min_x, min_y, max_x, max_y)（左上座標・ワールド座標）。
+                          Noneの場合は画面上半分
+            wake_margin: ビューポート外でも毎フレーム更新する範囲（ピクセル）。
+                         眠っている間の移動量（速度 × sleep_interval フレーム）より大きくしておくと、
+                         ビューポートに入る前に必ず起きる
+            sleep_interval: マージン外のエネミーを更新する間隔（フレーム）
+        """
         self.sprite_size = sprite_size
         self.screen_width = screen_width
         self.screen_height = screen_height
+        if world_bounds is None:
+            world_bounds = (0, 0, screen_width - sprite_size, screen_height // 2)
+        self.world_bounds = world_bounds
+        
+        # ビューポート（スクロールステージでは set_viewport で移動する）と分類
+        self.viewport = (0, 0, screen_width, screen_height)
+        self.wake_margin = wake_margin
+        self.sleep_interval = max(1, sleep_interval)
+        self.frame = 0
+        self._visible_enemies = []  # 直近のupdateでVISIBLEだったエネミー（描画対象）
+        
+        # 検索用インデックス（スポーン・削除時に差分更新、削除したエネミーは残さない）
+        self._enemies_by_id = {}   # enemy_id -> Enemy（登録中のみ）
+        self._active_enemies = {}  # enemy_id -> Enemy（アクティブのみ、スポーン順）
+        self._next_enemy_id = 0    # spawn_enemy() で割り当てる次のID
+        
+        # 近傍検索用の空間ハッシュ（update()のたびに再構築）
+        # 移動範囲全体 + wake_margin を覆う（ビューポートを動かしても起きているエネミーが端のセルに偏らない）
+        min_x, min_y, max_x, max_y = world_bounds
+        self.spatial_hash = SpatialHash(sprite_size,
+                                        max_x - min_x + sprite_size + wake_margin * 2,
+                                        max_y - min_y + sprite_size + wake_margin * 2,
+                                        min_x - wake_margin, min_y - wake_margin)
         
-        # 5体のエネミーを生成
-        self._spawn_enemies()
+        # 5体のエネミーを生成（負荷シナリオなどでは spawn_defaults=False で空から始める）
+        if spawn_defaults:
+            self._spawn_enemies()
     
     def _spawn_enemies(self):
         """5体のエネミーを異なる位置に配置"""
-        positions = [
-            (50, 30),   # 左上
-            (150, 40),  # 右上
-            (100, 60),  # 中央上
-            (80, 80),   # 左中
-            (180, 70)   # 右中
-        ]
-        
-        for i, (x, y) in enumerate(positions):
-            enemy = Enemy(i, x, y, self.sprite_size, self.screen_width, self.screen_height)
-            self.enemies.append(enemy)
+        for x, y in self.DEFAULT_POSITIONS:
+            self.spawn_enemy(x, y)
+    
+    def spawn_enemy(self, x, y):
+        """新しいIDでエネミーを生成して登録し、生成したエネミーを返す"""
+        enemy = Enemy(self._next_enemy_id, x, y, self.sprite_size, self.screen_width, self.screen_height,
+                      self.world_bounds)
+        self.add_enemy(enemy)
+        return enemy
+    
+    def add_enemy(self, enemy):
+        """エネミーを登録（IDインデックスとアクティブ集合を更新）"""
+        self._enemies_by_id[enemy.enemy_id] = enemy
+        if enemy.enemy_id >= self._next_enemy_id:
+            self._next_enemy_id = enemy.enemy_id + 1
+        if enemy.active:
+            self._active_enemies[enemy.enemy_id] = enemy
+            self._classify(enemy)
+            if enemy.visibility is Visibility.VISIBLE:
+                self._visible_enemies.append(enemy)
+            if enemy.visibility is not Visibility.ASLEEP:
+                self.spatial_hash.insert(enemy, enemy.x, enemy.y, self.sprite_size, self.sprite_size)
+    
+    def clear(self):
+        """全エネミーを登録解除（IDの採番は継続するため、消えたエネミーのIDは再利用されない）"""
+        for enemy in self._enemies_by_id.values():
+            enemy.active = False
+        self._enemies_by_id.clear()
+        self._active_enemies.clear()
+        self._visible_enemies.clear()
+        self.spatial_hash.clear()
+    
+    # === ビューポート外の分類 ===
+    
+    def set_viewport(self, x, y, width=None, height=None):
+        """ビューポートを移動（分類は次のupdateから反映、眠っているエネミーは次の間引き更新で判定）"""
+        _, _, current_width, current_height = self.viewport
+        self.viewport = (x, y, width or current_width, height or current_height)
+    
+    def _classify(self, enemy):
+        """エネミーをビューポートとマージンに対して VISIBLE / NEAR / ASLEEP に分類"""
+        view_x, view_y, view_w, view_h = self.viewport
+        size = self.sprite_size
+        x = enemy.x
+        y = enemy.y
+        if x + size > view_x and y + size > view_y and x < view_x + view_w and y < view_y + view_h:
+            enemy.visibility = Visibility.VISIBLE
+            return
+        margin = self.wake_margin
+        if (x + size > view_x - margin and y + size > view_y - margin
+                and x < view_x + view_w + margin and y < view_y + view_h + margin):
+            enemy.visibility = Visibility.NEAR
+        else:
+            enemy.visibility = Visibility.ASLEEP
     
     def update(self, delta_time):
-        """全エネミーの更新"""
-        for enemy in self.enemies:
-            enemy.update(delta_time)
+        """
+        全エネミーの更新
+        
+        VISIBLE / NEAR のエネミーは毎フレーム更新する。ASLEEPのエネミーは経過時間をためておき、
+        sleep_interval フレームに1回（IDでずらして負荷を分散）まとめて更新する。
+        更新したエネミーは移動後の位置で分類し直し、マージン内に入ったら次のフレームから毎フレーム更新する。
+        """
+        self.frame += 1
+        frame = self.frame
+        interval = self.sleep_interval
+        classify = self._classify
+        asleep = Visibility.ASLEEP
+        visible = Visibility.VISIBLE
+        awake_enemies = []
+        visible_enemies = self._visible_enemies
+        visible_enemies.clear()
+        
+        for enemy in self._active_enemies.values():
+            if enemy.visibility is asleep:
+                enemy.sleep_time += delta_time
+                if (frame + enemy.enemy_id) % interval:
+                    continue
+                enemy.update(enemy.sleep_time)
+                enemy.sleep_time = 0.0
+            else:
+                enemy.update(delta_time)
+            classify(enemy)
+            if enemy.visibility is not asleep:
+                awake_enemies.append(enemy)
+                if enemy.visibility is visible:
+                    visible_enemies.append(enemy)
+        
+        # 移動後の位置で空間ハッシュを再構築（眠っているエネミーは検索対象外）
+        self.spatial_hash.rebuild(awake_enemies, self.sprite_size, self.sprite_size)
+    
+    def draw(self, sprite_manager, canvas=pyxel):
+        """ビューポート内のエネミーのみ描画"""
+        for enemy in self._visible_enemies:
+            enemy.draw(sprite_manager, self.sprite_size, canvas)
+    
+    def get_visibility_counts(self):
+        """分類ごとのアクティブなエネミー数を取得"""
+        counts = {visibility: 0 for visibility in Visibility}
+        for enemy in self._active_enemies.values():
+            counts[enemy.visibility] += 1
+        return counts
     
-    def draw(self, sprite_manager):
-        """全エネミーの描画"""
-        for enemy in self.enemies:
-            enemy.draw(sprite_manager, self.sprite_size)
+    def iter_active_enemies(self):
+        """アクティブなエネミーを列挙（リストを生成しない）"""
+        return self._active_enemies.values()
     
     def get_active_enemies(self):
         """アクティブなエネミーのリストを取得"""
-        return [enemy for enemy in self.enemies if enemy.active]
+        return list(self._active_enemies.values())
+    
+    def get_active_count(self):
+        """アクティブなエネミー数を取得"""
+        return len(self._active_enemies)
+    
+    def query_rect(self, x, y, w, h):
+        """矩形と重なるアクティブなエネミーのリストを取得（近傍セルのみ検索、ASLEEPは除く）"""
+        return self.spatial_hash.query_rect(x, y, w, h)
+    
+    def query_point(self, px, py):
+        """点を含むアクティブなエネミーのリストを取得（近傍セルのみ検索、ASLEEPは除く）"""
+        return self.spatial_hash.query_point(px, py)
+    
+    def query_radius(self, cx, cy, radius):
+        """円と重なるアクティブなエネミーのリストを取得（近傍セルのみ検索、ASLEEPは除く）"""
+        return self.spatial_hash.query_radius(cx, cy, radius)
     
     def get_enemy_by_id(self, enemy_id):
-        """IDでエネミーを取得"""
-        for enemy in self.enemies:
-            if enemy.enemy_id == enemy_id:
-                return enemy
-        return None
+        """IDでエネミーを取得（削除済みのIDはNone）"""
+        return self._enemies_by_id.get(enemy_id)
     
     def remove_enemy(self, enemy_id):
-        """エネミーをactiveをFalseにして削除"""
-        enemy = self.get_enemy_by_id(enemy_id)
+        """エネミーをactiveをFalseにして削除（全インデックスから外すため、補充を繰り返しても溜まらない）"""
+        enemy = self._enemies_by_id.pop(enemy_id, None)
         if enemy:
             enemy.active = False
+            self._active_enemies.pop(enemy_id, None)
+            self.spatial_hash.remove(enemy)
             return True
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+EventLog - Structured Event Sink for ChromeBlaze
+構造化イベントログ（JSON Lines形式・サイズ上限付きローテーション）
+"""
+
+import atexit
+import datetime
+import glob
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from Common import DEBUG, EVENT_LOG
+
+
+class _EventWriter(threading.Thread):
+    """
+    イベントをキューから受け取り、JSON Linesとしてまとめて書き込むバックグラウンドスレッド
+
+    セグメントが max_segment_bytes を超えたら次のセグメントに切り替え、
+    古いセグメントをgzip圧縮する。圧縮後はディレクトリ全体の合計サイズが
+    max_total_bytes 以下になるまで古いファイルから削除する。
+    """
+
+    FLUSH_INTERVAL = 0.5  # 秒
+    FLUSH_EVENTS = 256
+
+    _STOP = object()  # 終了要求マーカー
+
+    def __init__(self, event_log):
+        super().__init__(name="EventLogWriter", daemon=True)
+        self.event_log = event_log
+        self._queue = queue.SimpleQueue()
+        self._file = None
+
+    def put(self, event):
+        """書き込むイベントをキューに追加（スレッドセーフ・非ブロッキング）"""
+        self._queue.put(event)
+
+    def flush(self, timeout=2.0):
+        """キューに積まれたイベントが書き込まれるまで待つ"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout=5.0):
+        """残りのイベントを書き出してスレッドを終了"""
+        self._queue.put(self._STOP)
+        self.join(timeout)
+
+    def run(self):
+        pending = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if item is None or item is self._STOP or isinstance(item, threading.Event):
+                    self._write_events(pending)
+                    deadline = None
+                    if item is self._STOP:
+                        break
+                    if item is not None:
+                        item.set()
+                    continue
+
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.FLUSH_INTERVAL
+                if len(pending) >= self.FLUSH_EVENTS:
+                    self._write_events(pending)
+                    deadline = None
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # === 書き込み・ローテーション ===
+
+    def _open_segment(self):
+        """新しいセグメントファイルを開く"""
+        os.makedirs(self.event_log.directory, exist_ok=True)
+        path = self.event_log.segment_path(self.event_log.segment)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _write_events(self, pending):
+        """未書き込みのイベントをJSON Linesとしてまとめて書き込む"""
+        if not pending:
+            return
+        try:
+            if self._file is None:
+                self._open_segment()
+            self._file.write("".join(
+                json.dumps(event, separators=(',', ':'), default=str) + "\n"
+                for event in pending))
+            self._file.flush()
+            if self._file.tell() >= self.event_log.max_segment_bytes:
+                self._rotate()
+        except OSError as e:
+            if DEBUG:
+                print(f"Failed to write event log: {e}")
+        pending.clear()
+
+    def _rotate(self):
+        """現在のセグメントを閉じて圧縮し、次のセグメントに切り替える"""
+        finished_path = self._file.name
+        self._file.close()
+        self._file = None
+        self.event_log.segment += 1
+        self._compress(finished_path)
+        self.event_log.enforce_disk_budget()
+
+    @staticmethod
+    def _compress(path):
+        """セグメントをgzip圧縮して元ファイルを削除"""
+        with open(path, 'rb') as source, gzip.open(path + ".gz", 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.remove(path)
+
+
+class EventLog:
+    """
+    ゲームイベントの構造化ログ
+
+    1イベント = 1行のコンパクトなJSON:
+        {"cat":"LASER","type":"homing_analysis","frame":1234,"t":12.345678,...fields}
+
+    - cat: カテゴリ（GameLoggerと同じ PLAYER / LASER / STATE など）
+    - frame: ゲームフレーム番号（GamePlayStateが毎フレーム set_frame で更新）
+    - t: セッション開始からのモノトニック経過秒
+
+    ゲーム本編が出力するイベント:
+        PLAYER: lock（ロックオン）, bullet_hit（ショット命中）
+        LASER:  fire（ホーミングレーザー発射）, hit（レーザー命中）,
+                homing_analysis / laser_summary（LaserTelemetry）
+        STATE:  lock_state（ロックオン状態の遷移）, game_state（画面遷移）
+
+    ファイルはセッションごとに debug_log/events/session_<開始時刻>_<pid>.<連番>.jsonl に出力される。
+    書き込みスレッドと出力ファイルは最初のイベントが来た時点で作成される。
+    出力は Common.EVENT_LOG（既定はDEBUGと同じ）が有効な場合のみで、configure(enabled=...) で切り替えられる。
+    """
+
+    _instance = None
+
+    DEFAULT_DIRECTORY = os.path.join("debug_log", "events")
+    DEFAULT_MAX_SEGMENT_BYTES = 1_000_000    # 1セグメントの上限（1MB）
+    DEFAULT_MAX_TOTAL_BYTES = 20_000_000     # ディレクトリ全体の上限（20MB）
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(EventLog, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self._initialized = True
+            self.directory = self.DEFAULT_DIRECTORY
+            self.max_segment_bytes = self.DEFAULT_MAX_SEGMENT_BYTES
+            self.max_total_bytes = self.DEFAULT_MAX_TOTAL_BYTES
+            self.enabled = EVENT_LOG  # 既定ではDEBUG時のみ出力
+            self.frame = 0
+            self.segment = 0  # 書き込み中のセグメント番号
+            self.session_id = (datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                               + f"_{os.getpid()}")
+            self._monotonic_origin = time.monotonic()
+            self._writer = None
+            self._lock = threading.Lock()
+            # 終了時に残りのイベントを書き出す
+            atexit.register(self.close)
+
+    # === 設定 ===
+
+    def configure(self, directory=None, max_segment_bytes=None, max_total_bytes=None, enabled=None):
+        """出力先・サイズ上限・有効/無効を変更（最初のイベント出力前に呼ぶ）"""
+        if directory is not None:
+            self.directory = directory
+        if max_segment_bytes is not None:
+            self.max_segment_bytes = max_segment_bytes
+        if max_total_bytes is not None:
+            self.max_total_bytes = max_total_bytes
+        if enabled is not None:
+            self.enabled = enabled
+
+    def set_frame(self, frame):
+        """現在のゲームフレーム番号を設定"""
+        self.frame = frame
+
+    def segment_path(self, segment):
+        """セグメント番号に対応するファイルパス"""
+        return os.path.join(self.directory, f"session_{self.session_id}.{segment:03d}.jsonl")
+
+    # === 出力 ===
+
+    def emit(self, category, event_type, frame=None, **fields):
+        """
+        イベントを1件出力（シリアライズとファイルI/Oは書き込みスレッドで行う）
+
+        Args:
+            category: カテゴリ（PLAYER / LASER / STATE など）
+            event_type: イベント種別
+            frame: フレーム番号（Noneの場合は set_frame で設定された値）
+            **fields: 任意の追加フィールド（JSONに変換できない値は文字列化）
+        """
+        if not self.enabled:
+            return
+        event = {
+            'cat': category,
+            'type': event_type,
+            'frame': self.frame if frame is None else frame,
+            't': round(time.monotonic() - self._monotonic_origin, 6),
+        }
+        event.update(fields)
+        self._get_writer().put(event)
+
+    def _get_writer(self):
+        """書き込みスレッドを取得（初回のみ起動）"""
+        writer = self._writer
+        if writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = _EventWriter(self)
+                    self._writer.start()
+                writer = self._writer
+        return writer
+
+    def flush(self):
+        """キューに溜まったイベントをファイルに書き出すまで待つ"""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            writer.flush()
+
+    def close(self):
+        """残りのイベントを書き出して書き込みスレッドを停止（再度emitすると新しいスレッドが起動）"""
+        with self._lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None and writer.is_alive():
+            writer.stop()
+
+    # === ディスク使用量 ===
+
+    def enforce_disk_budget(self):
+        """
+        出力ディレクトリの合計サイズが上限を超えていれば古いファイルから削除
+
+        書き込み中のセグメント（未圧縮の .jsonl）は削除対象にしない。
+        """
+        paths = glob.glob(os.path.join(self.directory, "session_*.jsonl*"))
+        files = []
+        total = 0
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            if path.endswith(".gz"):
+                files.append((stat.st_mtime, path, stat.st_size))
+
+        files.sort()
+        for _, path, size in files:
+            if total <= self.max_total_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        return total
+
+
+def read_events(path):
+    """
+    イベントログファイル（.jsonl / .jsonl.gz）を1件ずつ読み出すジェネレータ
+
+    解析ツールからの利用を想定:
+        for event in read_events("debug_log/events/session_....000.jsonl.gz"):
+            if event['cat'] == 'LASER': ...
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# グローバルインスタンス
+event_log = EventLog()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Fixed Timestep for ChromeBlaze
+固定タイムステップ（アキュムレーター方式）
+"""
+
+import time
+from Common import FIXED_DT, MAX_CATCH_UP_STEPS
+
+
+class FixedTimestep:
+    """
+    実経過時間を貯めて、固定幅 step ごとにシミュレーションを進めるアキュムレーター
+
+    描画1回につき advance() を1回呼び、返されたステップ数だけ update(step) を実行する。
+    描画が遅れた場合は1回の描画で複数ステップ進めて追いつき（ゲーム速度は一定）、
+    max_steps を超える遅れは切り捨てる（処理落ちが続いても無限に追いかけない）。
+    """
+
+    # 経過時間がstepとほぼ等しい場合はstepとみなす（タイマーの揺れで 0/2 ステップが交互に出るのを防ぐ）
+    SNAP_TOLERANCE = 0.05  # stepに対する割合
+
+    def __init__(self, step=FIXED_DT, max_steps=MAX_CATCH_UP_STEPS, clock=time.perf_counter):
+        """
+        Args:
+            step: 1ステップの長さ（秒）
+            max_steps: 描画1回あたりの最大ステップ数
+            clock: 経過時間の計測に使う時計（秒を返す関数）
+        """
+        self.step = step
+        self.max_steps = max_steps
+        self.clock = clock
+
+        self.accumulator = 0.0   # 未消化の経過時間
+        self.dropped_time = 0.0  # 追いつけずに切り捨てた時間の累計
+        self.total_steps = 0     # 実行したステップ数の累計
+        self._last_time = None
+
+    def reset(self):
+        """計測をやり直す（ポーズ解除や画面遷移の直後に呼ぶ）"""
+        self.accumulator = 0.0
+        self._last_time = None
+
+    def advance(self):
+        """
+        前回呼び出しからの実経過時間を加算し、今回実行するステップ数を返す
+
+        Returns:
+            int: 0以上 max_steps 以下のステップ数
+        """
+        now = self.clock()
+        if self._last_time is None:
+            elapsed = self.step  # 初回は1ステップ分とみなす
+        else:
+            elapsed = now - self._last_time
+        self._last_time = now
+
+        if abs(elapsed - self.step) < self.step * self.SNAP_TOLERANCE:
+            elapsed = self.step
+
+        self.accumulator += elapsed
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            # 上限を超えた遅れは切り捨てる（端数だけ残す）
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator %= self.step
+        else:
+            self.accumulator -= steps * self.step
+
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """次のステップまでの進み具合（0.0～1.0、描画補間用）"""
+        return self.accumulator / self.step
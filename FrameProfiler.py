@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Frame Profiler for ChromeBlaze
+サブシステム別フレームプロファイラー（ローリング統計・オーバーレイ・CSV出力）
+"""
+
+import atexit
+import csv
+import os
+import time
+from collections import deque
+import numpy as np
+import pyxel
+from Common import PROFILE, SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class _NullScope:
+    """プロファイル無効時に返す何もしないスコープ（共有インスタンスを使い回す）"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _TimingScope:
+    """1つの計測区間。with ブロックの経過時間（ミリ秒）をサンプル列に追加する"""
+
+    __slots__ = ("samples", "_start")
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.samples.append((time.perf_counter() - self._start) * 1000.0)
+        return False
+
+
+class FrameProfiler:
+    """
+    名前付きスコープごとに処理時間を記録するプロファイラー
+
+        with profiler.scope("enemies.update"):
+            enemy_manager.update(delta_time)
+
+    各スコープは直近 window 回分の計測値を保持し、p50/p95/p99 を計算できる。
+    無効時の scope() は共有のヌルスコープを返すため、計測コストは
+    フラグ判定1回と空の with 文だけになる。
+    """
+
+    DEFAULT_WINDOW = 600            # 統計に使う直近サンプル数（60FPSで10秒）
+    OVERLAY_REFRESH_FRAMES = 30     # オーバーレイの統計を再計算する間隔
+    OVERLAY_TOGGLE_KEY = pyxel.KEY_F3
+    CSV_FILE = os.path.join("debug_log", "profile.csv")
+
+    def __init__(self, enabled=PROFILE, window=DEFAULT_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self.scopes = {}  # 名前 -> _TimingScope（初回計測順）
+        self.overlay_visible = False
+        self._overlay_rows = []
+        self._overlay_age = 0
+        self._export_registered = False
+        if enabled:
+            self._register_export()
+
+    def set_enabled(self, enabled):
+        """計測の有効/無効を切り替え（有効化時は終了時のCSV出力も登録）"""
+        self.enabled = enabled
+        if enabled:
+            self._register_export()
+
+    def _register_export(self):
+        if not self._export_registered:
+            self._export_registered = True
+            atexit.register(self.export_csv)
+
+    def scope(self, name):
+        """計測スコープを取得（無効時はヌルスコープ）"""
+        if not self.enabled:
+            return _NULL_SCOPE
+        timing_scope = self.scopes.get(name)
+        if timing_scope is None:
+            timing_scope = self.scopes[name] = _TimingScope(self.window)
+        return timing_scope
+
+    def reset(self):
+        """全スコープの計測値を破棄"""
+        self.scopes.clear()
+        self._overlay_rows = []
+
+    # === 統計 ===
+
+    def stats(self):
+        """
+        スコープごとの統計を取得
+
+        Returns:
+            list: (名前, サンプル数, 平均, p50, p95, p99, 最大) のリスト（ミリ秒、初回計測順）
+        """
+        rows = []
+        for name, timing_scope in self.scopes.items():
+            if not timing_scope.samples:
+                continue
+            samples = np.fromiter(timing_scope.samples, dtype=np.float64,
+                                  count=len(timing_scope.samples))
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+            rows.append((name, len(samples), float(samples.mean()),
+                         float(p50), float(p95), float(p99), float(samples.max())))
+        return rows
+
+    def export_csv(self, path=None):
+        """統計をCSVに出力（終了時に自動で呼ばれる）"""
+        rows = self.stats()
+        if not rows:
+            return None
+        path = path or self.CSV_FILE
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["scope", "samples", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+                for name, count, mean, p50, p95, p99, peak in rows:
+                    writer.writerow([name, count, f"{mean:.4f}", f"{p50:.4f}",
+                                     f"{p95:.4f}", f"{p99:.4f}", f"{peak:.4f}"])
+        except OSError as e:
+            print(f"Profile export error: {e}")
+            return None
+        return path
+
+    # === オーバーレイ ===
+
+    def handle_input(self):
+        """デバッグキーでオーバーレイ表示を切り替え"""
+        if self.enabled and pyxel.btnp(self.OVERLAY_TOGGLE_KEY):
+            self.overlay_visible = not self.overlay_visible
+            self._overlay_age = 0
+
+    def draw_overlay(self):
+        """128×128画面に収まる統計表を描画（p50/p95/p99、ミリ秒）"""
+        if not (self.enabled and self.overlay_visible):
+            return
+
+        # 統計の再計算は一定間隔ごと（表示自体のコストを抑える）
+        if self._overlay_age == 0:
+            self._overlay_rows = [
+                f"{name[:14]:14s}{p50:5.2f}{p95:6.2f}{p99:6.2f}"
+                for name, _, _, p50, p95, p99, _ in self.stats()
+            ]
+        self._overlay_age = (self._overlay_age + 1) % self.OVERLAY_REFRESH_FRAMES
+
+        line_height = 6
+        max_rows = SCREEN_HEIGHT // line_height - 1
+        rows = self._overlay_rows[:max_rows]
+        pyxel.rect(0, 0, SCREEN_WIDTH, (len(rows) + 1) * line_height + 1, pyxel.COLOR_BLACK)
+        pyxel.text(1, 1, "SCOPE(ms)       P50   P95   P99", pyxel.COLOR_YELLOW)
+        for i, row in enumerate(rows):
+            pyxel.text(1, 1 + (i + 1) * line_height, row, pyxel.COLOR_WHITE)
+
+
+# グローバルインスタンス
+profiler = FrameProfiler()
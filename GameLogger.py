@@ -4,15 +4,151 @@ GameLogger - Unified Logging System for ChromeBlaze
 統一ログシステム
 """
 
+import atexit
 import datetime
 import os
+import queue
+import threading
+import time
+from enum import IntEnum
 from Common import DEBUG
 
+
+class LogLevel(IntEnum):
+    """ログレベル（カテゴリごとの閾値に使用）"""
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    OFF = 100  # 閾値に設定するとそのカテゴリを完全に無効化
+
+
+# カテゴリごとのメッセージレベル（未登録のカテゴリはINFO扱い）
+CATEGORY_LEVELS = {
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "WARNING": LogLevel.WARNING,
+    "ERROR": LogLevel.ERROR,
+    "PLAYER": LogLevel.INFO,
+    "LASER": LogLevel.INFO,
+    "STATE": LogLevel.INFO,
+    "SECTION": LogLevel.INFO,
+    "SEP": LogLevel.INFO,
+}
+
+# 本番（DEBUG=False）でのカテゴリ別閾値
+# 詳細ログ（プレイヤー操作・レーザー・状態遷移・デバッグ）と区切り線は出力しない
+PRODUCTION_THRESHOLDS = {
+    "PLAYER": LogLevel.WARNING,
+    "LASER": LogLevel.WARNING,
+    "STATE": LogLevel.WARNING,
+    "DEBUG": LogLevel.OFF,
+    "SECTION": LogLevel.WARNING,
+    "SEP": LogLevel.WARNING,
+}
+
+
+class _LogWriter(threading.Thread):
+    """
+    ログレコードをキューから受け取り、まとめてファイルに書き込むバックグラウンドスレッド
+
+    書き込みは一定行数（FLUSH_LINES）に達したとき、または最初の未書き込み行から
+    FLUSH_INTERVAL秒経過したときにまとめて行う。ゲームループ側はキューに積むだけなので
+    同期的なファイルI/Oでフレーム時間が伸びることはない。
+    """
+
+    FLUSH_INTERVAL = 0.25  # 秒
+    FLUSH_LINES = 64
+
+    _STOP = object()  # 終了要求マーカー
+
+    def __init__(self, path, formatter):
+        super().__init__(name="GameLoggerWriter", daemon=True)
+        self.path = path
+        self.formatter = formatter  # レコード -> 1行の文字列
+        self._queue = queue.SimpleQueue()
+
+    def put(self, record):
+        """書き込むレコードをキューに追加（スレッドセーフ・非ブロッキング）"""
+        self._queue.put(record)
+
+    def flush(self, timeout=1.0):
+        """キューに積まれた行が書き込まれるまで待つ"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout=2.0):
+        """残りの行を書き出してスレッドを終了"""
+        self._queue.put(self._STOP)
+        self.join(timeout)
+
+    def run(self):
+        pending = []
+        deadline = None
+        try:
+            log_file = open(self.path, 'a', encoding='utf-8')
+        except OSError as e:
+            if DEBUG:
+                print(f"Failed to open log file: {e}")
+            log_file = None
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if item is None or item is self._STOP or isinstance(item, threading.Event):
+                    self._write_lines(log_file, pending)
+                    deadline = None
+                    if item is self._STOP:
+                        break
+                    if item is not None:
+                        item.set()
+                    continue
+
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.FLUSH_INTERVAL
+                if len(pending) >= self.FLUSH_LINES:
+                    self._write_lines(log_file, pending)
+                    deadline = None
+        finally:
+            if log_file is not None:
+                log_file.close()
+
+    def _write_lines(self, log_file, pending):
+        """未書き込みのレコードを整形してまとめて書き込む"""
+        if not pending:
+            return
+        if log_file is not None:
+            try:
+                log_file.write("\n".join(map(self.formatter, pending)) + "\n")
+                log_file.flush()
+            except OSError as e:
+                if DEBUG:
+                    print(f"Failed to write to log file: {e}")
+        pending.clear()
+
+
 class GameLogger:
-    """ゲーム全体の統一ログシステム"""
+    """
+    ゲーム全体の統一ログシステム
+
+    メッセージは %-style の引数、またはメッセージを返す callable で渡せる。
+    カテゴリの閾値で除外されたメッセージは整形されないため、
+    呼び出し側のコストはレベル判定1回だけになる。
+
+        logger.player_action("Locked Enemy ID: %s (Total: %d)", enemy_id, count)
+        logger.debug(lambda: expensive_dump())
+    """
     
     _instance = None
     _log_file = "debug_log/debug.log"
+    _writer = None  # バックグラウンド書き込みスレッド
     
     def __new__(cls):
         if cls._instance is None:
@@ -23,9 +159,35 @@ class GameLogger:
     def __init__(self):
         if not self._initialized:
             self._initialized = True
+            self._init_clock()
+            self._init_levels()
             self._clear_log()
+            self._writer = _LogWriter(self._log_file, self._format_record)
+            self._writer.start()
+            # 正常終了・未処理例外での終了どちらでも残りのログを書き出す
+            atexit.register(self.close)
             self.log("=== ChromeBlaze Game Session Started ===")
     
+    def _init_clock(self):
+        """モノトニック時計と壁時計（0時からの秒数）の対応を記録"""
+        now = datetime.datetime.now()
+        self._monotonic_origin = time.monotonic()
+        self._wall_origin = (now.hour * 3600 + now.minute * 60 + now.second
+                             + now.microsecond / 1_000_000)
+    
+    def _init_levels(self):
+        """カテゴリ別閾値の初期化（DEBUG時は全カテゴリを出力）"""
+        self._thresholds = {} if DEBUG else dict(PRODUCTION_THRESHOLDS)
+        self._enabled = {}
+        self._rebuild_enabled()
+    
+    def _rebuild_enabled(self):
+        """カテゴリ -> 出力可否 の判定表を作り直す"""
+        self._enabled = {
+            category: level >= self.get_level(category)
+            for category, level in CATEGORY_LEVELS.items()
+        }
+    
     def _clear_log(self):
         """ログファイルをクリア"""
         try:
@@ -37,68 +199,144 @@ class GameLogger:
             if DEBUG:
                 print(f"Failed to clear log file: {e}")
     
-    def _get_timestamp(self):
-        """現在時刻のタイムスタンプを取得"""
-        return datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    # === レベル設定 ===
+    
+    def get_level(self, category):
+        """カテゴリの閾値を取得"""
+        return self._thresholds.get(category, LogLevel.DEBUG if DEBUG else LogLevel.INFO)
+    
+    def set_level(self, category, level):
+        """カテゴリの閾値を設定（LogLevel.OFFで無効化）"""
+        self._thresholds[category] = LogLevel(level)
+        self._rebuild_enabled()
     
-    def log(self, message, category="INFO"):
-        """統一ログ出力"""
-        timestamp = self._get_timestamp()
-        formatted_message = f"[{timestamp}] {category}: {message}"
+    def is_enabled(self, category):
+        """カテゴリのメッセージが出力されるか"""
+        enabled = self._enabled.get(category)
+        if enabled is None:
+            return CATEGORY_LEVELS.get(category, LogLevel.INFO) >= self.get_level(category)
+        return enabled
+    
+    # === 整形 ===
+    
+    def _get_timestamp(self, monotonic_time):
+        """モノトニック時刻を HH:MM:SS.mmm 形式に変換（書き込み時のみ呼ばれる）"""
+        seconds = self._wall_origin + (monotonic_time - self._monotonic_origin)
+        milliseconds = int(seconds * 1000) % 86_400_000
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+    
+    def _format_record(self, record):
+        """レコード (時刻, カテゴリ, 本文) を1行に整形"""
+        monotonic_time, category, text = record
+        return f"[{self._get_timestamp(monotonic_time)}] {category}: {text}"
+    
+    @staticmethod
+    def _render(message, args):
+        """遅延メッセージを文字列化（callable は呼び出し、引数は %-style で埋め込む）"""
+        if callable(message):
+            message = message()
+        if args:
+            return str(message) % args
+        return str(message)
+    
+    # === 出力 ===
+    
+    def log(self, message, category="INFO", *args):
+        """統一ログ出力（閾値で除外されたカテゴリは整形しない）"""
+        if not self.is_enabled(category):
+            return
+        self._emit(category, message, args)
+    
+    def _emit(self, category, message, args):
+        """メッセージを整形してキューに積む"""
+        record = (time.monotonic(), category, self._render(message, args))
         
         # コンソールにも出力（DEBUGフラグで制御）
         if DEBUG:
-            print(formatted_message)
+            print(self._format_record(record))
         
-        # ファイルに出力（DEBUGフラグに関係なく常に出力）
+        # ファイルに出力
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            writer.put(record)
+        else:
+            self._write_direct(record)
+
+    def _write_direct(self, record):
+        """書き込みスレッドが使えない場合（終了処理後など）の同期書き込み"""
         try:
             # debug_log/ディレクトリが存在しない場合は作成
             os.makedirs(os.path.dirname(self._log_file), exist_ok=True)
             with open(self._log_file, 'a', encoding='utf-8') as f:
-                f.write(formatted_message + "\n")
-                f.flush()  # 即座にファイルに書き込み
+                f.write(self._format_record(record) + "\n")
         except Exception as e:
             if DEBUG:
                 print(f"Failed to write to log file: {e}")
+
+    def flush(self):
+        """キューに溜まったログをファイルに書き出すまで待つ"""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            writer.flush()
+
+    def close(self):
+        """残りのログを書き出して書き込みスレッドを停止"""
+        writer = self._writer
+        self._writer = None
+        if writer is not None and writer.is_alive():
+            writer.stop()
     
-    def debug(self, message):
+    def debug(self, message, *args):
         """デバッグレベルのログ"""
-        self.log(message, "DEBUG")
+        if self._enabled["DEBUG"]:
+            self._emit("DEBUG", message, args)
     
-    def info(self, message):
+    def info(self, message, *args):
         """情報レベルのログ"""
-        self.log(message, "INFO")
+        if self._enabled["INFO"]:
+            self._emit("INFO", message, args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """警告レベルのログ"""
-        self.log(message, "WARNING")
+        if self._enabled["WARNING"]:
+            self._emit("WARNING", message, args)
     
-    def error(self, message):
+    def error(self, message, *args):
         """エラーレベルのログ"""
-        self.log(message, "ERROR")
+        if self._enabled["ERROR"]:
+            self._emit("ERROR", message, args)
     
-    def player_action(self, message):
+    def player_action(self, message, *args):
         """プレイヤーアクション専用ログ"""
-        self.log(message, "PLAYER")
+        if self._enabled["PLAYER"]:
+            self._emit("PLAYER", message, args)
     
-    def laser_event(self, message):
+    def laser_event(self, message, *args):
         """レーザーイベント専用ログ"""
-        self.log(message, "LASER")
+        if self._enabled["LASER"]:
+            self._emit("LASER", message, args)
     
-    def state_change(self, message):
+    def state_change(self, message, *args):
         """状態変化専用ログ"""
-        self.log(message, "STATE")
+        if self._enabled["STATE"]:
+            self._emit("STATE", message, args)
     
     def section(self, title):
         """セクション区切り"""
+        if not self._enabled["SECTION"]:
+            return
         separator = "=" * 50
-        self.log(separator, "SECTION")
-        self.log(f" {title} ", "SECTION")
-        self.log(separator, "SECTION")
+        self._emit("SECTION", separator, ())
+        self._emit("SECTION", " %s ", (title,))
+        self._emit("SECTION", separator, ())
     
     def separator(self):
         """簡単な区切り線"""
-        self.log("-" * 30, "SEP")
+        if self._enabled["SEP"]:
+            self._emit("SEP", "-" * 30, ())
 
 # グローバルインスタンス
 logger = GameLogger()
\ No newline at end of file
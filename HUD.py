@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+HUD for ChromeBlaze
+値が変わったときだけ文字列を作り直すHUD（オフスクリーンイメージにキャッシュ）
+
+各行は表示元の値と、値から (文字列, 色) を作る render 関数を持つ。
+set() で渡された値が前回と同じなら何もせず、変わったときだけ
+オフスクリーンの pyxel.Image の担当行を描き直す。
+draw() はキャッシュ済みの行を pyxel.blt で転送するだけなので、毎フレームの文字列整形が不要になる。
+
+    hud = HUD()
+    hud.add_line("lock", 44, 20, lambda count: f"({count}/10)" if count else None, pyxel.COLOR_CYAN)
+    hud.set("lock", len(player.lock_enemy_list))
+    hud.draw(canvas)
+"""
+
+import pyxel
+from Common import SCREEN_WIDTH
+from RenderQueue import FONT_WIDTH, FONT_HEIGHT
+
+# キャッシュ画像の1行の高さ（ピクセル）
+LINE_HEIGHT = 8
+
+# まだ値が設定されていないことを表す値
+_UNSET = object()
+
+
+class HudLine:
+    """HUDの1行（表示位置・キャッシュ画像内の行・現在の値）"""
+
+    __slots__ = ("name", "x", "y", "render", "color", "row", "value", "width", "visible")
+
+    def __init__(self, name, x, y, render, color, row):
+        self.name = name
+        self.x = x
+        self.y = y
+        self.render = render  # value -> 文字列 / (文字列, 色) / None（非表示）
+        self.color = color    # renderが文字列だけを返した場合の色
+        self.row = row        # キャッシュ画像内の行番号
+        self.value = _UNSET
+        self.width = 0        # キャッシュ済み文字列の幅（ピクセル）
+        self.visible = False
+
+
+class HUD:
+    """
+    テキスト行をオフスクリーンイメージにキャッシュして描画するHUD
+
+    行ごとに LINE_HEIGHT ピクセルの帯を割り当て、値が変わったときだけその帯を描き直す。
+    透過色は黒（COLOR_BLACK）なので、黒い文字は使わない。
+    """
+
+    def __init__(self, max_lines=32, width=SCREEN_WIDTH):
+        self.width = width
+        self.max_lines = max_lines
+        self.image = pyxel.Image(width, LINE_HEIGHT * max_lines)
+        self.image.cls(pyxel.COLOR_BLACK)
+        self.lines = {}  # 名前 -> HudLine（追加順に描画）
+        self.renders = 0  # 行を描き直した回数（キャッシュの効き具合の確認用）
+
+    def add_line(self, name, x, y, render, color=pyxel.COLOR_WHITE, value=_UNSET):
+        """
+        行を追加
+
+        Args:
+            name: 行の名前（set() で指定する）
+            x, y: 画面上の表示位置
+            render: 値から表示内容を作る関数。文字列、(文字列, 色)、または非表示ならNoneを返す
+            color: renderが文字列だけを返した場合の色
+            value: 初期値（指定すると追加時に描画する。固定テキストの行など）
+        """
+        if len(self.lines) >= self.max_lines:
+            raise ValueError(f"HUD has no free line for '{name}' (max_lines={self.max_lines})")
+        line = HudLine(name, x, y, render, color, len(self.lines))
+        self.lines[name] = line
+        if value is not _UNSET:
+            self.set(name, value)
+        return line
+
+    def add_text(self, name, x, y, text, color=pyxel.COLOR_WHITE):
+        """固定テキストの行を追加（追加時に1回だけ描画）"""
+        return self.add_line(name, x, y, lambda _: text, color, value=None)
+
+    def set(self, name, value):
+        """行の値を設定（前回と同じ値なら何もしない）"""
+        line = self.lines[name]
+        if line.value is not _UNSET and line.value == value:
+            return
+        line.value = value
+        self._render(line)
+
+    def _render(self, line):
+        """行のキャッシュを描き直す"""
+        self.renders += 1
+        top = line.row * LINE_HEIGHT
+        self.image.rect(0, top, self.width, LINE_HEIGHT, pyxel.COLOR_BLACK)
+
+        content = line.render(line.value)
+        if content is None:
+            line.visible = False
+            return
+        if isinstance(content, tuple):
+            text, color = content
+        else:
+            text, color = content, line.color
+        self.image.text(0, top, text, color)
+        line.width = min(len(text) * FONT_WIDTH, self.width)
+        line.visible = line.width > 0
+
+    def invalidate(self):
+        """全行のキャッシュを捨てる（次の set() で必ず描き直す）"""
+        for line in self.lines.values():
+            line.value = _UNSET
+            line.visible = False
+
+    def draw(self, canvas=pyxel):
+        """キャッシュ済みの行を転送（canvasはpyxelまたはRenderQueueのレイヤー）"""
+        image = self.image
+        for line in self.lines.values():
+            if line.visible:
+                canvas.blt(line.x, line.y, image, 0, line.row * LINE_HEIGHT,
+                           line.width, FONT_HEIGHT, pyxel.COLOR_BLACK)
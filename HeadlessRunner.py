@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+Headless Runner for ChromeBlaze
+ウィンドウなしで GamePlayState を最大速度で回すシミュレーションランナー
+
+pyxel.init を呼ばずに、描画関数を何もしないヌルバックエンドに差し替え、
+InputSystem の入力ソース（スクリプト・テキスト入力ファイル・リプレイ）で
+GamePlayState.update / draw を実行する。
+ベンチマーク・長時間テスト・バランス調整の土台として使う。
+
+実行方法（リポジトリのルートで）:
+    python HeadlessRunner.py --frames 3600 --script patrol --seed 1
+    python HeadlessRunner.py --frames 600 --input-file my_input.txt --no-draw
+    python HeadlessRunner.py --replay session.cbrp          # 記録したリプレイを再生
+    python HeadlessRunner.py --frames 3600 --record out.cbrp  # スクリプト入力をリプレイとして保存
+    python HeadlessRunner.py --frames 3600 --profile   # サブシステム別の処理時間も表示
+    python HeadlessRunner.py --frames 600 --scenario heavy --profile  # 負荷シナリオ
+    python HeadlessRunner.py --frames 600 --enemies 3000 --lasers 128 --seed 7
+    python HeadlessRunner.py --frames 1800 --check-roundtrip  # ウィンドウ版の記録→ヘッドレス再生の一致確認
+    python HeadlessRunner.py --check-enemy-sleep  # ビューポートを動かしてエネミーの間引き更新を確認
+"""
+
+import argparse
+import sys
+import time
+import pyxel
+from Common import FIXED_DT, SCREEN_WIDTH, SCREEN_HEIGHT, SPRITE_SIZE, check_collision
+from FrameProfiler import profiler
+from EventLog import event_log
+from RandomService import rng_service
+from StressScenario import StressScenario, SCENARIOS as STRESS_SCENARIOS
+from RenderQueue import PyxelBackend, RecordingBackend
+from InputSystem import (input_manager, Button, Replay, ScriptedInputSource,
+                         ReplayInputSource)
+
+# ヌルバックエンドで差し替える描画関数
+DRAW_FUNCTIONS = (
+    "cls", "pset", "line", "rect", "rectb", "circ", "circb",
+    "elli", "ellib", "tri", "trib", "blt", "text",
+)
+
+# ヌルバックエンドで差し替える入力関数（ゲーム入力はInputSystem経由なので常に未押下）
+INPUT_FUNCTIONS = ("btn", "btnp", "btnr")
+
+
+# === 組み込みスクリプト ===
+
+def idle_script(frame):
+    """何も押さない"""
+    return 0
+
+
+def patrol_script(frame):
+    """
+    左右に往復しながらショットを撃ち続け、ロックオン→A離しでレーザー発射を繰り返す
+
+    - 120フレーム周期で左右移動
+    - Zは常時押下（クールダウンごとにショット）
+    - 90フレーム周期で A を60フレーム押して離す（ロックオン→一斉発射）
+    """
+    mask = Button.SHOT
+    mask |= Button.LEFT if (frame // 120) % 2 == 0 else Button.RIGHT
+    if frame % 90 < 60:
+        mask |= Button.LOCK
+    return mask
+
+
+SCRIPTS = {
+    "idle": idle_script,
+    "patrol": patrol_script,
+}
+
+
+class NullBackend:
+    """
+    pyxelの描画関数・入力関数を差し替えるコンテキストマネージャ
+
+    with ブロック内では描画関数は呼び出し回数を数えるだけになり、
+    pyxel.btn / btnp / btnr は常にFalseを返す。終了時に元の関数へ戻す。
+    """
+
+    def __init__(self):
+        self.draw_calls = {name: 0 for name in DRAW_FUNCTIONS}
+        self._originals = {}
+
+    def _make_draw_stub(self, name):
+        draw_calls = self.draw_calls
+
+        def stub(*args, **kwargs):
+            draw_calls[name] += 1
+
+        return stub
+
+    def __enter__(self):
+        for name in DRAW_FUNCTIONS:
+            if hasattr(pyxel, name):
+                self._originals[name] = getattr(pyxel, name)
+                setattr(pyxel, name, self._make_draw_stub(name))
+        for name in INPUT_FUNCTIONS:
+            if hasattr(pyxel, name):
+                self._originals[name] = getattr(pyxel, name)
+                setattr(pyxel, name, self._released)
+        return self
+
+    def __exit__(self, *exc_info):
+        for name, original in self._originals.items():
+            setattr(pyxel, name, original)
+        self._originals.clear()
+        return False
+
+    @staticmethod
+    def _released(*args, **kwargs):
+        return False
+
+    def total_draw_calls(self):
+        return sum(self.draw_calls.values())
+
+
+class HeadlessRunner:
+    """GamePlayState をウィンドウなしで指定フレーム数だけ実行するランナー"""
+
+    def __init__(self, input_source, frames=3600, seed=None, draw=True, delta_time=FIXED_DT,
+                 record=False, on_frame=None, scenario=None):
+        """
+        Args:
+            input_source: InputSystemの入力ソース（read(frame) でビットマスクを返す）
+            frames: 実行するフレーム数
+            seed: 乱数シード（Noneの場合は新しいシードを生成）
+            draw: Trueの場合は毎フレーム draw() もヌルバックエンドで実行
+            delta_time: 1フレームのシミュレーション時間（秒）
+            record: Trueの場合は入力とシードをリプレイとして記録（self.replay）
+            on_frame: 毎フレーム update の前に呼ばれる関数 on_frame(state, frame)
+            scenario: StressScenario（生成直後の状態に適用し、on_frame未指定ならその補充処理を使う）
+        """
+        self.input_source = input_source
+        self.frames = frames
+        self.seed = seed
+        self.draw = draw
+        self.delta_time = delta_time
+        self.record = record
+        self.on_frame = on_frame
+        if scenario is not None and on_frame is None:
+            self.on_frame = scenario.on_frame
+        self.scenario = scenario
+        self.replay = None
+        self.state = None
+
+    def create_state(self):
+        """GamePlayStateを生成（シード設定後に呼ぶ）"""
+        from State_Game import GamePlayState
+        return GamePlayState()
+
+    def run(self):
+        """
+        シミュレーションを実行して結果を返す
+
+        Returns:
+            dict: frames, seconds, fps, draw_calls, layer_calls, culled, active_enemies,
+                  visibility, bullet_hits, lasers, bullets
+        """
+        rng_service.reseed(self.seed)
+        input_manager.set_source(self.input_source)
+        if self.record:
+            input_manager.start_recording(rng_service.seed)
+
+        with NullBackend() as backend:
+            self.state = state = self.create_state()
+            if self.scenario is not None:
+                self.scenario.apply(state)
+            # レンダーキューの描画コールをレイヤー別に数える（数えた後はヌルバックエンドへ転送）
+            recorder = state.render_queue.backend = RecordingBackend(PyxelBackend())
+            culled = 0
+            delta_time = self.delta_time
+            draw = self.draw
+            on_frame = self.on_frame
+
+            start = time.perf_counter()
+            for frame in range(self.frames):
+                input_manager.begin_frame()
+                if on_frame is not None:
+                    on_frame(state, frame)
+                state.update(delta_time)
+                if draw:
+                    state.draw()
+                    culled += state.render_queue.last_culled
+            seconds = time.perf_counter() - start
+
+        if self.record:
+            self.replay = input_manager.stop_recording()
+
+        return {
+            "frames": self.frames,
+            "seconds": seconds,
+            "fps": self.frames / seconds if seconds > 0 else float("inf"),
+            "draw_calls": dict(backend.draw_calls),
+            "layer_calls": recorder.layer_totals(),
+            "culled": culled,
+            "active_enemies": state.enemy_manager.get_active_count(),
+            "visibility": {visibility.value: count for visibility, count
+                           in state.enemy_manager.get_visibility_counts().items()},
+            "bullet_hits": state.collision_system.hit_count,
+            "lasers": state.player.laser_swarm.active_count(),
+            "bullets": state.player.bullets.count,
+        }
+
+
+# === 記録・再生の往復確認 ===
+
+# 往復確認でロゴ→タイトル→ゲーム本編へ進むために START を押すフレーム
+ROUNDTRIP_MENU_PRESSES = (30, 60)
+
+
+def state_snapshot(state):
+    """再現性の比較に使うゲーム本編の状態（フレーム数・自機・エネミー・弾・レーザー）"""
+    player = state.player
+    return {
+        "frame": state.frame_count,
+        "player": (player.x, player.y, player.lock_state.value, tuple(player.lock_enemy_list)),
+        "enemies": [(enemy.enemy_id, enemy.x, enemy.y) for enemy in state.enemy_manager.iter_active_enemies()],
+        "bullet_hits": state.collision_system.hit_count,
+        "bullets": player.bullets.count,
+        "lasers": player.laser_swarm.active_count(),
+    }
+
+
+def record_windowed_session(script, frames, seed):
+    """
+    ウィンドウ版と同じ main.Game（ロゴ→タイトル→ゲーム本編）をヌルバックエンドで回して入力を記録
+
+    App.update と同じく1ステップごとに begin_frame → Game.update → Game.draw を呼ぶ。
+    ロゴとタイトルは ROUNDTRIP_MENU_PRESSES のフレームで START を押して進め、
+    ゲーム本編に入ってから frames フレーム分 script の入力を与える。
+
+    Returns:
+        tuple: (記録したReplay, 最後のGamePlayState)
+    """
+    from main import Game
+    from Common import GameState
+
+    menu_frames = ROUNDTRIP_MENU_PRESSES[-1] + 1
+
+    def session_script(frame):
+        if frame < menu_frames:
+            return Button.START if frame in ROUNDTRIP_MENU_PRESSES else 0
+        return script(frame - menu_frames)
+
+    input_manager.set_source(ScriptedInputSource(session_script))
+    with NullBackend():
+        game = Game(record_seed=seed)
+        for _ in range(menu_frames):
+            input_manager.begin_frame()
+            game.update(FIXED_DT)
+            game.draw()
+        if game.state != GameState.GAME:
+            raise RuntimeError(f"Session did not reach the game state (state={game.state.value})")
+        for _ in range(frames):
+            input_manager.begin_frame()
+            game.update(FIXED_DT)
+            game.draw()
+    return game.stop_recording(), game.game_state
+
+
+def check_roundtrip(script, frames, seed):
+    """
+    ウィンドウ版の手順で記録したリプレイをヘッドレスで再生し、最終状態が一致するか確認
+
+    Returns:
+        tuple: (一致したか, 記録側のスナップショット, 再生側のスナップショット, Replay)
+    """
+    replay, recorded_state = record_windowed_session(script, frames, seed)
+    runner = HeadlessRunner(ReplayInputSource(replay), frames=len(replay), seed=replay.seed)
+    runner.run()
+    expected = state_snapshot(recorded_state)
+    actual = state_snapshot(runner.state)
+    return expected == actual, expected, actual, replay
+
+
+# === エネミーの間引き更新の確認 ===
+
+# 確認用のワールド幅（画面何枚分か）
+SLEEP_CHECK_WORLD_SCREENS = 4
+
+
+def check_enemy_sleep(enemy_count=400, seed=0):
+    """
+    画面より広いワールドにエネミーを配置し、ビューポートを動かして間引き更新を確認
+
+    確認する内容:
+        - ビューポート外のマージンより遠いエネミーが眠る（ASLEEP）
+        - 眠っているエネミーは sleep_interval フレームに1回ずつ、フレームをずらして更新される
+        - 描画されるのはビューポート内（VISIBLE）のエネミーだけ
+        - ビューポートを動かすと、新しいビューポート周辺のエネミーが sleep_interval フレーム以内に起きる
+        - 空間ハッシュがワールド全体を覆い、動かしたビューポートでの検索結果が全件走査と一致する
+
+    Returns:
+        list: 失敗した項目のメッセージ（空なら成功）
+    """
+    from Enemy import EnemyManager, Visibility
+    from SpriteManager import sprite_manager
+
+    rng_service.reseed(seed)
+    world_width = SCREEN_WIDTH * SLEEP_CHECK_WORLD_SCREENS
+    manager = EnemyManager(SPRITE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, spawn_defaults=False,
+                           world_bounds=(0, 0, world_width - SPRITE_SIZE, SCREEN_HEIGHT // 2))
+    rng = rng_service.stream("check")
+    for _ in range(enemy_count):
+        manager.spawn_enemy(rng.uniform(0, world_width - SPRITE_SIZE), rng.uniform(0, SCREEN_HEIGHT // 2))
+
+    failures = []
+    interval = manager.sleep_interval
+
+    def check_frame(label):
+        """1フレーム更新して、眠っているエネミーの更新がIDでずれているかと描画を確認"""
+        sleeping = [enemy for enemy in manager.iter_active_enemies() if enemy.visibility is Visibility.ASLEEP]
+        manager.update(FIXED_DT)
+        woken = {enemy.enemy_id for enemy in sleeping if enemy.sleep_time == 0.0}
+        expected = {enemy.enemy_id for enemy in sleeping if (manager.frame + enemy.enemy_id) % interval == 0}
+        if woken != expected:
+            failures.append(f"{label}: updated {len(woken)} sleeping enemies, expected {len(expected)} "
+                            f"(enemy_id + frame divisible by {interval})")
+
+        canvas = DrawCounter()
+        manager.draw(sprite_manager, canvas)
+        visible = sorted((int(enemy.x), int(enemy.y)) for enemy in manager.iter_active_enemies()
+                         if enemy.visibility is Visibility.VISIBLE)
+        if sorted(canvas.positions) != visible:
+            failures.append(f"{label}: drew {len(canvas.positions)} enemies, {len(visible)} are visible")
+        return {enemy.enemy_id for enemy in sleeping}, woken
+
+    # 最初のビューポート（ワールド左端）: 遠くのエネミーは眠り、1周期でちょうど1回ずつ更新される
+    manager.update(FIXED_DT)
+    counts = manager.get_visibility_counts()
+    if counts[Visibility.ASLEEP] == 0 or counts[Visibility.VISIBLE] == 0:
+        failures.append(f"initial viewport: expected visible and asleep enemies, got {counts}")
+    always_asleep = None
+    updates = {}
+    for frame in range(interval):
+        sleeping, woken = check_frame(f"frame {frame}")
+        always_asleep = sleeping if always_asleep is None else always_asleep & sleeping
+        for enemy_id in woken:
+            updates[enemy_id] = updates.get(enemy_id, 0) + 1
+    missed = [enemy_id for enemy_id in always_asleep if updates.get(enemy_id) != 1]
+    if missed:
+        failures.append(f"{len(missed)} sleeping enemies were not updated exactly once per {interval} frames")
+
+    # ビューポートをワールド中央へ移動: 周辺のエネミーが sleep_interval フレーム以内に起きる
+    view_x = (world_width - SCREEN_WIDTH) // 2
+    manager.set_viewport(view_x, 0)
+    for frame in range(interval):
+        check_frame(f"moved frame {frame}")
+    margin = manager.wake_margin
+    stale = [enemy.enemy_id for enemy in manager.iter_active_enemies()
+             if enemy.visibility is Visibility.ASLEEP
+             and view_x - margin < enemy.x + SPRITE_SIZE and enemy.x < view_x + SCREEN_WIDTH + margin]
+    if stale:
+        failures.append(f"{len(stale)} enemies near the moved viewport are still asleep after {interval} frames")
+    counts = manager.get_visibility_counts()
+    if counts[Visibility.VISIBLE] == 0:
+        failures.append(f"moved viewport: no visible enemies ({counts})")
+
+    # 空間ハッシュ: 起きているエネミーが端のセルにクランプされず、検索結果が全件走査と一致する
+    spatial_hash = manager.spatial_hash
+    hash_right = spatial_hash.origin_x + spatial_hash.cols * spatial_hash.cell_size
+    hash_bottom = spatial_hash.origin_y + spatial_hash.rows * spatial_hash.cell_size
+    awake = [enemy for enemy in manager.iter_active_enemies() if enemy.visibility is not Visibility.ASLEEP]
+    clamped = [enemy.enemy_id for enemy in awake
+               if enemy.x < spatial_hash.origin_x or enemy.y < spatial_hash.origin_y
+               or enemy.x + SPRITE_SIZE > hash_right or enemy.y + SPRITE_SIZE > hash_bottom]
+    if clamped:
+        failures.append(f"{len(clamped)} awake enemies lie outside the spatial hash area")
+    query_size = SPRITE_SIZE * 2
+    for query_x in range(view_x - margin, view_x + SCREEN_WIDTH + margin, query_size):
+        for query_y in range(0, SCREEN_HEIGHT // 2, query_size):
+            found = {enemy.enemy_id for enemy in manager.query_rect(query_x, query_y, query_size, query_size)}
+            expected = {enemy.enemy_id for enemy in awake
+                        if check_collision(query_x, query_y, query_size, query_size,
+                                           enemy.x, enemy.y, SPRITE_SIZE, SPRITE_SIZE)}
+            if found != expected:
+                failures.append(f"query_rect({query_x}, {query_y}): found {len(found)} enemies, "
+                                f"expected {len(expected)}")
+    return failures
+
+
+class DrawCounter:
+    """bltされた位置を記録するキャンバス（RenderQueueと違い画面外もカリングしない）"""
+
+    def __init__(self):
+        self.positions = []
+
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        self.positions.append((x, y))
+
+
+def print_report(result, script_name, scenario=None):
+    """実行結果を表示"""
+    print("=== ChromeBlaze headless simulation ===")
+    print(f"Input      : {script_name}")
+    if scenario is not None:
+        print(f"Scenario   : {scenario.describe()}")
+    print(f"Frames     : {result['frames']}")
+    print(f"Time       : {result['seconds']:.3f} s")
+    print(f"Sim FPS    : {result['fps']:.1f} ({result['fps'] / (1.0 / FIXED_DT):.1f}x realtime)")
+    print(f"Enemies    : {result['active_enemies']} active, {result['bullet_hits']} bullet hits")
+    visibility = ", ".join(f"{count} {name}" for name, count in result["visibility"].items())
+    print(f"Visibility : {visibility}")
+    print(f"Lasers     : {result['lasers']} active, {result['bullets']} bullets")
+    calls = {name: count for name, count in result["draw_calls"].items() if count}
+    if calls:
+        per_frame = sum(calls.values()) / result["frames"]
+        print(f"Draw calls : {per_frame:.1f}/frame {calls}")
+    if result["layer_calls"]:
+        frames = result["frames"]
+        layers = ", ".join(f"{name} {count / frames:.1f}" for name, count in result["layer_calls"].items())
+        print(f"Layers     : {layers} (/frame), culled {result['culled'] / frames:.1f}/frame")
+
+
+def print_profile(rows):
+    """プロファイラーの統計を表示"""
+    print(f"{'Scope':16s} {'samples':>8s} {'mean':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s} (ms)")
+    for name, count, mean, p50, p95, p99, _ in rows:
+        print(f"{name:16s} {count:8d} {mean:8.4f} {p50:8.4f} {p95:8.4f} {p99:8.4f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run GamePlayState headless at maximum speed")
+    parser.add_argument("--frames", type=int, help="number of frames to simulate "
+                        "(default: replay length, or 3600)")
+    parser.add_argument("--script", choices=sorted(SCRIPTS), default="patrol",
+                        help="built-in input script")
+    parser.add_argument("--input-file", help="text input file (one line of key names per frame)")
+    parser.add_argument("--replay", help="binary replay file (overrides --script, --input-file and --seed)")
+    parser.add_argument("--record", help="save the simulated input and seed as a replay file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--no-draw", action="store_true", help="skip draw() entirely")
+    parser.add_argument("--profile", action="store_true",
+                        help="enable the frame profiler and print per-scope timings")
+    parser.add_argument("--scenario", choices=sorted(STRESS_SCENARIOS),
+                        help="stress scenario preset (overrides --script)")
+    parser.add_argument("--enemies", type=int, help="stress scenario: number of enemies to keep alive")
+    parser.add_argument("--density", type=float, help="stress scenario: enemies per 8x8 cell (overrides --enemies)")
+    parser.add_argument("--lasers", type=int, help="stress scenario: laser volley capacity")
+    parser.add_argument("--events", action="store_true",
+                        help="write structured gameplay events to debug_log/events/ (off by default)")
+    parser.add_argument("--check-roundtrip", action="store_true",
+                        help="record --script through the windowed game flow, replay it headless "
+                             "and compare the final state")
+    parser.add_argument("--check-enemy-sleep", action="store_true",
+                        help="move the enemy viewport across a wide world and check sleeping, "
+                             "staggered wake-up and draw exclusion")
+    args = parser.parse_args(argv)
+
+    # 構造化イベントログは --events 指定時のみ（大量のヒットイベントの書き込みで計測がぶれるため）
+    event_log.configure(enabled=args.events)
+
+    if args.check_enemy_sleep:
+        failures = check_enemy_sleep(seed=args.seed)
+        print("=== ChromeBlaze enemy sleep check ===")
+        for failure in failures:
+            print(f"Failure    : {failure}")
+        print(f"Result     : {'OK' if not failures else 'FAILED'}")
+        return 0 if not failures else 1
+
+    if args.check_roundtrip:
+        frames = args.frames or 3600
+        matched, expected, actual, replay = check_roundtrip(SCRIPTS[args.script], frames, args.seed)
+        print("=== ChromeBlaze record/replay round trip ===")
+        print(f"Input      : {args.script} ({len(replay)} recorded frames, seed={replay.seed})")
+        for key in expected:
+            if expected[key] != actual[key]:
+                print(f"Mismatch   : {key}: recorded {expected[key]!r}, replayed {actual[key]!r}")
+        print(f"Result     : {'OK' if matched else 'MISMATCH'}")
+        return 0 if matched else 1
+
+    if args.profile:
+        profiler.set_enabled(True)
+
+    scenario = None
+    if args.scenario or args.enemies is not None or args.density is not None or args.lasers is not None:
+        if args.record:
+            # リプレイには入力とシードしか入らないため、シナリオ付きの記録は再現できない
+            parser.error("--record cannot be combined with --scenario/--enemies/--density/--lasers")
+        params = dict(STRESS_SCENARIOS.get(args.scenario, {}))
+        if args.enemies is not None:
+            params["enemy_count"] = args.enemies
+        if args.density is not None:
+            params["density"] = args.density
+        if args.lasers is not None:
+            params["laser_count"] = args.lasers
+        scenario = StressScenario(**params)
+
+    seed = args.seed
+    frames = args.frames or 3600
+    if args.replay:
+        replay = Replay.load(args.replay)
+        input_source = ReplayInputSource(replay)
+        script_name = f"{args.replay} ({len(replay)} frames, seed={replay.seed})"
+        seed = replay.seed
+        frames = args.frames or len(replay)
+    elif args.input_file:
+        input_source = ScriptedInputSource.from_text_file(args.input_file)
+        script_name = args.input_file
+    elif scenario is not None:
+        input_source = ScriptedInputSource(scenario.input_script)
+        script_name = f"stress scenario {args.scenario or 'custom'}"
+    else:
+        input_source = ScriptedInputSource(SCRIPTS[args.script])
+        script_name = args.script
+
+    runner = HeadlessRunner(input_source, frames=frames, seed=seed, draw=not args.no_draw,
+                            record=bool(args.record), scenario=scenario)
+    print_report(runner.run(), script_name, scenario)
+    if args.record:
+        runner.replay.save(args.record)
+        print(f"Replay     : saved {len(runner.replay)} frames to {args.record}")
+    if args.profile:
+        print_profile(profiler.stats())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
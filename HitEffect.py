@@ -1,78 +1,263 @@
 #!/usr/bin/env python3
 """
 Hit Effect System for ChromeBlaze
-ヒットエフェクトシステム
+ヒットエフェクトシステム（固定容量のパーティクルプール）
+
+円・爆発のエフェクトは EffectAtlas に事前描画したコマを pyxel.blt 1回で描画する。
+アトラス未構築（ヘッドレス実行など）の場合はプリミティブ描画にフォールバックする。
 """
 
+import math
 import pyxel
+import numpy as np
 from Common import DEBUG
+from RandomService import rng_service
+from EffectAtlas import effect_atlas
+
+# パーティクルの種類
+KIND_CIRCLE = 0  # 赤い丸（通常ヒット）
+KIND_SPARK = 1   # 火花（減速しながら飛び散る線）
+KIND_DEBRIS = 2  # 破片（重力で落下する小さな矩形）
+KIND_EXPLOSION = 3  # 爆発（広がるリング、レーザー撃破）
+
+# effect_type名 -> 種類
+EFFECT_KINDS = {
+    "circle": KIND_CIRCLE,
+    "spark": KIND_SPARK,
+    "debris": KIND_DEBRIS,
+    "explosion": KIND_EXPLOSION,
+}
+
+# その場に表示するエフェクトの設定: 種類 -> (寿命, 半径, 色)
+# 半径・色はアトラス未構築時のフォールバック描画に使う
+STATIC_EFFECTS = {
+    KIND_CIRCLE: (10, 6, pyxel.COLOR_RED),
+    KIND_EXPLOSION: (12, 7, pyxel.COLOR_ORANGE),
+}
+
+# 種類 -> EffectAtlasのクリップ名
+ATLAS_CLIPS = {
+    KIND_CIRCLE: "FX_HIT",
+    KIND_EXPLOSION: "FX_EXPLOSION",
+}
+
+# 種類ごとの速度減衰（毎フレーム速度に掛ける）と重力（毎フレームvyに足す）
+KIND_DRAG = np.array([1.0, 0.85, 0.97, 1.0])
+KIND_GRAVITY = np.array([0.0, 0.0, 0.08, 0.0])
+
+# バースト生成時の設定: 種類 -> (速度範囲, 寿命範囲, 大きさ, 色の候補)
+BURST_SETTINGS = {
+    KIND_SPARK: ((1.0, 3.0), (8, 16), 1,
+                 (pyxel.COLOR_WHITE, pyxel.COLOR_YELLOW, pyxel.COLOR_ORANGE)),
+    KIND_DEBRIS: ((0.5, 1.5), (20, 30), 2,
+                  (pyxel.COLOR_GRAY, pyxel.COLOR_BROWN, pyxel.COLOR_ORANGE)),
+}
 
-class HitEffect:
-    """ヒットエフェクトクラス"""
-    def __init__(self, x, y, effect_type="circle"):
-        self.x = x
-        self.y = y
-        self.effect_type = effect_type
-        self.duration = 10  # 10フレーム表示
-        self.timer = 0
-        self.active = True
-        
-        # エフェクトの設定
-        self.color = pyxel.COLOR_RED
-        self.radius = 6  # 円の半径
-        
-    def update(self):
-        """エフェクトの更新"""
-        if not self.active:
-            return
-            
-        self.timer += 1
-        
-        # 10フレーム経過後に非アクティブ化
-        if self.timer >= self.duration:
-            self.active = False
-    
-    def draw(self):
-        """エフェクトの描画"""
-        if not self.active:
-            return
-            
-        if self.effect_type == "circle":
-            # 赤い丸を描画
-            pyxel.circ(int(self.x), int(self.y), self.radius, self.color)
 
 class HitEffectManager:
-    """ヒットエフェクト管理クラス"""
-    def __init__(self):
-        self.effects = []
-    
+    """
+    ヒットエフェクト管理クラス
+
+    全パーティクルを事前確保した配列（struct-of-arrays）で管理する。
+    生存中のパーティクルは常に先頭の [0, count) スロットに詰めて配置し、
+    追加は末尾の空きスロットを使い（O(1)）、寿命が尽きたスロットには
+    末尾側の生存パーティクルを移して詰める（swap-remove）。
+    満杯の場合、新しいパーティクルは捨てる。
+    """
+
+    # 通常ヒット（赤い丸）の設定
+    CIRCLE_DURATION = 10  # 10フレーム表示
+    CIRCLE_RADIUS = 6     # 円の半径
+    CIRCLE_COLOR = pyxel.COLOR_RED
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.count = 0  # 生存中のパーティクル数
+
+        # パーティクルデータ（struct-of-arrays）
+        # 実数・整数のフィールドをそれぞれ1つの2次元配列の行としてまとめ、
+        # swap-removeを型ごとに1回の配列操作で行えるようにする
+        # （drag・gravity は種類ごとの値をスポーン時にコピーしておき、更新時の表引きを省く）
+        self._floats = np.zeros((6, capacity), dtype=np.float64)
+        self._ints = np.zeros((5, capacity), dtype=np.int32)
+        self.x, self.y, self.vx, self.vy, self.drag, self.gravity = self._floats
+        self.timer, self.duration, self.radius, self.color, self.kind = self._ints
+
+        # 消滅判定用の作業バッファ
+        self._expired = np.zeros(capacity, dtype=bool)
+
+        # 種類 -> アトラスのクリップ（アトラスを構築し直したときだけ作り直す）
+        self._atlas_clips = {}
+        self._atlas_generation = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, kind=KIND_CIRCLE, vx=0.0, vy=0.0, duration=CIRCLE_DURATION,
+              radius=CIRCLE_RADIUS, color=CIRCLE_COLOR):
+        """
+        空きスロットを確保してパーティクルを1個追加する
+
+        Returns:
+            int: 確保したスロット番号（満杯の場合はNone）
+        """
+        slot = self.count
+        if slot >= self.capacity:
+            return None
+        self.x[slot] = x
+        self.y[slot] = y
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.drag[slot] = KIND_DRAG[kind]
+        self.gravity[slot] = KIND_GRAVITY[kind]
+        self.timer[slot] = 0
+        self.duration[slot] = duration
+        self.radius[slot] = radius
+        self.color[slot] = color
+        self.kind[slot] = kind
+        self.count = slot + 1
+        return slot
+
     def add_effect(self, x, y, effect_type="circle"):
         """エフェクトを追加"""
-        effect = HitEffect(x, y, effect_type)
-        self.effects.append(effect)
-    
+        kind = EFFECT_KINDS.get(effect_type, KIND_CIRCLE)
+        settings = STATIC_EFFECTS.get(kind)
+        if settings is None:
+            self.add_burst(x, y, 1, effect_type)
+            return
+        duration, radius, color = settings
+        self.spawn(x, y, kind, duration=duration, radius=radius, color=color)
+
+    def add_burst(self, x, y, count, effect_type="spark"):
+        """
+        (x, y) から全方向に飛び散るパーティクルを count 個まとめて追加する
+
+        乱数は rng_service.effects からまとめて取得し、配列のスライスに直接書き込む。
+        空きが足りない場合は入る分だけ追加する。
+
+        Returns:
+            int: 追加したパーティクル数
+        """
+        kind = EFFECT_KINDS.get(effect_type, KIND_SPARK)
+        (speed_min, speed_max), (life_min, life_max), size, colors = BURST_SETTINGS.get(
+            kind, BURST_SETTINGS[KIND_SPARK])
+
+        start = self.count
+        count = min(count, self.capacity - start)
+        if count <= 0:
+            return 0
+        end = start + count
+
+        rng = rng_service.effects
+        angle = rng.uniform_array(count, 0.0, 2.0 * math.pi)
+        speed = rng.uniform_array(count, speed_min, speed_max)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        np.multiply(np.cos(angle), speed, out=self.vx[start:end])
+        np.multiply(np.sin(angle), speed, out=self.vy[start:end])
+        self.drag[start:end] = KIND_DRAG[kind]
+        self.gravity[start:end] = KIND_GRAVITY[kind]
+        self.timer[start:end] = 0
+        self.duration[start:end] = rng.uniform_array(count, life_min, life_max + 1)
+        self.radius[start:end] = size
+        self.color[start:end] = np.take(colors, rng.uniform_array(count, 0, len(colors)).astype(np.intp))
+        self.kind[start:end] = kind
+        self.count = end
+        return count
+
+    def clear(self):
+        """全パーティクルを消去"""
+        self.count = 0
+
     def update(self):
         """全エフェクトの更新"""
-        # 更新前のエフェクト数
-        before_count = len(self.effects)
-        
-        for effect in self.effects:
-            effect.update()
-        
-        # 非アクティブなエフェクトを削除
-        active_effects = [effect for effect in self.effects if effect.active]
-        removed_count = len(self.effects) - len(active_effects)
-        
-        if removed_count > 0 and DEBUG:
-            print(f"HitEffect: Removed {removed_count} effects, {len(active_effects)} remaining")
-        
-        self.effects = active_effects
-    
+        count = self.count
+        if count == 0:
+            return
+
+        floats = self._floats
+        velocity = floats[2:4, :count]
+        velocity *= floats[4, :count]
+        velocity[1] += floats[5, :count]
+        floats[0:2, :count] += velocity
+
+        timer = self.timer[:count]
+        timer += 1
+
+        # 寿命が尽きたパーティクルを削除
+        expired = self._expired[:count]
+        np.greater_equal(timer, self.duration[:count], out=expired)
+        removed_count = int(np.count_nonzero(expired))
+        if removed_count == 0:
+            return
+        self._swap_remove(expired, count - removed_count)
+
+        if DEBUG:
+            print(f"HitEffect: Removed {removed_count} effects, {self.count} remaining")
+
+    def _swap_remove(self, expired, remaining):
+        """
+        消滅したスロットを詰める
+
+        [0, remaining) 内の空きスロットへ、[remaining, count) 内の生存パーティクルを移す。
+        移動するのは空きの数だけで、生存パーティクルの順序は保証しない。
+        """
+        holes = np.flatnonzero(expired[:remaining])
+        if len(holes):
+            movers = np.flatnonzero(~expired[remaining:]) + remaining
+            self._floats[:, holes] = self._floats[:, movers]
+            self._ints[:, holes] = self._ints[:, movers]
+        self.count = remaining
+
+    def _get_atlas_clips(self):
+        """種類 -> アトラスのクリップ（未構築なら空。構築済みの種類はプリミティブ描画しない）"""
+        if self._atlas_generation != effect_atlas.generation:
+            self._atlas_clips = {kind: effect_atlas.clip(name) for kind, name in ATLAS_CLIPS.items()
+                                 if effect_atlas.clip(name) is not None}
+            self._atlas_generation = effect_atlas.generation
+        return self._atlas_clips
+
     def get_effect_count(self):
         """アクティブなエフェクト数を取得"""
-        return len(self.effects)
-    
-    def draw(self):
-        """全エフェクトの描画"""
-        for effect in self.effects:
-            effect.draw()
\ No newline at end of file
+        return self.count
+
+    def draw(self, canvas=pyxel):
+        """全エフェクトの描画（canvasはpyxelまたはRenderQueueのレイヤー）"""
+        count = self.count
+        if count == 0:
+            return
+
+        # アトラス構築済みなら 種類 -> クリップ（未構築ならプリミティブで描画）
+        clips = self._get_atlas_clips()
+        bank = effect_atlas.BANK
+        cell = effect_atlas.CELL_SIZE
+        half = cell // 2
+
+        xs = self.x[:count].tolist()
+        ys = self.y[:count].tolist()
+        vxs = self.vx[:count].tolist()
+        vys = self.vy[:count].tolist()
+        timers = self.timer[:count].tolist()
+        durations = self.duration[:count].tolist()
+        radii = self.radius[:count].tolist()
+        colors = self.color[:count].tolist()
+        kinds = self.kind[:count].tolist()
+        for i in range(count):
+            kind = kinds[i]
+            x = int(xs[i])
+            y = int(ys[i])
+            clip = clips.get(kind)
+            if clip is not None:
+                # 寿命に対する経過割合からコマを選んで1回のbltで描画
+                frame = clip.frames[timers[i] * len(clip.frames) // durations[i]]
+                canvas.blt(x - half, y - half, bank, frame.x, frame.y, cell, cell, pyxel.COLOR_BLACK)
+            elif kind == KIND_CIRCLE:
+                canvas.circ(x, y, radii[i], colors[i])
+            elif kind == KIND_EXPLOSION:
+                # 寿命に合わせて広がるリング
+                canvas.circb(x, y, 2 + (radii[i] - 2) * timers[i] // durations[i], colors[i])
+            elif kind == KIND_SPARK:
+                # 速度方向に伸びる短い線
+                canvas.line(x, y, int(xs[i] - vxs[i]), int(ys[i] - vys[i]), colors[i])
+            else:
+                canvas.rect(x, y, radii[i], radii[i], colors[i])
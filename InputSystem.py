@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Input System for ChromeBlaze
+入力抽象化（フレームごとのボタンビットマスク・記録・リプレイ）
+"""
+
+import struct
+from array import array
+from enum import IntFlag
+import pyxel
+
+
+class Button(IntFlag):
+    """ゲーム入力のボタン（1フレームの入力は16bitのビットマスク）"""
+    LEFT = 1 << 0
+    RIGHT = 1 << 1
+    UP = 1 << 2
+    DOWN = 1 << 3
+    SHOT = 1 << 4    # Z: 通常ショット
+    POWER = 1 << 5   # X: パワーレベル切り替え
+    LOCK = 1 << 6    # A: ロックオン（離して発射）
+    START = 1 << 7   # SPACE: 決定
+    QUIT = 1 << 8    # Q: タイトルへ戻る / 終了
+
+
+# ボタン -> pyxelのキー
+KEY_BINDINGS = {
+    Button.LEFT: pyxel.KEY_LEFT,
+    Button.RIGHT: pyxel.KEY_RIGHT,
+    Button.UP: pyxel.KEY_UP,
+    Button.DOWN: pyxel.KEY_DOWN,
+    Button.SHOT: pyxel.KEY_Z,
+    Button.POWER: pyxel.KEY_X,
+    Button.LOCK: pyxel.KEY_A,
+    Button.START: pyxel.KEY_SPACE,
+    Button.QUIT: pyxel.KEY_Q,
+}
+
+# テキスト形式の入力ファイルで使うキー名 -> ボタン
+BUTTON_NAMES = {
+    "LEFT": Button.LEFT,
+    "RIGHT": Button.RIGHT,
+    "UP": Button.UP,
+    "DOWN": Button.DOWN,
+    "Z": Button.SHOT,
+    "X": Button.POWER,
+    "A": Button.LOCK,
+    "SPACE": Button.START,
+    "Q": Button.QUIT,
+}
+
+
+# === 入力ソース ===
+
+class LiveInputSource:
+    """pyxelのキー状態からビットマスクを作る入力ソース（通常プレイ用）"""
+
+    def __init__(self, bindings=None):
+        self.bindings = list((bindings or KEY_BINDINGS).items())
+
+    def read(self, frame):
+        mask = 0
+        for button, key in self.bindings:
+            if pyxel.btn(key):
+                mask |= button
+        return mask
+
+
+class ScriptedInputSource:
+    """script(frame) が返すビットマスクを入力とするソース（ヘッドレス・テスト用）"""
+
+    def __init__(self, script):
+        self.script = script
+
+    def read(self, frame):
+        return int(self.script(frame))
+
+    @classmethod
+    def from_text_file(cls, path, loop=True):
+        """
+        テキスト形式の入力ファイルから生成
+
+        1行 = 1フレームで、押されているキー名（LEFT RIGHT UP DOWN Z X A SPACE Q）を空白区切りで並べる:
+            LEFT Z
+            LEFT Z A
+            (空行は何も押していないフレーム)
+        """
+        masks = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                mask = 0
+                for name in line.split():
+                    button = BUTTON_NAMES.get(name.upper())
+                    if button is None:
+                        raise ValueError(f"{path}:{line_number}: unknown key '{name}'")
+                    mask |= button
+                masks.append(mask)
+        if not masks:
+            raise ValueError(f"{path}: no input frames")
+
+        count = len(masks)
+
+        def script(frame):
+            if frame < count:
+                return masks[frame]
+            return masks[frame % count] if loop else 0
+
+        return cls(script)
+
+
+class ReplayInputSource:
+    """記録済みリプレイのビットマスクを再生するソース（終端以降は入力なし）"""
+
+    def __init__(self, replay):
+        self.replay = replay
+
+    def read(self, frame):
+        masks = self.replay.masks
+        return masks[frame] if frame < len(masks) else 0
+
+    def finished(self, frame):
+        """リプレイの最後まで再生したか"""
+        return frame >= len(self.replay.masks)
+
+
+# === リプレイファイル ===
+
+class Replay:
+    """
+    入力リプレイ（乱数シード + フレームごとのu16ビットマスク）
+
+    バイナリ形式（リトルエンディアン）:
+        magic    4 bytes  b"CBRP"
+        version  u16
+        seed     u64
+        frames   u32
+        masks    u16 × frames
+    """
+
+    MAGIC = b"CBRP"
+    VERSION = 1
+    _HEADER = struct.Struct("<4sHQI")
+
+    def __init__(self, seed=0, masks=None):
+        self.seed = seed
+        self.masks = masks if masks is not None else array("H")
+
+    def __len__(self):
+        return len(self.masks)
+
+    def append(self, mask):
+        self.masks.append(mask)
+
+    def save(self, path):
+        """リプレイをファイルに保存"""
+        masks = array("H", self.masks)
+        if masks.itemsize != 2:
+            raise RuntimeError("array('H') is not 16-bit on this platform")
+        if struct.pack("=H", 1) != struct.pack("<H", 1):
+            masks.byteswap()
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(self.MAGIC, self.VERSION, self.seed, len(masks)))
+            f.write(masks.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """リプレイをファイルから読み込む"""
+        with open(path, "rb") as f:
+            header = f.read(cls._HEADER.size)
+            if len(header) < cls._HEADER.size:
+                raise ValueError(f"{path}: truncated replay header")
+            magic, version, seed, frames = cls._HEADER.unpack(header)
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path}: not a ChromeBlaze replay file")
+            if version != cls.VERSION:
+                raise ValueError(f"{path}: unsupported replay version {version}")
+            masks = array("H")
+            masks.frombytes(f.read(frames * 2))
+        if len(masks) != frames:
+            raise ValueError(f"{path}: truncated replay ({len(masks)}/{frames} frames)")
+        if struct.pack("=H", 1) != struct.pack("<H", 1):
+            masks.byteswap()
+        return cls(seed, masks)
+
+
+# === 入力マネージャー ===
+
+class InputManager:
+    """
+    ゲーム全体の入力を管理するクラス
+
+    シミュレーション1ステップごとに begin_frame() を呼ぶと、入力ソースから
+    そのフレームのビットマスクを1回だけ読み、前フレームとの比較で btnp / btnr を判定する。
+    固定タイムステップで1描画に複数ステップ進む場合も、押した瞬間の判定は1ステップだけになる。
+    記録中は読み取ったビットマスクをリプレイに追加する。
+    """
+
+    def __init__(self, source=None):
+        self.source = source or LiveInputSource()
+        self.frame = -1
+        self.current = 0
+        self.previous = 0
+        self.recording = None  # 記録中のReplay
+
+    def set_source(self, source):
+        """入力ソースを切り替え（フレーム番号と押下状態をリセット）"""
+        self.source = source
+        self.reset()
+
+    def reset(self):
+        """フレーム番号と押下状態をリセット（次の begin_frame がフレーム0になる）"""
+        self.frame = -1
+        self.current = 0
+        self.previous = 0
+
+    def begin_frame(self):
+        """シミュレーション1ステップの先頭で呼び、そのステップの入力を確定する"""
+        self.frame += 1
+        self.previous = self.current
+        self.current = self.source.read(self.frame)
+        if self.recording is not None:
+            self.recording.append(self.current)
+
+    def btn(self, button):
+        """ボタンが押されているか"""
+        return (self.current & button) != 0
+
+    def btnp(self, button):
+        """ボタンがこのフレームで押されたか"""
+        return (self.current & button) != 0 and (self.previous & button) == 0
+
+    def btnr(self, button):
+        """ボタンがこのフレームで離されたか"""
+        return (self.current & button) == 0 and (self.previous & button) != 0
+
+    def start_recording(self, seed):
+        """記録を開始（seedはリプレイ再生時に乱数を再現するためのシード）"""
+        self.recording = Replay(seed)
+        return self.recording
+
+    def stop_recording(self):
+        """記録を終了して記録したリプレイを返す"""
+        replay = self.recording
+        self.recording = None
+        return replay
+
+
+# グローバルインスタンス
+input_manager = InputManager()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Random Service for ChromeBlaze
+サブシステム別のシード付き乱数ストリーム（NumPyでまとめて事前生成）
+"""
+
+import math
+import os
+import zlib
+import numpy as np
+
+TWO_PI = 2.0 * math.pi
+
+
+class RandomStream:
+    """
+    1つのサブシステム専用の乱数ストリーム
+
+    [0, 1) の一様乱数を batch_size 個まとめてNumPyで生成しておき、
+    1個ずつ取り出す。使い切ったら次のブロックを生成する。
+    同じシードからは常に同じ順序で値が出るため、リプレイやベンチマークを再現できる。
+    """
+
+    DEFAULT_BATCH_SIZE = 256
+
+    def __init__(self, seed_sequence, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.generator = np.random.default_rng(seed_sequence)
+        self._block = self.generator.random(batch_size).tolist()
+        self._index = 0
+
+    def _next_unit(self):
+        """[0, 1) の一様乱数を1個取り出す（ブロックが空なら再生成）"""
+        index = self._index
+        if index >= self.batch_size:
+            self._block = self.generator.random(self.batch_size).tolist()
+            index = 0
+        self._index = index + 1
+        return self._block[index]
+
+    def random(self):
+        """[0, 1) の一様乱数"""
+        return self._next_unit()
+
+    def uniform(self, low, high):
+        """[low, high) の一様乱数（random.uniform の代替）"""
+        return low + (high - low) * self._next_unit()
+
+    def angle(self):
+        """[0, 2π) のランダムな角度（ラジアン）"""
+        return TWO_PI * self._next_unit()
+
+    def randint(self, low, high):
+        """low以上high以下の整数（pyxel.rndi / random.randint の代替）"""
+        return low + int((high - low + 1) * self._next_unit())
+
+    def uniform_array(self, count, low=0.0, high=1.0):
+        """[low, high) の一様乱数をNumPy配列でまとめて取得（大量スポーン用）"""
+        return self.generator.uniform(low, high, count)
+
+
+class RandomService:
+    """
+    サブシステムごとの乱数ストリームを管理するサービス
+
+    各ストリームのシードはマスターシードとストリーム名から決まるため、
+    あるサブシステムの乱数消費量が変わっても他のサブシステムの乱数列は変わらない。
+
+        rng_service.enemy_ai.angle()
+        rng_service.laser_scatter.uniform(-500, 500)
+        rng_service.effects.randint(0, 15)
+
+    ストリームはシミュレーションのステップ（update）からだけ使う。
+    draw() の呼び出し回数は実時間で変わるため、描画だけの乱数（ロゴの点滅色など）は
+    シード付きストリームではなく pyxel.rndi を使う。
+    """
+
+    STREAM_NAMES = ("enemy_ai", "laser_scatter", "effects")
+
+    def __init__(self, seed=None, batch_size=RandomStream.DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            seed: マスターシード（Noneの場合はOSの乱数から64bitのシードを生成）
+            batch_size: 各ストリームの事前生成数
+        """
+        self.batch_size = batch_size
+        self.seed = None
+        self.streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """全ストリームをマスターシードから作り直す（Noneの場合は新しいシードを生成）"""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed
+        self.streams = {}
+        for name in self.STREAM_NAMES:
+            self.stream(name)
+        return seed
+
+    def stream(self, name):
+        """名前付きストリームを取得（未作成なら作成）"""
+        stream = self.streams.get(name)
+        if stream is None:
+            seed_sequence = np.random.SeedSequence([self.seed, zlib.crc32(name.encode("utf-8"))])
+            stream = self.streams[name] = RandomStream(seed_sequence, self.batch_size)
+        return stream
+
+    @property
+    def enemy_ai(self):
+        """エネミーの移動方向など"""
+        return self.streams["enemy_ai"]
+
+    @property
+    def laser_scatter(self):
+        """ホーミングレーザーの発射位置・目標のばらつき"""
+        return self.streams["laser_scatter"]
+
+    @property
+    def effects(self):
+        """エフェクト・演出（ゲーム進行に影響しない乱数）"""
+        return self.streams["effects"]
+
+
+# グローバルインスタンス
+rng_service = RandomService()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Render Queue for ChromeBlaze
+レイヤー付き描画コマンドのキュー（画面外カリング・レイヤー順の一括描画）
+
+各サブシステムは pyxel を直接呼ばずに、レイヤーごとのキャンバスへ描画コマンドを積む。
+キャンバスは pyxel モジュールと同じ引数の blt / line / rect / rectb / circ / circb / text を持つため、
+draw(canvas=pyxel) の形にしておけば即時描画とキュー経由の描画を同じコードで扱える。
+
+    queue = RenderQueue()
+    enemy_manager.draw(sprite_manager, queue.layer(Layer.ENEMIES))
+    queue.flush()   # レイヤー番号順、同じレイヤー内は積んだ順に描画
+
+画面（SCREEN_WIDTH × SCREEN_HEIGHT）と全く重ならないコマンドは積む時点で捨てる。
+"""
+
+from enum import IntEnum
+import pyxel
+from Common import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# pyxel標準フォントの1文字のサイズ
+FONT_WIDTH = 4
+FONT_HEIGHT = 6
+
+# キューが扱う描画コマンド
+COMMANDS = ("blt", "line", "rect", "rectb", "circ", "circb", "text")
+
+
+class Layer(IntEnum):
+    """描画レイヤー（小さい順に描画＝大きいほど手前）"""
+    PLAYER = 10
+    BULLETS = 20
+    LASERS = 30
+    ENEMIES = 40
+    EFFECTS = 50
+    CURSOR = 60
+    HUD = 70
+
+
+# === バックエンド ===
+# バックエンドは begin_layer(layer) と、コマンド名 -> 描画関数 の辞書を返す handlers() を持つ
+# （flushのたびに handlers() を1回だけ呼び、以降はコマンドごとに関数を直接呼ぶ）
+
+class PyxelBackend:
+    """pyxelの描画関数をそのまま呼ぶバックエンド（flush時点のpyxelの関数を使う）"""
+
+    def begin_layer(self, layer):
+        pass
+
+    def handlers(self):
+        return {name: getattr(pyxel, name) for name in COMMANDS}
+
+
+class RecordingBackend:
+    """
+    レイヤーごと・コマンドごとの呼び出し回数を数えるバックエンド（描画コール数の計測用）
+
+    forward に別のバックエンドを渡すと、数えた後にそのバックエンドへ転送する。
+    """
+
+    def __init__(self, forward=None):
+        self.forward = forward
+        self.counts = {}  # レイヤー -> {コマンド名: 回数}
+        self._current = None
+
+    def begin_layer(self, layer):
+        self._current = self.counts.setdefault(layer, dict.fromkeys(COMMANDS, 0))
+        if self.forward is not None:
+            self.forward.begin_layer(layer)
+
+    def handlers(self):
+        targets = self.forward.handlers() if self.forward is not None else {}
+        return {name: self._make_handler(name, targets.get(name)) for name in COMMANDS}
+
+    def _make_handler(self, name, target):
+        def handler(*args):
+            self._current[name] += 1
+            if target is not None:
+                target(*args)
+        return handler
+
+    def layer_totals(self):
+        """レイヤー名 -> 呼び出し回数の合計"""
+        return {self.layer_name(layer): sum(calls.values()) for layer, calls in sorted(self.counts.items())}
+
+    @staticmethod
+    def layer_name(layer):
+        """Layerに定義された番号なら名前、それ以外は番号の文字列"""
+        try:
+            return Layer(layer).name
+        except ValueError:
+            return str(layer)
+
+    def total(self):
+        """全レイヤーの呼び出し回数の合計"""
+        return sum(sum(calls.values()) for calls in self.counts.values())
+
+    def reset(self):
+        self.counts = {}
+        self._current = None
+
+
+# === キュー ===
+
+class LayerCanvas:
+    """
+    1つのレイヤーへコマンドを積むキャンバス（pyxelの描画関数と同じ引数）
+
+    バウンディングボックスが画面と重ならないコマンドはここで捨て、
+    残りは (コマンド名, 引数) としてレイヤーのリストに追加する。
+    """
+
+    __slots__ = ("commands", "culled", "_width", "_height")
+
+    def __init__(self, width, height):
+        self.commands = []  # [(コマンド名, 引数), ...]（積んだ順）
+        self.culled = 0     # 画面外として捨てたコマンド数
+        self._width = width
+        self._height = height
+
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        if x + abs(w) <= 0 or y + abs(h) <= 0 or x >= self._width or y >= self._height:
+            self.culled += 1
+            return
+        if colkey is None:
+            self.commands.append(("blt", (x, y, img, u, v, w, h)))
+        else:
+            self.commands.append(("blt", (x, y, img, u, v, w, h, colkey)))
+
+    def line(self, x1, y1, x2, y2, col):
+        if ((x1 < 0 and x2 < 0) or (y1 < 0 and y2 < 0)
+                or (x1 >= self._width and x2 >= self._width) or (y1 >= self._height and y2 >= self._height)):
+            self.culled += 1
+            return
+        self.commands.append(("line", (x1, y1, x2, y2, col)))
+
+    def rect(self, x, y, w, h, col):
+        if x + w <= 0 or y + h <= 0 or x >= self._width or y >= self._height:
+            self.culled += 1
+            return
+        self.commands.append(("rect", (x, y, w, h, col)))
+
+    def rectb(self, x, y, w, h, col):
+        if x + w <= 0 or y + h <= 0 or x >= self._width or y >= self._height:
+            self.culled += 1
+            return
+        self.commands.append(("rectb", (x, y, w, h, col)))
+
+    def circ(self, x, y, r, col):
+        if x + r < 0 or y + r < 0 or x - r >= self._width or y - r >= self._height:
+            self.culled += 1
+            return
+        self.commands.append(("circ", (x, y, r, col)))
+
+    def circb(self, x, y, r, col):
+        if x + r < 0 or y + r < 0 or x - r >= self._width or y - r >= self._height:
+            self.culled += 1
+            return
+        self.commands.append(("circb", (x, y, r, col)))
+
+    def text(self, x, y, s, col):
+        if x + FONT_WIDTH * len(s) <= 0 or y + FONT_HEIGHT <= 0 or x >= self._width or y >= self._height:
+            self.culled += 1
+            return
+        self.commands.append(("text", (x, y, s, col)))
+
+
+class RenderQueue:
+    """
+    レイヤー付き描画コマンドを1フレーム分ためて、flush() でレイヤー順に描画するキュー
+
+    レイヤーごとにコマンドのリストを持ち、flush() ではレイヤー番号でソートした順に
+    1回のループで全コマンドをバックエンドへ流す（同じレイヤー内は積んだ順）。
+    """
+
+    def __init__(self, backend=None, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.backend = backend or PyxelBackend()
+        self.width = width
+        self.height = height
+        self._canvases = {}  # レイヤー -> LayerCanvas
+        self._order = []     # レイヤー番号順に並べたLayerCanvas
+        self.last_drawn = 0   # 直近のflushで描画したコマンド数
+        self.last_culled = 0  # 直近のflushまでに画面外として捨てたコマンド数
+
+    def layer(self, layer):
+        """レイヤーに積むキャンバスを取得"""
+        canvas = self._canvases.get(layer)
+        if canvas is None:
+            canvas = self._canvases[layer] = LayerCanvas(self.width, self.height)
+            self._order = [self._canvases[key] for key in sorted(self._canvases)]
+        return canvas
+
+    def __len__(self):
+        return sum(len(canvas.commands) for canvas in self._canvases.values())
+
+    def flush(self):
+        """積まれたコマンドをレイヤー番号順（同じレイヤー内は積んだ順）に描画してキューを空にする"""
+        backend = self.backend
+        handlers = backend.handlers()
+        drawn = 0
+        culled = 0
+        for layer, canvas in zip(sorted(self._canvases), self._order):
+            commands = canvas.commands
+            culled += canvas.culled
+            canvas.culled = 0
+            if not commands:
+                continue
+            backend.begin_layer(layer)
+            for name, args in commands:
+                handlers[name](*args)
+            drawn += len(commands)
+            commands.clear()
+        self.last_drawn = drawn
+        self.last_culled = culled
+
+    def clear(self):
+        """描画せずにキューを空にする"""
+        for canvas in self._canvases.values():
+            canvas.commands.clear()
+            canvas.culled = 0
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Spatial Hash for ChromeBlaze
+一様グリッドによる空間ハッシュ（近傍検索用）
+"""
+
+import math
+from Common import SCREEN_WIDTH, SCREEN_HEIGHT, SPRITE_SIZE, check_collision
+
+
+class SpatialHash:
+    """
+    領域(origin_x, origin_y, width, height)をSPRITE_SIZE単位のセルに分割し、各セルに重なるオブジェクトを登録する空間ハッシュ
+
+    領域外の座標は端のセルにまとめて登録されるため、領域外のオブジェクトも検索漏れしない
+    （ただし端のセルに集まるほど線形探索に近づくので、領域はオブジェクトの移動範囲に合わせる）。
+    検索結果は登録順に並ぶ（全件走査していた頃と同じ順序になる）。
+    """
+
+    def __init__(self, cell_size=SPRITE_SIZE, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, origin_x=0, origin_y=0):
+        self.cell_size = cell_size
+        self.origin_x = origin_x  # 領域の左上（ワールド座標）
+        self.origin_y = origin_y
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+
+        # オブジェクトごとの登録情報
+        self._item_bounds = {}  # item -> (登録順, x, y, w, h)
+        self._item_cells = {}   # item -> [セル番号, ...]
+        self._next_order = 0
+
+    # === セル計算 ===
+
+    def _col(self, x):
+        """X座標をセル列番号に変換（グリッド外は端にクランプ）"""
+        col = int((x - self.origin_x) // self.cell_size)
+        return 0 if col < 0 else (self.cols - 1 if col >= self.cols else col)
+
+    def _row(self, y):
+        """Y座標をセル行番号に変換（グリッド外は端にクランプ）"""
+        row = int((y - self.origin_y) // self.cell_size)
+        return 0 if row < 0 else (self.rows - 1 if row >= self.rows else row)
+
+    def _cells_for_rect(self, x, y, w, h):
+        """矩形が重なるセル番号を列挙"""
+        col0, col1 = self._col(x), self._col(x + w)
+        row0, row1 = self._row(y), self._row(y + h)
+        cols = self.cols
+        return [row * cols + col
+                for row in range(row0, row1 + 1)
+                for col in range(col0, col1 + 1)]
+
+    # === 登録・削除 ===
+
+    def clear(self):
+        """全登録を消去"""
+        for cell_indices in self._item_cells.values():
+            for cell_index in cell_indices:
+                self.cells[cell_index].clear()
+        self._item_bounds.clear()
+        self._item_cells.clear()
+        self._next_order = 0
+
+    def insert(self, item, x, y, w, h):
+        """オブジェクトを矩形(x, y, w, h)で登録"""
+        if item in self._item_bounds:
+            self.remove(item)
+        cell_indices = self._cells_for_rect(x, y, w, h)
+        for cell_index in cell_indices:
+            self.cells[cell_index].append(item)
+        self._item_bounds[item] = (self._next_order, x, y, w, h)
+        self._item_cells[item] = cell_indices
+        self._next_order += 1
+
+    def remove(self, item):
+        """オブジェクトの登録を解除"""
+        cell_indices = self._item_cells.pop(item, None)
+        if cell_indices is None:
+            return False
+        for cell_index in cell_indices:
+            self.cells[cell_index].remove(item)
+        del self._item_bounds[item]
+        return True
+
+    def update(self, item, x, y, w, h):
+        """オブジェクトの位置を更新（セルが変わらない場合は登録情報のみ更新）"""
+        bounds = self._item_bounds.get(item)
+        if bounds is None:
+            self.insert(item, x, y, w, h)
+            return
+        cell_indices = self._cells_for_rect(x, y, w, h)
+        if cell_indices != self._item_cells[item]:
+            for cell_index in self._item_cells[item]:
+                self.cells[cell_index].remove(item)
+            for cell_index in cell_indices:
+                self.cells[cell_index].append(item)
+            self._item_cells[item] = cell_indices
+        self._item_bounds[item] = (bounds[0], x, y, w, h)
+
+    def rebuild(self, items, w, h):
+        """x, y属性を持つオブジェクト群で全体を再構築（サイズは共通）"""
+        self.clear()
+        for item in items:
+            self.insert(item, item.x, item.y, w, h)
+
+    def __len__(self):
+        return len(self._item_bounds)
+
+    # === 検索 ===
+
+    def _candidates(self, x, y, w, h):
+        """矩形が重なるセルに登録された候補を重複なしで列挙"""
+        candidates = {}
+        cells = self.cells
+        for cell_index in self._cells_for_rect(x, y, w, h):
+            for item in cells[cell_index]:
+                if item not in candidates:
+                    candidates[item] = self._item_bounds[item]
+        return candidates
+
+    @staticmethod
+    def _ordered(hits):
+        """検索結果を登録順に並べる"""
+        if len(hits) > 1:
+            hits.sort(key=lambda hit: hit[0])
+        return [item for _, item in hits]
+
+    def query_rect(self, x, y, w, h):
+        """矩形(x, y, w, h)と重なるオブジェクトのリストを取得"""
+        hits = []
+        for item, (order, ix, iy, iw, ih) in self._candidates(x, y, w, h).items():
+            if check_collision(x, y, w, h, ix, iy, iw, ih):
+                hits.append((order, item))
+        return self._ordered(hits)
+
+    def query_point(self, px, py):
+        """点(px, py)を含むオブジェクトのリストを取得"""
+        hits = []
+        for item, (order, ix, iy, iw, ih) in self._candidates(px, py, 0, 0).items():
+            if ix <= px < ix + iw and iy <= py < iy + ih:
+                hits.append((order, item))
+        return self._ordered(hits)
+
+    def query_radius(self, cx, cy, radius):
+        """中心(cx, cy)・半径radiusの円と重なるオブジェクトのリストを取得"""
+        hits = []
+        radius_squared = radius * radius
+        candidates = self._candidates(cx - radius, cy - radius, radius * 2, radius * 2)
+        for item, (order, ix, iy, iw, ih) in candidates.items():
+            # 円の中心から矩形上の最近点までの距離で判定
+            nearest_x = min(max(cx, ix), ix + iw)
+            nearest_y = min(max(cy, iy), iy + ih)
+            dx = cx - nearest_x
+            dy = cy - nearest_y
+            if dx * dx + dy * dy <= radius_squared:
+                hits.append((order, item))
+        return self._ordered(hits)
@@ -15,6 +15,38 @@ from Common import DEBUG
 # Sprite Location Definition
 SpIdx = namedtuple("SprIdx", ["x", "y"])
 
+# アニメーション速度が取得できない場合のデフォルト値（フレーム数）
+DEFAULT_ANIM_SPD = 10
+
+
+class AnimationClip(namedtuple("AnimationClip", ["name", "frames", "anim_speed", "cycle"])):
+    """NAMEグループを事前コンパイルした不変のアニメーションクリップ。
+    
+    frames: FRAME_NUM順のスプライト座標タプル (SpIdx, ...)
+    anim_speed: 1コマの表示フレーム数 (ANIM_SPD)
+    cycle: 1ループの総フレーム数 (anim_speed * コマ数)
+    """
+    __slots__ = ()
+    
+    def frame_at(self, tick):
+        """共有クロックの値から現在のコマを取得する"""
+        return self.frames[tick % self.cycle // self.anim_speed]
+
+
+class AnimationClock:
+    """全エンティティで共有するアニメーション用フレームクロック"""
+    
+    def __init__(self):
+        self.frame = 0
+    
+    def tick(self):
+        """1フレーム進める"""
+        self.frame += 1
+    
+    def reset(self):
+        """クロックを0に戻す"""
+        self.frame = 0
+
 # Legacy Sprite Dictionary - 8x8 sprites (for backward compatibility)
 # TODO: Remove this once all references are migrated to JSON
 # SprList = {
@@ -76,6 +108,15 @@ class SpriteManager:
     def __init__(self):
         self.json_sprites = {}  # sprites.jsonから読み込んだデータ
         self.json_file_path = "sprites.json"
+        
+        # 検索用インデックス（load_sprites_jsonで構築）
+        self._field_index = {}     # (NAME, field, value) -> SpIdx
+        self._tag_index = {}       # (NAME, tag) -> SpIdx  ※tag=Noneは名前の先頭スプライト
+        self._group_index = {}     # NAME -> [sprite_data, ...]（JSON順）
+        self._frames_index = {}    # NAME -> [SpIdx, ...]（FRAME_NUM順）
+        self._metadata_index = {}  # NAME -> {field: value}（最初に見つかった非None値）
+        self._clips = {}           # NAME -> AnimationClip
+        
         self.load_sprites_json()
     
     def load_sprites_json(self):
@@ -102,6 +143,67 @@ class SpriteManager:
             if DEBUG:
                 print(f"[SpriteManager] Error loading sprites.json: {e}")
             self.json_sprites = {}
+        
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """json_spritesから検索用インデックスを構築する。
+        
+        同じキーに複数のスプライトが該当する場合は、従来の線形検索と同じく
+        JSON内で最初に現れたものを採用する。
+        """
+        self._field_index = {}
+        self._tag_index = {}
+        self._group_index = {}
+        self._frames_index = {}
+        self._metadata_index = {}
+        self._clips = {}
+        
+        for key, sprite in self.json_sprites.items():
+            name = sprite.get("NAME")
+            sprite_idx = SpIdx(sprite["x"], sprite["y"])
+            
+            # (NAME, field, value) -> SpIdx
+            for field_name, field_value in sprite.items():
+                if isinstance(field_value, (list, dict)):
+                    continue
+                self._field_index.setdefault((name, field_name, field_value), sprite_idx)
+            
+            # (NAME, tag) -> SpIdx
+            self._tag_index.setdefault((name, None), sprite_idx)
+            for tag in sprite.get("tags", []):
+                self._tag_index.setdefault((name, tag), sprite_idx)
+            
+            # NAME -> グループ / メタデータ
+            self._group_index.setdefault(name, []).append(sprite)
+            metadata = self._metadata_index.setdefault(name, {})
+            for field_name, field_value in sprite.items():
+                if field_value is not None:
+                    metadata.setdefault(field_name, field_value)
+        
+        # フレームリストはFRAME_NUM順に並べる（FRAME_NUMなしはJSON順のまま末尾）
+        for name, sprites in self._group_index.items():
+            ordered = sorted(sprites, key=self._frame_sort_key)
+            self._frames_index[name] = [SpIdx(sprite["x"], sprite["y"]) for sprite in ordered]
+            self._clips[name] = self._compile_clip(name)
+    
+    def _compile_clip(self, name):
+        """NAMEグループをAnimationClipにコンパイルする"""
+        frames = tuple(self._frames_index.get(name, ())) or (SpIdx(0, 0),)  # NULL sprite fallback
+        try:
+            anim_speed = int(self.get_sprite_metadata(name, "ANIM_SPD", DEFAULT_ANIM_SPD))
+        except (ValueError, TypeError):
+            anim_speed = DEFAULT_ANIM_SPD
+        anim_speed = max(1, anim_speed)
+        return AnimationClip(name, frames, anim_speed, anim_speed * len(frames))
+    
+    @staticmethod
+    def _frame_sort_key(sprite):
+        """FRAME_NUMによる並び替えキー（数値化できない場合は末尾）"""
+        try:
+            return int(sprite.get("FRAME_NUM"))
+        except (TypeError, ValueError):
+            return float('inf')
     
     def get_sprite_by_name_and_field(self, name, field_name, field_value):
         """名前と指定フィールドの値でスプライトを取得する汎用メソッド。
@@ -114,10 +216,9 @@ class SpriteManager:
         Returns:
             SpIdx: スプライトの座標 (x, y)
         """
-        for key, sprite in self.json_sprites.items():
-            if (sprite.get("NAME") == name and 
-                sprite.get(field_name) == field_value):
-                return SpIdx(sprite["x"], sprite["y"])
+        sprite_idx = self._field_index.get((name, field_name, field_value))
+        if sprite_idx is not None:
+            return sprite_idx
         
         # 見つからない場合はNULLを返す
         if DEBUG:
@@ -134,10 +235,9 @@ class SpriteManager:
         Returns:
             SpIdx: スプライトの座標 (x, y)
         """
-        for key, sprite in self.json_sprites.items():
-            if sprite.get("NAME") == name:
-                if tag is None or tag in sprite.get("tags", []):
-                    return SpIdx(sprite["x"], sprite["y"])
+        sprite_idx = self._tag_index.get((name, tag))
+        if sprite_idx is not None:
+            return sprite_idx
         
         # 見つからない場合はNULLを返す
         if DEBUG:
@@ -153,11 +253,66 @@ class SpriteManager:
         Returns:
             list: スプライトのリスト [sprite_data, ...]
         """
-        sprites = []
-        for key, sprite in self.json_sprites.items():
-            if sprite.get("NAME") == name:
-                sprites.append(sprite.copy())  # 元データのコピーを返す
-        return sprites
+        # 元データのコピーを返す
+        return [sprite.copy() for sprite in self._group_index.get(name, [])]
+    
+    def get_sprite_frames(self, name):
+        """指定された名前のスプライト座標をFRAME_NUM順に取得する。
+        
+        Args:
+            name (str): スプライト名
+            
+        Returns:
+            list: スプライト座標のリスト [SpIdx, ...]
+        """
+        return list(self._frames_index.get(name, []))
+    
+    def get_animation_clip(self, name):
+        """指定された名前のアニメーションクリップを取得する。
+        
+        Args:
+            name (str): スプライト名
+            
+        Returns:
+            AnimationClip: 事前コンパイル済みのクリップ（未定義の場合はNULLスプライト1コマ）
+        """
+        clip = self._clips.get(name)
+        if clip is None:
+            if DEBUG:
+                print(f"[SpriteManager] Warning: Animation clip '{name}' not found")
+            clip = self._compile_clip(name)
+            self._clips[name] = clip
+        return clip
+    
+    def register_clip(self, name, frames, anim_speed=DEFAULT_ANIM_SPD, **metadata):
+        """実行時に生成したスプライト（エフェクトアトラスなど）をクリップとして登録する。
+        
+        登録後は sprites.json のスプライトと同じく、名前・FRAME_NUM・メタデータで検索できる。
+        
+        Args:
+            name (str): スプライト名
+            frames (list): FRAME_NUM順のスプライト座標 [SpIdx, ...]
+            anim_speed (int): 1コマの表示フレーム数
+            **metadata: 追加のメタデータ（BANK, W, H 等）
+            
+        Returns:
+            AnimationClip: 登録したクリップ
+        """
+        frames = [SpIdx(*frame) for frame in frames]
+        self._frames_index[name] = frames
+        if frames:
+            self._tag_index[(name, None)] = frames[0]
+        for frame_num, sprite_idx in enumerate(frames):
+            # sprites.json と同じく FRAME_NUM は文字列で登録する
+            self._field_index[(name, "FRAME_NUM", str(frame_num))] = sprite_idx
+        
+        entry = {"NAME": name, "ANIM_SPD": anim_speed}
+        entry.update(metadata)
+        self._metadata_index[name] = entry
+        
+        clip = self._compile_clip(name)
+        self._clips[name] = clip
+        return clip
     
     def get_sprite_metadata(self, name, field_name, default_value=None):
         """指定されたスプライトの特定フィールドの値を取得する。
@@ -170,11 +325,11 @@ class SpriteManager:
         Returns:
             取得した値またはデフォルト値
         """
-        for key, sprite in self.json_sprites.items():
-            if sprite.get("NAME") == name:
-                field_value = sprite.get(field_name)
-                if field_value is not None:
-                    return field_value
+        metadata = self._metadata_index.get(name)
+        if metadata is not None:
+            field_value = metadata.get(field_name)
+            if field_value is not None:
+                return field_value
         
         if default_value is not None and DEBUG:
             print(f"[SpriteManager] Warning: Field '{field_name}' not found for sprite '{name}', using default: {default_value}")
@@ -182,4 +337,5 @@ class SpriteManager:
 
 
 # グローバルインスタンス
-sprite_manager = SpriteManager()
\ No newline at end of file
+sprite_manager = SpriteManager()
+animation_clock = AnimationClock()
\ No newline at end of file
@@ -1,8 +1,14 @@
 import pyxel
-from Common import GameState, SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG
-from SpriteManager import sprite_manager
+from Common import GameState, SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG, FIXED_DT
+from SpriteManager import sprite_manager, animation_clock
 from Player import Player
 from Enemy import EnemyManager
+from CollisionSystem import CollisionSystem
+from EventLog import event_log
+from FrameProfiler import profiler
+from InputSystem import input_manager, Button
+from RenderQueue import RenderQueue, Layer
+from HUD import HUD
 import math
 
 class GamePlayState:
@@ -14,92 +20,135 @@ class GamePlayState:
         # エネミー管理システム
         self.enemy_manager = EnemyManager(8, SCREEN_WIDTH, SCREEN_HEIGHT)
         
-    def update(self):
+        # 弾丸とエネミーの当たり判定
+        self.collision_system = CollisionSystem()
+        
+        # 描画コマンドのキュー（レイヤー順に一括描画）
+        self.render_queue = RenderQueue()
+        
+        # HUD（値が変わった行だけ描き直すキャッシュ付き）
+        self.hud = self._create_hud()
+        
+    def update(self, delta_time=FIXED_DT):
         self.frame_count += 1
+        animation_clock.tick()  # 共有アニメーションクロックを進める
+        event_log.set_frame(self.frame_count)  # 構造化イベントのフレーム番号
         
-        if pyxel.btnp(pyxel.KEY_Q):
+        if input_manager.btnp(Button.QUIT):
             return GameState.TITLE
-            
-        # エネミー管理システムの更新
-        delta_time = 1.0 / 60.0  # 60FPS想定
-        self.enemy_manager.update(delta_time)
         
-        # プレイヤーの更新（エネミー管理システムを渡す）
-        self.player.update(self.enemy_manager)
+        # プロファイラーのオーバーレイ切り替え（PROFILE有効時のみ）
+        profiler.handle_input()
+        
+        with profiler.scope("update"):
+            # エネミー管理システムの更新（delta_timeは固定タイムステップの1ステップ分）
+            with profiler.scope("enemies.update"):
+                self.enemy_manager.update(delta_time)
+            
+            # プレイヤーの更新（エネミー管理システムを渡す）
+            self.player.update(self.enemy_manager, delta_time)
+            
+            # ショット vs エネミーの当たり判定
+            with profiler.scope("collision"):
+                self.collision_system.resolve_bullets(self.player, self.enemy_manager)
         
         return GameState.GAME
     
     def draw(self):
-        pyxel.cls(pyxel.COLOR_NAVY)
-        
-        # プレイヤーとエネミーの描画
-        self.player.draw()
-        self.player.draw_bullets(self.frame_count)
-        self.player.draw_homing_lasers()
-        self.enemy_manager.draw(sprite_manager)
-        self.player.draw_hit_effects()
+        queue = self.render_queue
+        with profiler.scope("draw"):
+            pyxel.cls(pyxel.COLOR_NAVY)
+            
+            # 各サブシステムはレイヤーごとのキャンバスへ描画コマンドを積む（画面外はカリング）
+            with profiler.scope("draw.player"):
+                self.player.draw(queue.layer(Layer.PLAYER))
+            with profiler.scope("draw.bullets"):
+                self.player.draw_bullets(queue.layer(Layer.BULLETS))
+            with profiler.scope("draw.lasers"):
+                self.player.draw_homing_lasers(queue.layer(Layer.LASERS))
+            with profiler.scope("draw.enemies"):
+                self.enemy_manager.draw(sprite_manager, queue.layer(Layer.ENEMIES))
+            with profiler.scope("draw.effects"):
+                self.player.draw_hit_effects(queue.layer(Layer.EFFECTS))
+            
+            # ロックオンカーソルの描画
+            with profiler.scope("draw.cursor"):
+                is_cursor_on_enemy = self.player.is_cursor_on_enemy(self.enemy_manager)
+                self.player.draw_lock_cursor(is_cursor_on_enemy, queue.layer(Layer.CURSOR))
+            
+            with profiler.scope("draw.hud"):
+                self._draw_hud(queue.layer(Layer.HUD))
+            
+            # レイヤー順に一括描画
+            with profiler.scope("draw.flush"):
+                queue.flush()
         
-        # ロックオンカーソルの描画
-        is_cursor_on_enemy = self.player.is_cursor_on_enemy(self.enemy_manager)
-        self.player.draw_lock_cursor(is_cursor_on_enemy)
+        # プロファイラーのオーバーレイ（計測対象外）
+        profiler.draw_overlay()
+    
+    def _create_hud(self):
+        """HUDの行を定義（値が変わったときだけ文字列を作り直す）"""
+        hud = HUD()
+        player = self.player
         
         # UI表示（基本情報）
         if DEBUG:
-            pyxel.text(10, 10, f"Stage: {self.stage}", pyxel.COLOR_WHITE)
-            pyxel.text(10, 20, f"Power Level: {self.player.power_level}", pyxel.COLOR_WHITE)
-            
+            hud.add_line("stage", 10, 10, lambda stage: f"Stage: {stage}", pyxel.COLOR_WHITE)
+            hud.add_line("power", 10, 20, lambda level: f"Power Level: {level}", pyxel.COLOR_WHITE)
             # エネミー数の表示
-            active_count = len(self.enemy_manager.get_active_enemies())
-            pyxel.text(10, 30, f"Enemies: {active_count}/5", pyxel.COLOR_RED)
-            
+            hud.add_line("enemies", 10, 30, lambda count: f"Enemies: {count}/5", pyxel.COLOR_RED)
             # ロックオンリスト状態表示
-            lock_count = len(self.player.lock_enemy_list)
-            if lock_count > 0:
-                lock_color = pyxel.COLOR_YELLOW
-                lock_text = f"Locked: {lock_count}/{self.player.max_lock_count} IDs:{self.player.lock_enemy_list}"
-            else:
-                lock_color = pyxel.COLOR_GRAY
-                lock_text = f"Locked: {lock_count}/{self.player.max_lock_count}"
-            pyxel.text(10, 40, lock_text, lock_color)
+            hud.add_line("locked", 10, 40, self._render_locked)
         
         # Phase 4: ロック数表示システム (n/10) - 改良版UI
-        lock_count = len(self.player.lock_enemy_list)
-        if lock_count > 0:
-            # ロックオン中は大きく目立つ表示
-            lock_display_color = pyxel.COLOR_CYAN
-            lock_display_text = f"({lock_count}/10)"
-            # 中央上部に配置
-            display_x = SCREEN_WIDTH // 2 - 20
-            display_y = 20
-            pyxel.text(display_x, display_y, lock_display_text, lock_display_color)
+        # ロックオン中は中央上部に大きく目立つ表示（ロックなしは非表示）
+        hud.add_line("lock_count", SCREEN_WIDTH // 2 - 20, 20,
+                     lambda value: f"({value[0]}/{value[1]})" if value[0] > 0 else None,
+                     pyxel.COLOR_CYAN)
         
         # デバッグ情報表示（DEBUGフラグで制御）
         if DEBUG:
             # Phase 4: ロックオン状態表示（デバッグ・ユーザーフィードバック用）
-            state_text = f"Lock State: {self.player.lock_state.value.upper()}"
-            state_color = self.player.cursor_colors.get(self.player.lock_state, pyxel.COLOR_WHITE)
-            pyxel.text(10, 60, state_text, state_color)
-            
+            hud.add_line("lock_state", 10, 60,
+                         lambda state: (f"Lock State: {state.value.upper()}",
+                                        player.cursor_colors.get(state, pyxel.COLOR_WHITE)))
             # クールダウンタイマー表示（COOLDOWN状態時のみ）
-            if self.player.lock_state.value == "cooldown":
-                cooldown_text = f"Cooldown: {self.player.cooldown_timer}/30"
-                pyxel.text(10, 70, cooldown_text, pyxel.COLOR_YELLOW)
-            
+            hud.add_line("cooldown", 10, 70,
+                         lambda timer: None if timer is None else f"Cooldown: {timer}/30",
+                         pyxel.COLOR_YELLOW)
             # レーザー状態表示
-            active_lasers = len([laser for laser in self.player.homing_lasers if laser.active])
-            if active_lasers > 0:
-                laser_color = pyxel.COLOR_GREEN
-                laser_status = f"Lasers: {active_lasers}/{self.player.max_lasers}"
-            else:
-                laser_color = pyxel.COLOR_GRAY
-                laser_status = f"Lasers: {active_lasers}/{self.player.max_lasers}"
-            pyxel.text(10, 50, laser_status, laser_color)
-        
-        # 操作説明（Phase 5: 新インターフェイス対応）
+            hud.add_line("lasers", 10, 50,
+                         lambda value: (f"Lasers: {value[0]}/{value[1]}",
+                                        pyxel.COLOR_GREEN if value[0] > 0 else pyxel.COLOR_GRAY))
+            
+            # 操作説明（Phase 5: 新インターフェイス対応）
+            hud.add_text("help_move", 10, 90, "Arrow Keys: Move", pyxel.COLOR_YELLOW)
+            hud.add_text("help_shoot", 10, 100, "Z: Shoot", pyxel.COLOR_YELLOW)
+            hud.add_text("help_power", 10, 110, "X: Power Up", pyxel.COLOR_YELLOW)
+            hud.add_text("help_lock", 10, 120, "A Hold: Lock-on enemies", pyxel.COLOR_CYAN)
+            hud.add_text("help_fire", 10, 130, "A Release: Fire homing", pyxel.COLOR_CYAN)
+            hud.add_text("help_quit", 10, 140, "Q: Return to Title", pyxel.COLOR_YELLOW)
+        return hud
+    
+    @staticmethod
+    def _render_locked(value):
+        """ロックオンリスト表示の文字列と色（value = (ロック中のID, 最大ロック数)）"""
+        lock_ids, max_lock_count = value
+        if lock_ids:
+            return f"Locked: {len(lock_ids)}/{max_lock_count} IDs:{list(lock_ids)}", pyxel.COLOR_YELLOW
+        return f"Locked: 0/{max_lock_count}", pyxel.COLOR_GRAY
+    
+    def _draw_hud(self, canvas=pyxel):
+        """ロック数表示・デバッグ情報・操作説明の描画（値を渡し、変化した行だけ描き直す）"""
+        hud = self.hud
+        player = self.player
+        hud.set("lock_count", (len(player.lock_enemy_list), player.max_lock_count))
         if DEBUG:
-            pyxel.text(10, 90, "Arrow Keys: Move", pyxel.COLOR_YELLOW)
-            pyxel.text(10, 100, "Z: Shoot", pyxel.COLOR_YELLOW)
-            pyxel.text(10, 110, "X: Power Up", pyxel.COLOR_YELLOW)
-            pyxel.text(10, 120, "A Hold: Lock-on enemies", pyxel.COLOR_CYAN)
-            pyxel.text(10, 130, "A Release: Fire homing", pyxel.COLOR_CYAN)
-            pyxel.text(10, 140, "Q: Return to Title", pyxel.COLOR_YELLOW)
+            hud.set("stage", self.stage)
+            hud.set("power", player.power_level)
+            hud.set("enemies", self.enemy_manager.get_active_count())
+            hud.set("locked", (tuple(player.lock_enemy_list), player.max_lock_count))
+            hud.set("lock_state", player.lock_state)
+            hud.set("cooldown", player.cooldown_timer if player.lock_state.value == "cooldown" else None)
+            hud.set("lasers", (player.laser_swarm.active_count(), player.max_lasers))
+        hud.draw(canvas)
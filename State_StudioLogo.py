@@ -1,6 +1,7 @@
 import pyxel
 from Common import GameState, SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG
 from SpriteManager import sprite_manager
+from InputSystem import input_manager, Button
 
 class StudioLogoState:
     def __init__(self):
@@ -9,7 +10,7 @@ class StudioLogoState:
     def update(self):
         self.frame_count += 1
         
-        if pyxel.btnp(pyxel.KEY_SPACE):
+        if input_manager.btnp(Button.START):
             return GameState.TITLE
         
         return GameState.LOGO
@@ -47,4 +48,5 @@ class StudioLogoState:
             prompt_text = "Push Space Key"
             prompt_width = len(prompt_text) * 4
             prompt_x = (SCREEN_WIDTH - prompt_width) // 2
+            # 見た目だけの乱数（描画回数は実時間で変わるため、シード付きストリームは使わない）
             pyxel.text(prompt_x, 150, prompt_text, pyxel.rndi(0, 15))
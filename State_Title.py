@@ -1,5 +1,6 @@
 import pyxel
 from Common import GameState, SCREEN_WIDTH, SCREEN_HEIGHT
+from InputSystem import input_manager, Button
 
 class TitleState:
     def __init__(self):
@@ -8,9 +9,9 @@ class TitleState:
     def update(self):
         self.frame_count += 1
         
-        if pyxel.btnp(pyxel.KEY_Q):
+        if input_manager.btnp(Button.QUIT):
             pyxel.quit()
-        if pyxel.btnp(pyxel.KEY_SPACE):
+        if input_manager.btnp(Button.START):
             return GameState.GAME
         
         return GameState.TITLE
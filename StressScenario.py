@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Stress Scenario for ChromeBlaze
+負荷テスト用シナリオ生成（大量のエネミー・レーザー一斉発射・弾丸上限維持）
+
+GamePlayState にシード付きでエネミーを大量配置し、毎フレーム
+    - 倒されたエネミーを補充して総数を維持
+    - カーソル付近のエネミーをロックしてレーザーの空きスロットへ一斉発射
+    - 弾丸プールを上限まで補充
+を行う。HeadlessRunner の scenario 引数やベンチマーク（benchmarks/bench_macro.py）から使う。
+
+    scenario = StressScenario(enemy_count=2000, laser_count=64)
+    runner = HeadlessRunner(ScriptedInputSource(scenario.input_script), scenario=scenario, seed=1)
+"""
+
+from itertools import islice
+from Common import SCREEN_WIDTH, SCREEN_HEIGHT, SPRITE_SIZE
+from BulletPool import BulletPool
+from Class_HomingLaser import LaserSwarm
+from InputSystem import Button
+from RandomService import rng_service
+
+
+class StressScenario:
+    """パラメータとシードで決まる負荷シナリオ"""
+
+    # エネミーの配置範囲（EnemyManager の既定の移動範囲 world_bounds = 画面上半分）
+    SPAWN_AREA = (0, 0, SCREEN_WIDTH - SPRITE_SIZE, SCREEN_HEIGHT // 2)
+
+    # ロック対象を探すカーソル周囲の半径（ピクセル）
+    LOCK_RADIUS = 16
+
+    def __init__(self, enemy_count=1000, density=None, laser_count=64, saturate_lasers=True,
+                 bullets_at_cap=True, bullet_capacity=None, respawn=True, move_player=True, power_level=None):
+        """
+        Args:
+            enemy_count: 維持するエネミー数
+            density: 配置範囲の1セル（SPRITE_SIZE四方）あたりのエネミー数（指定時は enemy_count より優先）
+            laser_count: レーザーの同時発射上限（ロック上限も同じ値にする）
+            saturate_lasers: Trueの場合は毎フレーム空きスロットへレーザーを一斉発射
+            bullets_at_cap: Trueの場合は毎フレーム弾丸プールを上限まで補充
+            bullet_capacity: 弾丸プールの容量（Noneの場合はプレイヤー既定のまま）
+            respawn: Trueの場合は倒されたエネミーを補充して総数を維持
+            move_player: Trueの場合は入力スクリプトで左右に往復する
+            power_level: プレイヤーのショットのパワーレベル（Noneの場合はプレイヤー既定のまま）
+        """
+        area_x, area_y, area_w, area_h = self.SPAWN_AREA
+        self.cell_count = max(1, (area_w // SPRITE_SIZE) * (area_h // SPRITE_SIZE))
+        if density is not None:
+            enemy_count = int(round(density * self.cell_count))
+        self.enemy_count = enemy_count
+        self.laser_count = laser_count
+        self.saturate_lasers = saturate_lasers and laser_count > 0
+        self.bullets_at_cap = bullets_at_cap
+        self.bullet_capacity = bullet_capacity
+        self.respawn = respawn
+        self.move_player = move_player
+        self.power_level = power_level
+        self.rng = None
+
+    @property
+    def density(self):
+        """配置範囲の1セルあたりのエネミー数"""
+        return self.enemy_count / self.cell_count
+
+    def describe(self):
+        """レポート用の1行説明"""
+        return (f"{self.enemy_count} enemies ({self.density:.1f}/cell), "
+                f"{self.laser_count} lasers, bullets {'at cap' if self.bullets_at_cap else 'free'}")
+
+    # === シナリオの適用 ===
+
+    def apply(self, state):
+        """
+        生成直後のGamePlayStateにシナリオを適用する（乱数シード設定後に呼ぶ）
+
+        既定のエネミーを消去して enemy_count 体を配置し、レーザー・ロック・弾丸の上限とパワーレベルを設定する。
+        """
+        self.rng = rng_service.stream("scenario")
+
+        manager = state.enemy_manager
+        manager.clear()
+        area_x, area_y, area_w, area_h = self.SPAWN_AREA
+        xs = self.rng.uniform_array(self.enemy_count, area_x, area_x + area_w).tolist()
+        ys = self.rng.uniform_array(self.enemy_count, area_y, area_y + area_h).tolist()
+        for x, y in zip(xs, ys):
+            manager.spawn_enemy(x, y)
+
+        player = state.player
+        if self.laser_count > 0:
+            player.max_lasers = self.laser_count
+            player.max_lock_count = self.laser_count
+            player.laser_swarm = LaserSwarm(self.laser_count)
+        if self.bullet_capacity is not None:
+            player.bullets = BulletPool(self.bullet_capacity)
+        if self.power_level is not None:
+            player.power_level = self.power_level
+
+    def input_script(self, frame):
+        """ショットを撃ち続け、120フレーム周期で左右に往復する入力"""
+        mask = Button.SHOT
+        if self.move_player:
+            mask |= Button.LEFT if (frame // 120) % 2 == 0 else Button.RIGHT
+        return mask
+
+    def on_frame(self, state, frame):
+        """毎フレーム update の前に呼び、エネミー数・レーザー・弾丸を上限まで補充する"""
+        if self.respawn:
+            self._refill_enemies(state.enemy_manager)
+        if self.saturate_lasers:
+            self._fire_volley(state.player, state.enemy_manager)
+        if self.bullets_at_cap:
+            self._refill_bullets(state.player)
+
+    # === 補充処理 ===
+
+    def _refill_enemies(self, manager):
+        """倒された分のエネミーを配置範囲のランダムな位置に補充"""
+        missing = self.enemy_count - manager.get_active_count()
+        if missing <= 0:
+            return
+        area_x, area_y, area_w, area_h = self.SPAWN_AREA
+        rng = self.rng
+        for _ in range(missing):
+            manager.spawn_enemy(rng.uniform(area_x, area_x + area_w),
+                                rng.uniform(area_y, area_y + area_h))
+
+    def _fire_volley(self, player, manager):
+        """レーザーの空きスロット数だけカーソル付近のエネミーをロックして一斉発射"""
+        free = min(self.laser_count - player.laser_swarm.active_count(), player.max_lock_count)
+        if free <= 0:
+            return
+
+        cursor_x, cursor_y = player.get_cursor_position()
+        half = player.cursor_size / 2
+        targets = [enemy.enemy_id for enemy in
+                   manager.query_radius(cursor_x + half, cursor_y + half, self.LOCK_RADIUS)[:free]]
+        if len(targets) < free:
+            # カーソル付近だけでは足りない場合はスポーン順に補う
+            targets.extend(enemy.enemy_id for enemy in
+                           islice(manager.iter_active_enemies(), free - len(targets)))
+        player.fire_volley(manager, targets)
+
+    def _refill_bullets(self, player):
+        """弾丸プールを上限まで補充（プレイヤーから画面上端までのランダムな位置）"""
+        pool = player.bullets
+        missing = pool.capacity - pool.count
+        if missing <= 0:
+            return
+        rng = self.rng
+        for _ in range(missing):
+            pool.spawn(rng.uniform(0, SCREEN_WIDTH - BulletPool.WIDTH), rng.uniform(0, player.y))
+
+
+# 名前付きプリセット（HeadlessRunner --scenario で指定）
+SCENARIOS = {
+    "light": dict(enemy_count=200, laser_count=16),
+    "heavy": dict(enemy_count=2000, laser_count=64),
+    "extreme": dict(enemy_count=5000, laser_count=128, bullet_capacity=256),
+}
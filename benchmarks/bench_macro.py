@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Macro benchmarks for ChromeBlaze
+ヘッドレスでGamePlayStateを回すマクロベンチマーク定義
+
+StressScenario でN体のエネミーとM本のホーミングレーザーを維持した状態で
+update + draw（ヌルバックエンド）を指定フレーム数実行し、1フレームあたりのミリ秒を計測する。
+予算シナリオ（BUDGET_SCENARIOS）では当たり判定ステージの所要時間をフレームごとに計測し、
+COLLISION_BUDGET_MS を超えていないか確認する。
+"""
+
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from HeadlessRunner import HeadlessRunner
+from InputSystem import ScriptedInputSource
+from StressScenario import StressScenario
+
+FRAMES = 300
+SEED = 1234
+
+
+def run_scenario(params, frames=FRAMES):
+    """
+    StressScenario(**params) を1回実行して1フレームあたりのミリ秒を返す
+
+    プレイヤーはショットを撃ち続ける（弾丸の更新・当たり判定も負荷に含める）。
+    """
+    scenario = StressScenario(**params)
+    runner = HeadlessRunner(ScriptedInputSource(scenario.input_script),
+                            frames=frames, seed=SEED, scenario=scenario)
+    result = runner.run()
+    return result["seconds"] / frames * 1000.0
+
+
+# 名前 -> StressScenario のパラメータ
+# macro.* はエネミー数・レーザー数のみ固定（倒されたエネミーは補充しない）、
+# stress.* はエネミー補充・レーザー一斉発射・弾丸上限維持をすべて有効にした負荷シナリオ
+MACRO_SCENARIOS = {
+    "macro.enemies_5": dict(enemy_count=5, laser_count=0, bullets_at_cap=False, respawn=False),
+    "macro.enemies_100": dict(enemy_count=100, laser_count=0, bullets_at_cap=False, respawn=False),
+    "macro.enemies_500": dict(enemy_count=500, laser_count=0, bullets_at_cap=False, respawn=False),
+    "macro.enemies_100_lasers_10": dict(enemy_count=100, laser_count=10, bullets_at_cap=False, respawn=False),
+    "macro.enemies_500_lasers_64": dict(enemy_count=500, laser_count=64, bullets_at_cap=False, respawn=False),
+    "stress.enemies_1000": dict(enemy_count=1000, laser_count=64),
+    "stress.enemies_2000": dict(enemy_count=2000, laser_count=64),
+    "stress.enemies_5000": dict(enemy_count=5000, laser_count=128, bullet_capacity=256),
+}
+
+
+# 当たり判定ステージ（CollisionSystem.resolve_bullets）の1フレームあたりの予算（ミリ秒）
+COLLISION_BUDGET_MS = 1.0
+# 予算と比べるパーセンタイル（GCなどによる単発の揺れは除く）
+BUDGET_PERCENTILE = 99
+
+# 名前 -> StressScenario のパラメータ（当たり判定の予算を確認するシナリオ）
+# Z押しっぱなし・パワーレベル1（2発同時）で、エネミーの移動範囲の全セルにエネミーを置いた状態
+BUDGET_SCENARIOS = {
+    "budget.shot_power1_full_screen": dict(density=1.0, laser_count=0, bullets_at_cap=False, power_level=1),
+}
+
+
+def run_collision_budget(params, frames=FRAMES):
+    """
+    StressScenario(**params) を1回実行して当たり判定ステージの所要時間を計測する
+
+    Returns:
+        list: フレームごとの resolve_bullets の所要時間（ミリ秒）
+    """
+    scenario = StressScenario(**params)
+    timings = []
+
+    def on_frame(state, frame):
+        if frame == 0:
+            collision_system = state.collision_system
+            resolve_bullets = collision_system.resolve_bullets
+
+            def timed_resolve_bullets(player, enemy_manager):
+                start = time.perf_counter()
+                hits = resolve_bullets(player, enemy_manager)
+                timings.append((time.perf_counter() - start) * 1000.0)
+                return hits
+
+            collision_system.resolve_bullets = timed_resolve_bullets
+        scenario.on_frame(state, frame)
+
+    runner = HeadlessRunner(ScriptedInputSource(scenario.input_script),
+                            frames=frames, seed=SEED, on_frame=on_frame, scenario=scenario)
+    runner.run()
+    return timings
+
+
+def budget_percentile(timings, percentile=BUDGET_PERCENTILE):
+    """フレームごとの所要時間のパーセンタイル（ミリ秒）"""
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * percentile / 100) - 1)]
+
+
+def check_budget(timings, budget=COLLISION_BUDGET_MS):
+    """予算を超えていればメッセージ、収まっていればNoneを返す"""
+    value = budget_percentile(timings)
+    if value > budget:
+        return (f"collision p{BUDGET_PERCENTILE} {value:.3f} ms/frame exceeds the budget "
+                f"of {budget:.3f} ms (max {max(timings):.3f} ms)")
+    return None
+
+
+if __name__ == "__main__":
+    for name, params in MACRO_SCENARIOS.items():
+        ms = run_scenario(params)
+        print(f"{name:32s} {ms:8.3f} ms/frame")
+
+    over_budget = False
+    for name, params in BUDGET_SCENARIOS.items():
+        timings = run_collision_budget(params)
+        failure = check_budget(timings)
+        print(f"{name:32s} {budget_percentile(timings):8.3f} ms/frame (collision p{BUDGET_PERCENTILE}, "
+              f"budget {COLLISION_BUDGET_MS:.3f})")
+        if failure:
+            print(f"  OVER BUDGET: {failure}")
+            over_budget = True
+    sys.exit(1 if over_budget else 0)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for ChromeBlaze hot paths
+ホットパスのマイクロベンチマーク定義
+
+各ベンチマークは setup 関数で、1回分の処理を行う引数なしの関数を返す。
+計測は run_benchmarks.py が行う（単位: 1回あたりのマイクロ秒）。
+"""
+
+import math
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Common import SCREEN_WIDTH, SCREEN_HEIGHT, SPRITE_SIZE, check_collision
+from Class_HomingLaser import Vector2D, LaserType01
+from SpriteManager import sprite_manager
+from Enemy import EnemyManager
+from HitEffect import HitEffectManager
+from RandomService import RandomService
+
+DELTA_TIME = 1.0 / 60.0
+ENEMY_COUNT = 50
+
+
+# === Vector2D ===
+
+def setup_vector2d_add():
+    a = Vector2D(3.0, 4.0)
+    b = Vector2D(1.5, -2.0)
+    return lambda: a + b
+
+
+def setup_vector2d_normalize_into():
+    a = Vector2D(3.0, 4.0)
+    out = Vector2D()
+    return lambda: a.normalize_into(out)
+
+
+def setup_vector2d_rotate_toward():
+    direction = Vector2D(1.0, 0.0)
+    target = Vector2D(-0.3, 1.0)
+    return lambda: direction.rotate_toward(target, 0.1)
+
+
+# === LaserType01 ===
+
+def setup_laser_update():
+    """遠くの目標へ向かうレーザーを1フレーム進める（消滅したら作り直す）"""
+    state = {"laser": None, "frame": 0}
+
+    def step():
+        laser = state["laser"]
+        if laser is None or not laser.active:
+            laser = state["laser"] = LaserType01(64, 120, 64, -2000, target_enemy_id=0)
+        frame = state["frame"] = state["frame"] + 1
+        laser.update(DELTA_TIME, 64 + 40 * math.sin(frame * 0.05), -2000)
+
+    return step
+
+
+# === SpriteManager ===
+
+def setup_sprite_get_animation_clip():
+    return lambda: sprite_manager.get_animation_clip("ENEMY01")
+
+
+def setup_sprite_get_by_name_and_field():
+    return lambda: sprite_manager.get_sprite_by_name_and_field("PLAYER", "ACT_NAME", "TOP")
+
+
+def setup_sprite_clip_frame_at():
+    clip = sprite_manager.get_animation_clip("ENEMY01")
+    counter = iter(range(1 << 62))
+    return lambda: clip.frame_at(next(counter))
+
+
+# === EnemyManager ===
+
+def _make_enemy_manager(count):
+    """画面内にcount体のエネミーを並べたEnemyManagerを作成（既定の5体は除く）"""
+    rng = RandomService(seed=1234).enemy_ai
+    manager = EnemyManager(SPRITE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, spawn_defaults=False)
+    for i in range(count):
+        x = rng.uniform(0, SCREEN_WIDTH - SPRITE_SIZE)
+        y = rng.uniform(0, SCREEN_HEIGHT // 2)
+        manager.spawn_enemy(x, y)
+    return manager
+
+
+def setup_enemy_manager_update():
+    manager = _make_enemy_manager(ENEMY_COUNT)
+    return lambda: manager.update(DELTA_TIME)
+
+
+def setup_enemy_manager_get_enemy_by_id():
+    manager = _make_enemy_manager(ENEMY_COUNT)
+    enemy_id = ENEMY_COUNT // 2
+    return lambda: manager.get_enemy_by_id(enemy_id)
+
+
+# === HitEffectManager ===
+
+def setup_hit_effects_update():
+    """1フレームに5個追加しながら更新（定常状態で約50個のエフェクト）"""
+    manager = HitEffectManager()
+
+    def step():
+        for i in range(5):
+            manager.add_effect(10 * i, 20)
+        manager.update()
+
+    return step
+
+
+def setup_hit_effects_burst():
+    """10体撃破相当のバースト（火花16 + 破片8）を追加しながら更新（定常状態で数百個）"""
+    manager = HitEffectManager()
+
+    def step():
+        for i in range(10):
+            manager.add_burst(10 * i, 20, 16, "spark")
+            manager.add_burst(10 * i, 20, 8, "debris")
+        manager.update()
+
+    return step
+
+
+# === Common ===
+
+def setup_check_collision():
+    return lambda: check_collision(10, 10, 8, 8, 14, 12, 8, 8)
+
+
+# 名前 -> setup関数
+MICRO_BENCHMARKS = {
+    "vector2d.add": setup_vector2d_add,
+    "vector2d.normalize_into": setup_vector2d_normalize_into,
+    "vector2d.rotate_toward": setup_vector2d_rotate_toward,
+    "laser01.update": setup_laser_update,
+    "sprite.get_animation_clip": setup_sprite_get_animation_clip,
+    "sprite.get_by_name_and_field": setup_sprite_get_by_name_and_field,
+    "sprite.clip_frame_at": setup_sprite_clip_frame_at,
+    f"enemy_manager.update[{ENEMY_COUNT}]": setup_enemy_manager_update,
+    f"enemy_manager.get_enemy_by_id[{ENEMY_COUNT}]": setup_enemy_manager_get_enemy_by_id,
+    "hit_effects.update": setup_hit_effects_update,
+    "hit_effects.burst": setup_hit_effects_burst,
+    "common.check_collision": setup_check_collision,
+}
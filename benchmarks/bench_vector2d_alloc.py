@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Vector2D allocation microbenchmark
+ホーミング1ステップあたりのVector2D生成数と実行時間を比較する
+
+従来の演算子スタイル（毎フレーム新しいVector2Dを生成）と
+インプレース演算スタイル（作業用ベクトルを再利用）を同じ誘導計算で比較し、
+最後に LaserType01.update 1フレームあたりの生成数を測定する。
+
+実行方法（リポジトリのルートで）:
+    python benchmarks/bench_vector2d_alloc.py
+"""
+
+import math
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Class_HomingLaser import Vector2D, LaserType01, angle_difference
+
+STEPS = 10000
+DELTA_TIME = 1.0 / 60.0
+TURN_SPEED = 8.0
+SPEED = 400.0
+
+
+class AllocationCounter:
+    """Vector2D.__init__ の呼び出し回数（＝生成数）を数えるコンテキストマネージャ"""
+
+    def __init__(self):
+        self.count = 0
+        self._original_init = None
+
+    def __enter__(self):
+        self._original_init = Vector2D.__init__
+        original_init = self._original_init
+        counter = self
+
+        def counting_init(vector, x=0.0, y=0.0):
+            counter.count += 1
+            original_init(vector, x, y)
+
+        Vector2D.__init__ = counting_init
+        return self
+
+    def __exit__(self, *exc_info):
+        Vector2D.__init__ = self._original_init
+        return False
+
+
+def operator_style_step(state):
+    """従来方式: 演算子・normalize・from_angle で毎回ベクトルを生成"""
+    position, direction, target = state
+    target = Vector2D(target.x, target.y)
+    to_target = target - position
+    if to_target.magnitude() > 0:
+        target_direction = to_target.normalize()
+        current_angle = direction.angle()
+        angle_diff = angle_difference(current_angle, target_direction.angle())
+        max_turn = TURN_SPEED * DELTA_TIME
+        if abs(angle_diff) > max_turn:
+            angle_diff = math.copysign(max_turn, angle_diff)
+        direction = Vector2D.from_angle(current_angle + angle_diff)
+    position = position + direction * SPEED * DELTA_TIME
+    state[0], state[1], state[2] = position, direction, target
+
+
+def in_place_style_step(state):
+    """新方式: set / sub_into / rotate_toward / iadd_scaled で作業用ベクトルを再利用"""
+    position, direction, target, to_target = state
+    target.set(target.x, target.y)
+    to_target.sub_into(target, position)
+    if to_target.magnitude() > 0:
+        direction.rotate_toward(to_target, TURN_SPEED * DELTA_TIME)
+    position.iadd_scaled(direction, SPEED * DELTA_TIME)
+
+
+def measure(step, make_state):
+    """生成数とステップあたりの実行時間を測定"""
+    state = make_state()
+    with AllocationCounter() as counter:
+        for _ in range(STEPS):
+            step(state)
+    allocations = counter.count
+
+    state = make_state()
+    seconds = timeit.timeit(lambda: step(state), number=STEPS)
+    return allocations / STEPS, seconds / STEPS * 1e6
+
+
+def measure_laser_update():
+    """LaserType01.update 1フレームあたりのVector2D生成数（コンストラクタ分は除く）"""
+    frames = 0
+    allocations = 0
+    while frames < STEPS:
+        laser = LaserType01(64, 120, 64, -2000, target_enemy_id=0)
+        with AllocationCounter() as counter:
+            while laser.active and frames < STEPS:
+                # 目標を毎フレーム動かして旋回計算を発生させる
+                laser.update(DELTA_TIME, 64 + 40 * math.sin(frames * 0.05), -2000)
+                frames += 1
+        allocations += counter.count
+    return allocations / frames
+
+
+def main():
+    print("=== Vector2D allocation microbenchmark ===")
+    print(f"Steps: {STEPS}")
+
+    operator_allocs, operator_us = measure(
+        operator_style_step,
+        lambda: [Vector2D(64, 120), Vector2D(0, -1), Vector2D(10, 10)])
+    in_place_allocs, in_place_us = measure(
+        in_place_style_step,
+        lambda: [Vector2D(64, 120), Vector2D(0, -1), Vector2D(10, 10), Vector2D()])
+
+    print(f"Operator style : {operator_allocs:5.2f} Vector2D/step, {operator_us:6.3f} us/step")
+    print(f"In-place style : {in_place_allocs:5.2f} Vector2D/step, {in_place_us:6.3f} us/step")
+
+    print(f"LaserType01.update: {measure_laser_update():5.3f} Vector2D/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+ChromeBlaze benchmark suite
+ベンチマークスイート（計測・JSON保存・ベースライン比較）
+
+マイクロベンチマーク（bench_micro.py）、マクロシナリオ・当たり判定の予算シナリオ（bench_macro.py）、
+Vector2D生成数（bench_vector2d_alloc.py）をまとめて実行し、
+マシン情報付きのJSONに保存する。run は予算を超えたシナリオがあれば終了コード1を返す。
+compare でベースラインと比較し、
+閾値を超えて遅くなった項目があれば終了コード1を返す。
+ベースラインを省略した場合は、リポジトリに置いた参照結果 benchmarks/baseline.json と比較する
+（計測マシンが異なると差が大きく出るため、同じマシンで取り直した結果との比較を推奨）。
+
+実行方法（リポジトリのルートで）:
+    python benchmarks/run_benchmarks.py run --output benchmarks/results/current.json
+    python benchmarks/run_benchmarks.py run --filter vector2d --quick
+    python benchmarks/run_benchmarks.py compare benchmarks/results/current.json  # benchmarks/baseline.json と比較
+    python benchmarks/run_benchmarks.py compare benchmarks/results/before.json benchmarks/results/current.json --threshold 0.10
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.append(BENCH_DIR)
+sys.path.append(ROOT_DIR)
+
+# sprites.json などはリポジトリのルートからの相対パスで読み込まれる
+os.chdir(ROOT_DIR)
+
+import numpy as np
+import pyxel
+from bench_micro import MICRO_BENCHMARKS
+from bench_macro import (MACRO_SCENARIOS, BUDGET_SCENARIOS, BUDGET_PERCENTILE, COLLISION_BUDGET_MS,
+                         run_scenario, run_collision_budget, budget_percentile, check_budget)
+import bench_vector2d_alloc
+from EventLog import event_log
+
+RESULT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10  # 10%以上遅くなったら回帰とみなす
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")  # リポジトリに置いた参照結果
+
+
+# === 計測 ===
+
+def measure_micro(setup, repeat, min_time):
+    """setupが返す関数の1回あたりの時間（マイクロ秒）を repeat 回計測"""
+    func = setup()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    samples = [seconds / number * 1e6 for seconds in timer.repeat(repeat=repeat, number=number)]
+    return samples, number
+
+
+def measure_macro(params, repeat, frames):
+    """マクロシナリオの1フレームあたりの時間（ミリ秒）を repeat 回計測"""
+    return [run_scenario(params, frames=frames) for _ in range(repeat)]
+
+
+def summarize(samples, unit, lower_is_better=True, **extra):
+    """計測値の統計をまとめる（比較には median を使う）"""
+    result = {
+        "unit": unit,
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "samples": len(samples),
+        "lower_is_better": lower_is_better,
+    }
+    result.update(extra)
+    return result
+
+
+def measure_allocations():
+    """Vector2Dの生成数（1ステップ/1フレームあたり）"""
+    operator_allocs, _ = bench_vector2d_alloc.measure(
+        bench_vector2d_alloc.operator_style_step,
+        lambda: [bench_vector2d_alloc.Vector2D(64, 120), bench_vector2d_alloc.Vector2D(0, -1),
+                 bench_vector2d_alloc.Vector2D(10, 10)])
+    laser_allocs = bench_vector2d_alloc.measure_laser_update()
+    return {
+        "alloc.vector2d_operator_step": summarize([operator_allocs], "allocs/step"),
+        "alloc.laser01_update": summarize([laser_allocs], "allocs/frame"),
+    }
+
+
+# === メタデータ ===
+
+def git_revision():
+    """現在のコミットハッシュ（取得できない場合はNone）"""
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def machine_metadata():
+    """結果の比較に必要なマシン・環境情報"""
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pyxel": getattr(pyxel, "VERSION", None),
+    }
+
+
+# === コマンド ===
+
+def command_run(args):
+    # 構造化イベントログの書き込みは計測をぶらすため、--events 指定時のみ有効にする
+    event_log.configure(enabled=args.events)
+    repeat = 3 if args.quick else args.repeat
+    min_time = 0.05 if args.quick else 0.2
+    frames = 100 if args.quick else 300
+
+    def selected(name):
+        return args.filter is None or args.filter in name
+
+    benchmarks = {}
+    for name, setup in MICRO_BENCHMARKS.items():
+        if not selected(name):
+            continue
+        samples, number = measure_micro(setup, repeat, min_time)
+        benchmarks[name] = summarize(samples, "us/op", number=number)
+        print(f"{name:40s} {benchmarks[name]['median']:10.3f} us/op")
+
+    for name, params in MACRO_SCENARIOS.items():
+        if not selected(name):
+            continue
+        samples = measure_macro(params, repeat, frames)
+        benchmarks[name] = summarize(samples, "ms/frame", frames=frames, scenario=params)
+        print(f"{name:40s} {benchmarks[name]['median']:10.3f} ms/frame")
+
+    over_budget = []
+    for name, params in BUDGET_SCENARIOS.items():
+        if not selected(name):
+            continue
+        runs = [run_collision_budget(params, frames=frames) for _ in range(repeat)]
+        samples = [budget_percentile(timings) for timings in runs]
+        benchmarks[name] = summarize(samples, "ms/frame", frames=frames, scenario=params,
+                                     percentile=BUDGET_PERCENTILE, budget=COLLISION_BUDGET_MS)
+        print(f"{name:40s} {benchmarks[name]['median']:10.3f} ms/frame "
+              f"(collision p{BUDGET_PERCENTILE}, budget {COLLISION_BUDGET_MS:.3f})")
+        # 中央値の回で判定（1回だけ遅いマシン負荷の揺れは除く）
+        failure = check_budget(sorted(runs, key=budget_percentile)[len(runs) // 2])
+        if failure:
+            over_budget.append(f"{name}: {failure}")
+
+    if selected("alloc"):
+        for name, result in measure_allocations().items():
+            benchmarks[name] = result
+            print(f"{name:40s} {result['median']:10.3f} {result['unit']}")
+
+    document = {
+        "version": RESULT_VERSION,
+        "metadata": machine_metadata(),
+        "benchmarks": benchmarks,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        print(f"Results saved to {args.output}")
+    for failure in over_budget:
+        print(f"OVER BUDGET {failure}")
+    return 1 if over_budget else 0
+
+
+def compare_results(baseline, current, threshold):
+    """
+    ベースラインと比較した結果の行を返す
+
+    Returns:
+        list: (名前, ベースライン, 現在, 変化率, 判定) のリスト。判定は "ok" / "REGRESSION" / "improved"
+    """
+    rows = []
+    for name, base in sorted(baseline["benchmarks"].items()):
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            continue
+        base_value = base["median"]
+        cur_value = cur["median"]
+        if base_value == 0:
+            change = 0.0 if cur_value == 0 else float("inf")
+        else:
+            change = cur_value / base_value - 1.0
+        if not base.get("lower_is_better", True):
+            change = -change
+        if change > threshold:
+            verdict = "REGRESSION"
+        elif change < -threshold:
+            verdict = "improved"
+        else:
+            verdict = "ok"
+        rows.append((name, base_value, cur_value, change, verdict))
+    return rows
+
+
+def command_compare(args):
+    # ファイルが1つなら現在の結果として、参照結果 benchmarks/baseline.json と比較
+    if len(args.files) == 1:
+        baseline_path, current_path = DEFAULT_BASELINE, args.files[0]
+    else:
+        baseline_path, current_path = args.files
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(current_path, "r", encoding="utf-8") as f:
+        current = json.load(f)
+
+    base_meta = baseline.get("metadata", {})
+    cur_meta = current.get("metadata", {})
+    print(f"Baseline: {base_meta.get('git_revision')} {base_meta.get('timestamp')} ({base_meta.get('platform')})")
+    print(f"Current : {cur_meta.get('git_revision')} {cur_meta.get('timestamp')} ({cur_meta.get('platform')})")
+    if base_meta.get("platform") != cur_meta.get("platform") or base_meta.get("python") != cur_meta.get("python"):
+        print("Warning: results were recorded on different machines or Python versions")
+
+    rows = compare_results(baseline, current, args.threshold)
+    print(f"{'Benchmark':40s} {'baseline':>12s} {'current':>12s} {'change':>9s}")
+    for name, base_value, cur_value, change, verdict in rows:
+        print(f"{name:40s} {base_value:12.4f} {cur_value:12.4f} {change:+8.1%}  {verdict}")
+
+    regressions = [row for row in rows if row[4] == "REGRESSION"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ChromeBlaze benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run benchmarks and optionally save JSON results")
+    run_parser.add_argument("--output", help="path of the JSON result file")
+    run_parser.add_argument("--filter", help="only run benchmarks whose name contains this string")
+    run_parser.add_argument("--repeat", type=int, default=5, help="number of timed repeats")
+    run_parser.add_argument("--quick", action="store_true", help="fewer repeats and shorter runs")
+    run_parser.add_argument("--events", action="store_true",
+                            help="also write structured gameplay events to debug_log/events/")
+    run_parser.set_defaults(func=command_run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare a result file against a baseline")
+    compare_parser.add_argument("files", nargs="+", metavar="FILE",
+                                help="[baseline] current JSON result files "
+                                     "(baseline defaults to benchmarks/baseline.json)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="relative slowdown treated as a regression (default: 0.10)")
+    compare_parser.set_defaults(func=command_compare)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare" and len(args.files) > 2:
+        compare_parser.error("expected [baseline] current")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -47,12 +47,19 @@
 import pyxel          # Pyxelゲームエンジンをインポート（ゲーム画面や音声を管理）
 import logging        # Pythonの標準ログ機能（コンソールにメッセージを出力）
 import sys            # システム関連の機能（プログラム終了など）
-from Common import GameState, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DISPLAY_SCALE, DEBUG  # ゲームの基本設定
+import argparse       # コマンドライン引数（リプレイの記録・再生）
+import atexit         # 終了時の後処理（リプレイの保存）
+from Common import GameState, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DISPLAY_SCALE, DEBUG, FIXED_DT  # ゲームの基本設定
 from SpriteManager import sprite_manager      # スプライト（キャラクターの画像）を管理
+from EffectAtlas import effect_atlas           # エフェクトのコマを事前描画するアトラス
 from State_StudioLogo import StudioLogoState  # スタジオロゴ画面の処理
 from State_Title import TitleState            # タイトル画面の処理  
 from State_Game import GamePlayState          # 実際のゲーム画面の処理
 from GameLogger import logger                 # ChromeBlaze専用のログシステム
+from FixedTimestep import FixedTimestep       # 固定タイムステップ（実経過時間→シミュレーションステップ数）
+from InputSystem import input_manager, Replay, ReplayInputSource  # 入力（ビットマスク・記録・リプレイ）
+from RandomService import rng_service         # サブシステム別の乱数ストリーム（シードで再現可能）
+from EventLog import event_log                # 構造化イベントログ（JSON Lines）
 
 # Pythonの標準ログ設定（時刻とメッセージレベルを表示）
 # DEBUGフラグでログレベルを制御
@@ -67,8 +74,14 @@ class Game:
     ゲーム全体の状態を管理するクラス
     ゲームには3つの画面があります：ロゴ→タイトル→ゲーム本編
     """
-    def __init__(self):
-        """ゲームの初期化（最初に1回だけ実行される）"""
+    def __init__(self, record_seed=None, replay=None):
+        """
+        ゲームの初期化（最初に1回だけ実行される）
+        
+        Args:
+            record_seed: 指定した場合、最初にゲーム本編に入った時点からこのシードで入力を記録
+            replay: 指定した場合、ロゴ・タイトルを飛ばしてこのリプレイでゲーム本編を再生
+        """
         if DEBUG:
             logging.info("Initializing Game")
         logger.info("Game initialization started")
@@ -81,6 +94,12 @@ class Game:
             self.title_state = TitleState()              # タイトル画面
             self.game_state = GamePlayState()            # ゲーム本編画面
             
+            # リプレイの記録・再生（ゲーム本編の1フレーム目から）
+            self.record_seed = record_seed
+            self.replay = None  # 記録を終えたリプレイ
+            if replay is not None:
+                self.start_replay(replay)
+            
             if DEBUG:
                 logging.info("Game initialization completed")
             logger.info("All game states initialized successfully")
@@ -90,9 +109,9 @@ class Game:
             logger.error(f"Game initialization failed: {e}")
             raise  # エラーを上位に伝える
         
-    def update(self):
+    def update(self, delta_time=FIXED_DT):
         """
-        毎フレーム（1/60秒ごと）呼ばれる更新処理
+        シミュレーション1ステップ分の更新処理（delta_time秒進める）
         現在どの画面にいるかによって処理を切り替える
         """
         try:
@@ -102,35 +121,65 @@ class Game:
                 new_state = self.studio_logo_state.update()
                 # もし画面遷移が発生したら（ロゴ→タイトルなど）
                 if new_state != self.state:
-                    if DEBUG:
-                        logging.info(f"State transition: {self.state.value} -> {new_state.value}")
-                    logger.state_change(f"Game state: {self.state.value} -> {new_state.value}")
-                    self.state = new_state  # 新しい画面に切り替え
+                    self._change_state(new_state)  # 新しい画面に切り替え
                     
             elif self.state == GameState.TITLE:
                 # タイトル画面の処理を実行
                 new_state = self.title_state.update()
                 # 画面遷移チェック（タイトル→ゲーム本編など）
                 if new_state != self.state:
-                    if DEBUG:
-                        logging.info(f"State transition: {self.state.value} -> {new_state.value}")
-                    logger.state_change(f"Game state: {self.state.value} -> {new_state.value}")
-                    self.state = new_state
+                    self._change_state(new_state)
                     
             elif self.state == GameState.GAME:
                 # ゲーム本編の処理を実行
-                new_state = self.game_state.update()
+                new_state = self.game_state.update(delta_time)
                 # 画面遷移チェック（ゲーム→タイトルなど）
                 if new_state != self.state:
-                    if DEBUG:
-                        logging.info(f"State transition: {self.state.value} -> {new_state.value}")
-                    logger.state_change(f"Game state: {self.state.value} -> {new_state.value}")
-                    self.state = new_state
+                    self._change_state(new_state)
                     
         except Exception as e:
             # エラーが発生してもゲームを止めずにログに記録
             logging.error(f"Error in game update: {e}")
     
+    def _change_state(self, new_state):
+        """画面を切り替え、遷移をログと構造化イベントログに記録"""
+        if DEBUG:
+            logging.info(f"State transition: {self.state.value} -> {new_state.value}")
+        logger.state_change(f"Game state: {self.state.value} -> {new_state.value}")
+        event_log.emit("STATE", "game_state", previous=self.state.value, state=new_state.value)
+        if self.record_seed is not None:
+            if new_state == GameState.GAME and self.replay is None and input_manager.recording is None:
+                # 最初にゲーム本編に入った時点で、シードを設定し直した新しい本編から記録を開始
+                self._reset_gameplay(self.record_seed)
+                input_manager.start_recording(self.record_seed)
+            elif self.state == GameState.GAME:
+                # ゲーム本編を抜けたら記録を終了（ロゴ・タイトルの入力はリプレイに含めない）
+                self.stop_recording()
+        self.state = new_state
+    
+    def _reset_gameplay(self, seed):
+        """
+        乱数をシードで初期化し、入力のフレーム番号を0に戻して新しいゲーム本編を生成
+        
+        HeadlessRunnerと同じ「シード設定→GamePlayState生成→フレーム0」の順にそろえることで、
+        ウィンドウで記録したリプレイをヘッドレスで再生しても同じ結果になる。
+        """
+        rng_service.reseed(seed)
+        input_manager.reset()
+        self.game_state = GamePlayState()
+    
+    def start_replay(self, replay):
+        """リプレイの入力でゲーム本編を最初から再生（ロゴ・タイトルは飛ばす）"""
+        input_manager.set_source(ReplayInputSource(replay))
+        self._reset_gameplay(replay.seed)
+        self._change_state(GameState.GAME)
+    
+    def stop_recording(self):
+        """記録中なら記録を終了し、記録したリプレイを返す（記録していなければNone）"""
+        if input_manager.recording is not None:
+            self.replay = input_manager.stop_recording()
+        return self.replay
+    
     def draw(self):
         """
         毎フレーム（1/60秒ごと）呼ばれる描画処理
@@ -163,11 +212,18 @@ class App:
     ChromeBlazeアプリケーション全体を管理するクラス
     Pyxelエンジンの初期化からゲーム開始まで全て担当
     """
-    def __init__(self):
-        """アプリケーションの初期化（プログラム開始時に1回だけ実行）"""
+    def __init__(self, record_path=None, replay_path=None):
+        """
+        アプリケーションの初期化（プログラム開始時に1回だけ実行）
+        
+        Args:
+            record_path: 指定した場合、入力と乱数シードをこのファイルにリプレイとして記録
+            replay_path: 指定した場合、このリプレイファイルの入力で再生
+        """
         if DEBUG:
             logging.info("Starting Chrome Blaze")
         logger.info("=== ChromeBlaze Application Starting ===")
+        self.record_path = record_path
         try:
             # Pyxelゲームエンジンを初期化
             # 画面サイズ、タイトル、フレームレート、表示倍率を設定
@@ -181,6 +237,9 @@ class App:
             if DEBUG:
                 logging.info("Pyxel resources loaded successfully")
             
+            # エフェクトのコマをイメージバンクの予約領域へ描き込む（リソース読み込み後）
+            effect_atlas.build()
+            
             # スプライト管理システムの初期化状況を確認
             try:
                 sprite_count = len(sprite_manager.json_sprites)
@@ -198,8 +257,14 @@ class App:
             except Exception as e:
                 logging.error(f"Sprite manager initialization error: {e}")
             
+            # リプレイの記録・再生の準備（記録・再生ともゲーム本編の1フレーム目から）
+            replay, record_seed = self._setup_replay(record_path, replay_path)
+            
             # ゲーム本体を作成
-            self.game = Game()
+            self.game = Game(record_seed=record_seed, replay=replay)
+            
+            # 固定タイムステップ（描画が遅れてもゲーム速度は一定に保つ）
+            self.timestep = FixedTimestep()
             if DEBUG:
                 logging.info("Game instance created, starting main loop")
             
@@ -228,14 +293,48 @@ class App:
                 logger.info("ESC pressed - Application exit requested")
                 pyxel.quit()  # Pyxelを終了してプログラムも終了
                 
-            # ゲーム本体の更新処理を実行
-            self.game.update()
+            # 実経過時間に応じたステップ数だけゲーム本体を更新
+            # （遅れていれば複数ステップ進めて追いつき、進みすぎていれば0ステップ）
+            steps = self.timestep.advance()
+            for _ in range(steps):
+                input_manager.begin_frame()  # このステップの入力を確定（記録中はリプレイに追加）
+                self.game.update(self.timestep.step)
             
         except Exception as e:
             # 致命的なエラーが発生した場合はゲームを終了
             logging.error(f"Critical error in update loop: {e}")
             pyxel.quit()
 
+    def _setup_replay(self, record_path, replay_path):
+        """
+        リプレイ再生時はリプレイを読み込み、記録時はシードを決める
+        
+        Returns:
+            tuple: (再生するReplayまたはNone, 記録に使うシードまたはNone)
+        """
+        if replay_path:
+            replay = Replay.load(replay_path)
+            logger.info(f"Replaying {replay_path}: {len(replay)} frames, seed={replay.seed}")
+            return replay, None
+        if record_path:
+            seed = rng_service.reseed()
+            atexit.register(self._save_recording)
+            logger.info(f"Recording input to {record_path} from game start (seed={seed})")
+            return None, seed
+        return None, None
+    
+    def _save_recording(self):
+        """記録したリプレイを保存（終了時に自動で呼ばれる）"""
+        game = getattr(self, "game", None)
+        replay = game.stop_recording() if game is not None else None
+        if replay is None:
+            return
+        try:
+            replay.save(self.record_path)
+            logger.info(f"Replay saved: {self.record_path} ({len(replay)} frames)")
+        except OSError as e:
+            logging.error(f"Failed to save replay: {e}")
+    
     def draw(self):
         """
         毎フレーム呼ばれる描画処理（Pyxelから自動で呼び出される）
@@ -258,9 +357,14 @@ def main():
     プログラムのメイン関数
     python main.py で実行されたときに最初に呼ばれる
     """
+    parser = argparse.ArgumentParser(description="Chrome Blaze")
+    parser.add_argument("--record", metavar="FILE", help="record gameplay input and RNG seed to a replay file (from game start)")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recorded replay file (skips logo and title)")
+    args = parser.parse_args()
+    
     try:
         # ChromeBlazeアプリケーションを開始
-        App()
+        App(record_path=args.record, replay_path=args.replay)
         
     except KeyboardInterrupt:
         # Ctrl+C でプログラムが中断された場合